@@ -0,0 +1,44 @@
+// Dependencies / Package_Coupling_Metrics
+// Per-package coupling metrics (R. C. Martin) in one aggregated pass over the package-level
+// DEPENDS_ON relationships created by the java:PackageDependency concept:
+//   afferentCoupling (Ca) = packages that depend on this package
+//   efferentCoupling (Ce) = packages this package depends on
+//   instability  (I) = Ce / (Ca + Ce)
+//   abstractness (A) = abstract types (interfaces + abstract classes) / all types
+//   distance     (D) = |A + I - 1|, distance from the main sequence
+// Each package is visited once and each relationship is counted from both ends (degree-sized
+// COUNT subqueries), so the cost stays linear in the number of package dependencies.
+// Inner/anonymous types (FQN containing '$') are not counted as types.
+// Optional scope: when $scopePackage is provided (non-empty), only packages whose FQN starts with that prefix are reported
+// (their couplings still count packages outside the scope).
+// If $scopePackage is empty or null, no filtering is applied (full project).
+
+MATCH (p:Package)
+WHERE
+  $scopePackage IS NULL OR trim($scopePackage) = "" OR p.fqn STARTS WITH $scopePackage
+
+WITH p,
+     COUNT { (p)<-[:DEPENDS_ON]-(other:Package) WHERE other <> p } AS afferent,
+     COUNT { (p)-[:DEPENDS_ON]->(other:Package) WHERE other <> p } AS efferent,
+     COUNT { (p)-[:CONTAINS]->(t:Type) WHERE NOT t.fqn CONTAINS '$' } AS types,
+     COUNT {
+       (p)-[:CONTAINS]->(t:Type)
+       WHERE NOT t.fqn CONTAINS '$' AND (t:Interface OR t.abstract = true)
+     } AS abstractTypes
+WHERE types > 0
+
+WITH p, afferent, efferent, types, abstractTypes,
+     CASE WHEN afferent + efferent = 0 THEN 0.0
+          ELSE toFloat(efferent) / (afferent + efferent) END AS instability,
+     toFloat(abstractTypes) / types AS abstractness
+
+RETURN
+  p.fqn                                       AS package,
+  types,
+  abstractTypes,
+  afferent                                    AS afferentCoupling,
+  efferent                                    AS efferentCoupling,
+  round(instability, 3)                       AS instability,
+  round(abstractness, 3)                      AS abstractness,
+  round(abs(abstractness + instability - 1), 3) AS distance
+ORDER BY distance DESC, package
@@ -1,17 +1,19 @@
 // Dependencies / Package_Dependencies
-// Aggregates type-level dependencies into package→package edges with counts.
+// Package→package edges with the number of depending types and type-level
+// dependencies, read from the weights precomputed on the package DEPENDS_ON
+// relationships (Enrichment / 03_Package_Dependency_Weights).
 // Optional scope: when $scopePackage is provided (non-empty), only include origins whose package FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
-MATCH (p1:Package)-[:CONTAINS]->(t1:Type)-[:DEPENDS_ON]->(t2:Type)<-[:CONTAINS]-(p2:Package)
+MATCH (p1:Package)-[d:DEPENDS_ON]->(p2:Package)
 WHERE
-  p1 <> p2
+  d.totalDependencies > 0
   AND (
     $scopePackage IS NULL OR trim($scopePackage) = "" OR p1.fqn STARTS WITH $scopePackage
   )
 RETURN
   p1.fqn AS originPackage,
   p2.fqn AS destinationPackage,
-  count(DISTINCT t1) AS typesThatDepend,
-  count(*) AS totalDependencies
+  d.typesThatDepend AS typesThatDepend,
+  d.totalDependencies AS totalDependencies
 ORDER BY totalDependencies DESC
@@ -0,0 +1,13 @@
+// Enrichment / 01_Type_Fan_In_Fan_Out
+// Stores fan-in (incoming DEPENDS_ON from types) and fan-out (outgoing
+// DEPENDS_ON to types) on every Type as t.fanIn / t.fanOut.
+// Read by Fan_In_Fan_Out / Fan_In, Fan_Out and High_Level_Architecture / Excessive_Dependencies.
+
+CALL apoc.periodic.iterate(
+  "MATCH (t:Type) RETURN t",
+  "SET t.fanIn  = COUNT { (t)<-[:DEPENDS_ON]-(:Type) },
+       t.fanOut = COUNT { (t)-[:DEPENDS_ON]->(:Type) }",
+  {batchSize: 10000, parallel: true}
+) YIELD batches, total, failedBatches, errorMessages
+CALL apoc.util.validate(failedBatches > 0, 'Enrichment failed: %s', [apoc.convert.toJson(errorMessages)])
+RETURN 'fanIn, fanOut' AS enrichment, batches, total
@@ -0,0 +1,15 @@
+// Enrichment / 02_Class_Inheritance_Depth
+// Stores the length of the EXTENDS chain from each class up to its root type
+// as c.inheritanceDepth (0 when the class extends nothing that was scanned).
+// Read by High_Level_Architecture / Deepest_Inheritance.
+
+CALL apoc.periodic.iterate(
+  "MATCH (c:Class) RETURN c",
+  "OPTIONAL MATCH h = (c)-[:EXTENDS*]->(root:Type)
+   WHERE NOT EXISTS { (root)-[:EXTENDS]->() }
+   WITH c, max(length(h)) AS depth
+   SET c.inheritanceDepth = coalesce(depth, 0)",
+  {batchSize: 10000, parallel: true}
+) YIELD batches, total, failedBatches, errorMessages
+CALL apoc.util.validate(failedBatches > 0, 'Enrichment failed: %s', [apoc.convert.toJson(errorMessages)])
+RETURN 'inheritanceDepth' AS enrichment, batches, total
@@ -0,0 +1,19 @@
+// Enrichment / 03_Package_Dependency_Weights
+// Aggregates type-level dependencies into the package DEPENDS_ON relationships:
+// d.typesThatDepend (distinct depending types) and d.totalDependencies
+// (type→type edges). Same pattern as jQAssistant's java:PackageDependency, so
+// MERGE only adds the weights. Not parallel: batches share target packages.
+// Read by Dependencies / Package_Dependencies.
+
+CALL apoc.periodic.iterate(
+  "MATCH (p1:Package) RETURN p1",
+  "MATCH (p1)-[:CONTAINS]->(t1:Type)-[:DEPENDS_ON]->(t2:Type)<-[:CONTAINS]-(p2:Package)
+   WHERE p1 <> p2
+   WITH p1, p2, count(DISTINCT t1) AS typesThatDepend, count(*) AS totalDependencies
+   MERGE (p1)-[d:DEPENDS_ON]->(p2)
+   SET d.typesThatDepend = typesThatDepend,
+       d.totalDependencies = totalDependencies",
+  {batchSize: 1000, parallel: false}
+) YIELD batches, total, failedBatches, errorMessages
+CALL apoc.util.validate(failedBatches > 0, 'Enrichment failed: %s', [apoc.convert.toJson(errorMessages)])
+RETURN 'typesThatDepend, totalDependencies' AS enrichment, batches, total
@@ -0,0 +1,36 @@
+// Enrichment / 04_Type_Annotation_Categories
+// Stores the categories of the class-level annotations of each Type as
+// t.annotationCategories (list, empty when none): controller, service,
+// repository, configuration, entity, security.
+
+CALL apoc.periodic.iterate(
+  "MATCH (t:Type) RETURN t",
+  "OPTIONAL MATCH (t)-[:ANNOTATED_BY]->(:Annotation)-[:OF_TYPE]->(at:Type)
+   WITH t, collect(DISTINCT at.fqn) AS annotations, collect(DISTINCT at.name) AS names
+   WITH t, [category IN [
+       CASE WHEN any(a IN annotations WHERE a IN [
+         'org.springframework.stereotype.Controller',
+         'org.springframework.web.bind.annotation.RestController']) THEN 'controller' END,
+       CASE WHEN 'org.springframework.stereotype.Service' IN annotations THEN 'service' END,
+       CASE WHEN 'org.springframework.stereotype.Repository' IN annotations
+              OR any(n IN names WHERE n CONTAINS 'Repository') THEN 'repository' END,
+       CASE WHEN any(a IN annotations WHERE a IN [
+         'org.springframework.context.annotation.Configuration',
+         'org.springframework.boot.context.properties.ConfigurationProperties']) THEN 'configuration' END,
+       CASE WHEN any(a IN annotations WHERE a IN [
+         'javax.persistence.Entity', 'jakarta.persistence.Entity']) THEN 'entity' END,
+       CASE WHEN any(a IN annotations WHERE a IN [
+         'org.springframework.security.config.annotation.web.configuration.EnableWebSecurity',
+         'org.springframework.security.config.annotation.method.configuration.EnableMethodSecurity',
+         'org.springframework.security.config.annotation.method.configuration.EnableGlobalMethodSecurity',
+         'org.springframework.security.access.prepost.PreAuthorize',
+         'org.springframework.security.access.prepost.PostAuthorize',
+         'org.springframework.security.access.annotation.Secured',
+         'javax.annotation.security.RolesAllowed', 'jakarta.annotation.security.RolesAllowed',
+         'javax.annotation.security.PermitAll', 'jakarta.annotation.security.PermitAll']) THEN 'security' END
+     ] WHERE category IS NOT NULL] AS categories
+   SET t.annotationCategories = categories",
+  {batchSize: 10000, parallel: true}
+) YIELD batches, total, failedBatches, errorMessages
+CALL apoc.util.validate(failedBatches > 0, 'Enrichment failed: %s', [apoc.convert.toJson(errorMessages)])
+RETURN 'annotationCategories' AS enrichment, batches, total
@@ -0,0 +1,21 @@
+// Enrichment / 05_Type_Layers
+// Stores layer membership of each Type as t.layers (list: controller, service,
+// repository; a type can match several) and t.layer (first match, or null).
+// A type belongs to a layer by package naming (.controller., .service.,
+// .repository.) or by its Spring stereotype (t.annotationCategories, 04).
+// Read by High_Level_Architecture / Architectural_Layer_Violation.
+
+CALL apoc.periodic.iterate(
+  "MATCH (t:Type) RETURN t",
+  "WITH t, coalesce(t.annotationCategories, []) AS categories
+   WITH t, [layer IN [
+       CASE WHEN t.fqn =~ '(?i).*\\\\.controller\\\\..*' OR 'controller' IN categories THEN 'controller' END,
+       CASE WHEN t.fqn =~ '(?i).*\\\\.service\\\\..*' OR 'service' IN categories THEN 'service' END,
+       CASE WHEN t.fqn =~ '(?i).*\\\\.repository\\\\..*' OR 'repository' IN categories THEN 'repository' END
+     ] WHERE layer IS NOT NULL] AS layers
+   SET t.layers = layers,
+       t.layer = head(layers)",
+  {batchSize: 10000, parallel: true}
+) YIELD batches, total, failedBatches, errorMessages
+CALL apoc.util.validate(failedBatches > 0, 'Enrichment failed: %s', [apoc.convert.toJson(errorMessages)])
+RETURN 'layers, layer' AS enrichment, batches, total
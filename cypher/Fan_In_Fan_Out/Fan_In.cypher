@@ -1,15 +1,15 @@
 // Fan_In_Fan_Out / Fan_In
-// Computes Fan-In per type (number of incoming DEPENDS_ON edges).
+// Fan-In per type (number of incoming DEPENDS_ON edges), read from the
+// precomputed t.fanIn (Enrichment / 01_Type_Fan_In_Fan_Out).
 // Optional scope: when $scopePackage is provided (non-empty), only consider target types whose FQN starts with that prefix.
 // If $scopePackage is empty or null, compute for the whole repository.
 
-MATCH (t:Type)<-[:DEPENDS_ON]-(dependent:Type)
+MATCH (t:Type)
 WHERE
-  ($scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage)
+  t.fanIn > 0
+  AND ($scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage)
   AND NOT t.fqn CONTAINS '$'   // exclude inner classes
 
-WITH t, count(dependent) AS dependents
-SET t.fanIn = dependents
 RETURN
   t.fqn  AS type,
   t.fanIn AS fanIn
@@ -1,11 +1,12 @@
 // High_Level_Architecture / Cyclomatic_Complexity
-// Lists methods whose cyclomatic complexity exceeds a threshold.
+// Lists methods whose cyclomatic complexity exceeds $minComplexity (the category
+// script passes minComplexity=10).
 // Optional scope: when $scopePackage is provided (non-empty), limit to classes whose FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
 MATCH (t:Type)-[:DECLARES]->(m:Method)
 WHERE
-  m.cyclomaticComplexity > 10
+  m.cyclomaticComplexity > toInteger($minComplexity)
   AND (
     $scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage
   )
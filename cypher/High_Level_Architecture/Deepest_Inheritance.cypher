@@ -1,18 +1,18 @@
 // High_Level_Architecture / Deepest_Inheritance
-// Finds inheritance chains ending at a root type (no further EXTENDS)
-// and returns the deepest class hierarchies.
+// Returns the deepest class hierarchies: length of the inheritance chain from
+// each class up to its root type, read from the precomputed c.inheritanceDepth
+// (Enrichment / 02_Class_Inheritance_Depth).
 // Optional scope: when $scopePackage is provided (non-empty),
 // limit to classes whose FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
-MATCH h = (class:Class)-[:EXTENDS*]->(super:Type)
+MATCH (class:Class)
 WHERE
-  NOT EXISTS ( (super)-[:EXTENDS]->() )
-  AND length(h) > 1
+  class.inheritanceDepth > 1
   AND (
     $scopePackage IS NULL OR trim($scopePackage) = "" OR class.fqn STARTS WITH $scopePackage
   )
 RETURN
   class.fqn AS Class,
-  length(h) AS Depth
+  class.inheritanceDepth AS Depth
 ORDER BY Depth DESC
@@ -1,14 +1,15 @@
 // High_Level_Architecture / Excessive_Dependencies
-// Finds classes with an excessive number of outgoing dependencies.
+// Finds classes with more than $minDependencies outgoing dependencies (the category
+// script passes minDependencies=15), read from the precomputed t.fanOut
+// (Enrichment / 01_Type_Fan_In_Fan_Out).
 // Optional scope: when $scopePackage is provided (non-empty), limit to types whose FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
-MATCH (t:Type)-[d:DEPENDS_ON]->()
+MATCH (t:Type)
 WHERE
-  $scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage
-WITH t, count(d) AS dependencies
-WHERE dependencies > 15
+  t.fanOut > toInteger($minDependencies)
+  AND ($scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage)
 RETURN
   t.fqn AS classFqn,
-  dependencies
+  t.fanOut AS dependencies
 ORDER BY dependencies DESC
@@ -1,5 +1,6 @@
 // High_Level_Architecture / God_Classes
-// Flags classes with a large number of declared methods (heuristic threshold).
+// Flags classes with more than $minMethodCount declared methods (heuristic threshold;
+// the category script passes minMethodCount=20).
 // Optional scope: when $scopePackage is provided (non-empty), limit to types whose FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
@@ -7,7 +8,7 @@ MATCH (t:Type)-[:DECLARES]->(m:Method)
 WHERE
   $scopePackage IS NULL OR trim($scopePackage) = "" OR t.fqn STARTS WITH $scopePackage
 WITH t, count(m) AS methodCount
-WHERE methodCount > 20
+WHERE methodCount > toInteger($minMethodCount)
 RETURN
   t.fqn AS fqn_god_class,
   methodCount
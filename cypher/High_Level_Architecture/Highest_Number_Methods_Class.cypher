@@ -1,5 +1,6 @@
 // High_Level_Architecture / Highest_Number_Methods_Class
-// Lists classes with the highest number of declared methods (threshold > 15).
+// Lists classes with the highest number of declared methods (more than $minMethodCount;
+// the category script passes minMethodCount=15).
 // Optional scope: when $scopePackage is provided (non-empty), limit to classes whose FQN starts with that prefix.
 // If $scopePackage is empty or null, no filtering is applied (full project).
 
@@ -7,7 +8,7 @@ MATCH (class:Class)-[:DECLARES]->(method:Method)
 WHERE
   $scopePackage IS NULL OR trim($scopePackage) = "" OR class.fqn STARTS WITH $scopePackage
 WITH class, count(method) AS methodCount
-WHERE methodCount > 15
+WHERE methodCount > toInteger($minMethodCount)
 RETURN
   class.fqn AS Class,
   methodCount
@@ -0,0 +1,7 @@
+// Maintenance / Count_Scanned_Artifacts
+// Number of archive artifacts currently in the graph. The incremental mode of
+// scripts/jqa/jqa-run.sh falls back to a full scan when this is zero (e.g. the
+// database was wiped but the scan manifest is still around).
+
+MATCH (a:Artifact:File)
+RETURN count(a) AS artifacts
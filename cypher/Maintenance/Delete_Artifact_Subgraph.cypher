@@ -0,0 +1,28 @@
+// Maintenance / Delete_Artifact_Subgraph
+// Removes everything jQAssistant scanned from one archive (the artifact node,
+// its files, packages, types, members, parameters, annotations and required
+// types) so the archive can be rescanned on its own. Used by the incremental
+// mode of scripts/jqa/jqa-run.sh. Deletes in batches to keep transactions small.
+//
+// Derived relationships from other artifacts (RESOLVES_TO, DEPENDS_ON) are
+// detached here and recreated when analyze re-applies the concepts.
+//
+// Parameters:
+//   $relativeFileName  - archive path as stored by a directory scan (e.g. "/lib/app.jar")
+//   $absoluteFileName  - archive path as stored by a single-file scan (e.g. "/work/jar-target/lib/app.jar")
+
+CALL apoc.periodic.iterate(
+  "MATCH (a:Artifact:File)
+   WHERE a.fileName IN [$relativeFileName, $absoluteFileName]
+   CALL apoc.path.subgraphNodes(a, {
+     relationshipFilter: 'CONTAINS>|REQUIRES>|DECLARES>|HAS>|ANNOTATED_BY>'
+   }) YIELD node
+   RETURN node",
+  "DETACH DELETE node",
+  {
+    batchSize: 10000,
+    parallel: false,
+    params: {relativeFileName: $relativeFileName, absoluteFileName: $absoluteFileName}
+  }
+) YIELD batches, total, errorMessages
+RETURN $relativeFileName AS artifact, batches, total AS deletedNodes, errorMessages
@@ -0,0 +1,9 @@
+// Maintenance / Enrichment_Status
+// Last scan id next to the scan id and version the graph was last enriched with.
+
+OPTIONAL MATCH (s:E2EScan)
+OPTIONAL MATCH (e:E2EEnrichment)
+RETURN
+  s.id       AS scanId,
+  e.scanId   AS enrichedScanId,
+  e.version  AS enrichmentVersion
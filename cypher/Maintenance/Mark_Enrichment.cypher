@@ -0,0 +1,13 @@
+// Maintenance / Mark_Enrichment
+// Records which scan and enrichment version (hash of cypher/Enrichment/*.cypher)
+// the graph was enriched with (scripts/enrichment/enrich-graph.sh).
+//
+// Parameters:
+//   $scanId   - id of the enriched scan (E2EScan.id), empty if unknown
+//   $version  - enrichment version hash
+
+MERGE (e:E2EEnrichment)
+SET e.scanId = $scanId,
+    e.version = $version,
+    e.enrichedAt = datetime()
+RETURN e.scanId AS scanId, e.version AS enrichmentVersion
@@ -0,0 +1,11 @@
+// Maintenance / Mark_Scan
+// Records the id of the last successful jQAssistant scan (scripts/jqa/jqa-run.sh).
+// The enrichment stage compares it with its own marker to skip up-to-date graphs.
+//
+// Parameters:
+//   $scanId  - unique id of the scan
+
+MERGE (s:E2EScan)
+SET s.id = $scanId,
+    s.finishedAt = datetime()
+RETURN s.id AS scanId
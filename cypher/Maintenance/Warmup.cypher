@@ -0,0 +1,13 @@
+// Maintenance / Warmup
+// Touches the stores the reports read most (DEPENDS_ON, CONTAINS and DECLARES
+// relationships, Type/Package fqn properties and indexes) so the first report
+// queries do not pay for cold page-cache reads. Reading a property forces the
+// node/relationship records and property pages to be loaded; a bare count()
+// could be answered from the counts store alone.
+
+CALL { MATCH ()-[r:DEPENDS_ON]->() RETURN count(r.weight) AS dependsOn }
+CALL { MATCH (a)-[:CONTAINS]->(b) RETURN count(coalesce(b.fqn, b.fileName)) AS contains }
+CALL { MATCH (t:Type)-[:DECLARES]->(m) RETURN count(m.name) AS declares }
+CALL { MATCH (t:Type) WHERE t.fqn STARTS WITH "" RETURN count(t) AS typeFqn }
+CALL { MATCH (p:Package) WHERE p.fqn STARTS WITH "" RETURN count(p) AS packageFqn }
+RETURN dependsOn, contains, declares, typeFqn, packageFqn
@@ -0,0 +1,16 @@
+// Sharding / Artifact_Contained_Types
+// Types each artifact of this shard contains, used to reconcile artifact
+// and type dependencies across shards (scripts/reports/merge_shard_csvs.py).
+// Artifact columns use the same naming as Dependencies / Modules_And_Artifacts.
+
+MATCH (a:Artifact)-[:CONTAINS]->(t:Type)
+WHERE coalesce(a.name, a.fileName, a.fqn) IS NOT NULL
+  AND t.fqn IS NOT NULL
+RETURN DISTINCT
+  coalesce(a.name, a.fileName, a.fqn)                  AS Artifact_Name,
+  coalesce(a.type, head([l IN labels(a) WHERE l <> 'Artifact'])) AS Artifact_Type,
+  a.version                                            AS Artifact_Version,
+  a.group                                              AS Artifact_Group,
+  t.fqn                                                AS fqn,
+  t:Class                                              AS Is_Class
+ORDER BY Artifact_Name, fqn
@@ -0,0 +1,25 @@
+// Sharding / Artifact_Unresolved_Types
+// Types an artifact requires that no artifact of this shard provides
+// (no RESOLVES_TO after java-classpath:Resolve). Matched against the contained
+// types of the other shards to rebuild cross-shard artifact dependencies.
+// Optional scope: same rule as Dependencies / Modules_And_Artifacts
+// (the requiring artifact contains packages under $scopePackage).
+
+MATCH (a:Artifact)-[:REQUIRES]->(t:Type)
+WHERE NOT (t)-[:RESOLVES_TO]->(:Type)
+  AND t.fqn IS NOT NULL
+  AND coalesce(a.name, a.fileName, a.fqn) IS NOT NULL
+  AND (
+    $scopePackage IS NULL OR trim($scopePackage) = ""
+    OR EXISTS {
+      MATCH (a)-[:CONTAINS]->(p:Package)
+      WHERE p.fqn STARTS WITH $scopePackage
+    }
+  )
+RETURN DISTINCT
+  coalesce(a.name, a.fileName, a.fqn)                  AS Artifact_Name,
+  coalesce(a.type, head([l IN labels(a) WHERE l <> 'Artifact'])) AS Artifact_Type,
+  a.version                                            AS Artifact_Version,
+  a.group                                              AS Artifact_Group,
+  t.fqn                                                AS fqn
+ORDER BY Artifact_Name, fqn
@@ -0,0 +1,12 @@
+// Sharding / Package_Dependency_Pairs
+// All package → package dependencies of this shard, without scope, so the
+// merge can recompute the afferent/efferent coupling of
+// Dependencies / Package_Coupling_Metrics over every shard
+// (scripts/reports/merge_shard_csvs.py).
+
+MATCH (p1:Package)-[:DEPENDS_ON]->(p2:Package)
+WHERE p1 <> p2
+RETURN DISTINCT
+  p1.fqn AS originPackage,
+  p2.fqn AS destinationPackage
+ORDER BY originPackage, destinationPackage
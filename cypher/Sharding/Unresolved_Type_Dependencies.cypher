@@ -0,0 +1,20 @@
+// Sharding / Unresolved_Type_Dependencies
+// Type → type dependencies whose target no artifact of this shard provides
+// (required type without RESOLVES_TO after java-classpath:Resolve). Matched
+// against the contained types of the other shards to rebuild the cross-shard
+// edges of Dependencies / Package_Dependencies and Package_Dependencies_Classes
+// (scripts/reports/merge_shard_csvs.py). Not scoped: the merge applies
+// $scopePackage itself, since coupling also counts packages outside the scope.
+
+MATCH (:Artifact)-[:REQUIRES]->(t2:Type)
+WHERE NOT (t2)-[:RESOLVES_TO]->(:Type)
+  AND t2.fqn IS NOT NULL
+WITH DISTINCT t2
+MATCH (p1:Package)-[:CONTAINS]->(t1:Type)-[d:DEPENDS_ON]->(t2)
+RETURN
+  p1.fqn     AS originPackage,
+  t1.fqn     AS Type_1_fqn,
+  t1:Class   AS Type_1_Is_Class,
+  d.weight   AS dependencyWeight,
+  t2.fqn     AS Type_2_fqn
+ORDER BY Type_1_fqn, Type_2_fqn
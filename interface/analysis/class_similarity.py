@@ -0,0 +1,190 @@
+"""Dependency-similarity clustering of classes (service extraction candidates).
+
+Every class is described by a sparse binary feature vector: the types it
+depends on plus the types that depend on it (DEPENDS_ON in both directions,
+from Package_Dependencies_Classes.csv). Pairwise Jaccard or cosine similarity
+is computed with sparse matrix products in row blocks, keeping only the top-k
+neighbours per class, so memory grows with n * k instead of n².
+Clusters are the connected components of the (mutual) top-k similarity graph.
+
+Hub features (types used by a large share of all classes, e.g. shared DTOs or
+utilities) carry little signal and densify the products, so they are dropped
+above --max-feature-share.
+
+Reports written next to the source CSV (reports/csv-reports/Dependencies):
+  - Class_Similarity_Clusters.csv  class, cluster, clusterSize
+  - Class_Similarity_Pairs.csv     class1, class2, similarity
+
+Usage:
+  python interface/analysis/class_similarity.py --csv-dir reports/csv-reports/Dependencies
+"""
+import argparse
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.datasets import load as load_dataset
+
+SOURCE_CSV = "Package_Dependencies_Classes.csv"
+CLUSTERS_CSV = "Class_Similarity_Clusters.csv"
+PAIRS_CSV = "Class_Similarity_Pairs.csv"
+
+
+def build_incidence(sources, targets):
+    """Binary class × feature matrix: [depends on | depended on by].
+
+    Returns (classes, matrix) where matrix has shape (n, 2n).
+    """
+    sources, targets = pd.Series(sources), pd.Series(targets)
+    if isinstance(sources.dtype, pd.CategoricalDtype) and isinstance(targets.dtype, pd.CategoricalDtype):
+        # Categorical FQN columns: factorize the shared categories, not every cell
+        both = union_categoricals([sources.array, targets.array], ignore_order=True)
+        codes, classes = pd.factorize(both)
+        classes = np.asarray(classes, dtype=object)
+    else:
+        codes, classes = pd.factorize(pd.concat([sources, targets], ignore_index=True).astype(str))
+    n = len(classes)
+    src = codes[:len(sources)]
+    dst = codes[len(sources):]
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src + n])
+    data = np.ones(len(rows), dtype=np.float32)
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(n, 2 * n), dtype=np.float32)
+    matrix.data[:] = 1.0  # collapse duplicate edges
+    return pd.Index(classes), matrix
+
+
+def drop_hub_features(matrix, max_share: float):
+    """Remove features shared by more than max_share of all classes."""
+    n = matrix.shape[0]
+    df = np.asarray((matrix > 0).sum(axis=0)).ravel()
+    keep = np.flatnonzero(df <= max(2, max_share * n))
+    return matrix[:, keep].tocsr()
+
+
+def top_k_similarities(matrix, k: int = 10, metric: str = "jaccard", min_similarity: float = 0.3,
+                       block_size: int = 2000):
+    """Top-k most similar classes per class as (rows, cols, values) arrays.
+
+    The product is evaluated block by block (block_size rows at a time) and
+    only pairs sharing at least one feature are ever materialised.
+    """
+    matrix = matrix.tocsr().astype(np.float32)
+    sizes = np.asarray(matrix.sum(axis=1)).ravel()
+    if metric == "cosine":
+        norms = np.sqrt(sizes)
+        norms[norms == 0] = 1.0
+        left = sparse.diags(1.0 / norms) @ matrix
+    elif metric == "jaccard":
+        left = matrix
+    else:
+        raise ValueError(f"Unknown metric: {metric}")
+    right_t = left.T.tocsr()
+
+    out_rows, out_cols, out_vals = [], [], []
+    n = matrix.shape[0]
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        block = (left[start:stop] @ right_t).tocsr()
+
+        for i in range(stop - start):
+            lo, hi = block.indptr[i], block.indptr[i + 1]
+            if lo == hi:
+                continue
+            cols = block.indices[lo:hi]
+            vals = block.data[lo:hi]
+            if metric == "jaccard":
+                vals = vals / (sizes[start + i] + sizes[cols] - vals)
+            mask = (vals >= min_similarity) & (cols != start + i)
+            cols, vals = cols[mask], vals[mask]
+            if len(vals) > k:
+                best = np.argpartition(-vals, k - 1)[:k]
+                cols, vals = cols[best], vals[best]
+            out_rows.append(np.full(len(cols), start + i, dtype=np.int64))
+            out_cols.append(cols.astype(np.int64))
+            out_vals.append(vals.astype(np.float32))
+
+    if not out_rows:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float32)
+    return np.concatenate(out_rows), np.concatenate(out_cols), np.concatenate(out_vals)
+
+
+def cluster_pairs(n: int, rows, cols, mutual: bool = True, min_cluster_size: int = 2):
+    """Connected components of the top-k similarity graph.
+
+    With mutual=True an edge is kept only when both classes are in each
+    other's top-k, which prevents hub-like classes from chaining everything
+    into one giant cluster. Clusters are numbered by decreasing size; classes
+    in clusters smaller than min_cluster_size get cluster id -1.
+
+    Returns (labels, cluster_sizes) aligned with the class index.
+    """
+    graph = sparse.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    graph = graph.multiply(graph.T) if mutual else graph.maximum(graph.T)
+    _, components = connected_components(graph, directed=False)
+
+    sizes = np.bincount(components)
+    order = np.argsort(-sizes, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    clustered = sizes[components] >= min_cluster_size
+    labels = np.where(clustered, rank[components], -1)
+    cluster_sizes = np.where(clustered, sizes[components], 1)
+    return labels, cluster_sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cluster classes by dependency similarity.")
+    parser.add_argument("--csv-dir", required=True, type=Path,
+                        help="Directory with the Dependencies CSV reports (cluster reports are written there too)")
+    parser.add_argument("--metric", choices=["jaccard", "cosine"], default="jaccard")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--min-similarity", type=float, default=0.3)
+    parser.add_argument("--max-feature-share", type=float, default=0.05,
+                        help="Drop features shared by more than this fraction of classes (hubs)")
+    parser.add_argument("--no-mutual", action="store_true", help="Keep one-sided top-k edges when clustering")
+    args = parser.parse_args(argv)
+
+    df = load_dataset(args.csv_dir / SOURCE_CSV, ["Class_1_fqn", "Class_2_fqn"])
+    if df.empty or not {"Class_1_fqn", "Class_2_fqn"} <= set(df.columns):
+        print(f"[info] {SOURCE_CSV} missing or empty; skipping class similarity clustering.")
+        return
+
+    df = df.dropna(subset=["Class_1_fqn", "Class_2_fqn"])
+    classes, matrix = build_incidence(df["Class_1_fqn"], df["Class_2_fqn"])
+    matrix = drop_hub_features(matrix, args.max_feature_share)
+
+    rows, cols, vals = top_k_similarities(matrix, k=args.top_k, metric=args.metric,
+                                          min_similarity=args.min_similarity)
+    labels, cluster_sizes = cluster_pairs(len(classes), rows, cols, mutual=not args.no_mutual)
+
+    clusters = pd.DataFrame({"class": classes, "cluster": labels, "clusterSize": cluster_sizes})
+    clusters.sort_values(["clusterSize", "cluster", "class"], ascending=[False, True, True]) \
+            .to_csv(args.csv_dir / CLUSTERS_CSV, index=False)
+
+    first, second = np.minimum(rows, cols), np.maximum(rows, cols)
+    pairs = pd.DataFrame({"first": first, "second": second, "similarity": np.round(vals, 3)}) \
+              .drop_duplicates(["first", "second"])
+    pairs = pd.DataFrame({"class1": classes[pairs["first"].to_numpy()],
+                          "class2": classes[pairs["second"].to_numpy()],
+                          "similarity": pairs["similarity"].to_numpy()})
+    pairs.sort_values("similarity", ascending=False).to_csv(args.csv_dir / PAIRS_CSV, index=False)
+
+    n_clusters = int(labels.max()) + 1 if len(labels) and labels.max() >= 0 else 0
+    print(f"[info] Class similarity ({args.metric}): {len(classes)} classes, {matrix.shape[1]} features, "
+          f"{n_clusters} clusters → {args.csv_dir / CLUSTERS_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Transitive impact ("blast radius") index for package and type dependencies.
+
+The dependency graph is condensed into strongly connected components (Tarjan),
+which yields a DAG whose component ids are already in reverse topological
+order. Reachability is then stored as one bitset (Python int) per component,
+so "what depends on X" / "what does X depend on" is a bit scan instead of a
+variable-length Cypher traversal.
+
+Artifacts written next to the source CSVs (reports/csv-reports/Dependencies):
+  - Impact_Index_<Level>.csv        node, component, componentSize,
+                                    transitiveDependencies, transitiveDependents
+  - Impact_Index_<Level>_Edges.csv  sourceComponent, targetComponent (condensed DAG)
+
+Usage:
+  python interface/analysis/impact_index.py --csv-dir reports/csv-reports/Dependencies
+"""
+import argparse
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.datasets import load as load_dataset
+
+# level -> (source CSV, origin column, destination column)
+LEVELS = {
+    "Packages": ("Package_Dependencies.csv", "originPackage", "destinationPackage"),
+    "Types": ("Package_Dependencies_Classes.csv", "Class_1_fqn", "Class_2_fqn"),
+}
+
+
+def index_csv_name(level: str) -> str:
+    """File name of the per-node impact index CSV for a level."""
+    return f"Impact_Index_{level}.csv"
+
+
+def edges_csv_name(level: str) -> str:
+    """File name of the condensed component edges CSV for a level."""
+    return f"Impact_Index_{level}_Edges.csv"
+
+
+def strongly_connected_components(num_nodes: int, successors) -> list:
+    """Iterative Tarjan. Returns the component id per node.
+
+    Components are numbered in the order Tarjan completes them, so for every
+    edge between different components the target id is lower than the source id.
+    """
+    index = [-1] * num_nodes
+    low = [0] * num_nodes
+    on_stack = [False] * num_nodes
+    component = [-1] * num_nodes
+    stack = []
+    counter = 0
+    num_components = 0
+
+    for root in range(num_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]
+        while work:
+            v, i = work[-1]
+            succ = successors[v]
+            if i < len(succ):
+                work[-1] = (v, i + 1)
+                w = succ[i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component[w] = num_components
+                    if w == v:
+                        break
+                num_components += 1
+    return component
+
+
+def _closure(num_components: int, successors, ascending: bool) -> list:
+    """Reachable-component bitsets (including the component's own bit)."""
+    closed = [0] * num_components
+    order = range(num_components) if ascending else range(num_components - 1, -1, -1)
+    for c in order:
+        bits = 1 << c
+        for s in successors[c]:
+            bits |= closed[s]
+        closed[c] = bits
+    return closed
+
+
+def _set_bits(bits: int) -> list:
+    """Positions of the set bits of a (possibly very large) int."""
+    s = bin(bits)[:1:-1]  # least significant bit first
+    return [i for i, ch in enumerate(s) if ch == "1"]
+
+
+class ImpactIndex:
+    """Precomputed transitive dependencies/dependents over an SCC-condensed graph."""
+
+    def __init__(self, nodes, component, component_edges):
+        self.nodes = list(nodes)
+        self.component = list(component)
+        self.position = {n: i for i, n in enumerate(self.nodes)}
+        self.num_components = (max(self.component) + 1) if self.component else 0
+
+        self.members = [[] for _ in range(self.num_components)]
+        for i, c in enumerate(self.component):
+            self.members[c].append(i)
+
+        self.successors = [[] for _ in range(self.num_components)]
+        self.predecessors = [[] for _ in range(self.num_components)]
+        for src, dst in component_edges:
+            if dst >= src:
+                raise ValueError(f"Component edge {src} -> {dst} breaks reverse topological numbering")
+            self.successors[src].append(dst)
+            self.predecessors[dst].append(src)
+
+        self._forward = None
+        self._backward = None
+
+    # ------------------------------------------------------------------
+    # Construction / persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, sources, targets) -> "ImpactIndex":
+        """Build the index from parallel sequences of edge endpoints."""
+        position = {}
+        nodes = []
+        pairs = []
+        for a, b in zip(sources, targets):
+            if pd.isna(a) or pd.isna(b):
+                continue
+            a, b = str(a), str(b)
+            for n in (a, b):
+                if n not in position:
+                    position[n] = len(nodes)
+                    nodes.append(n)
+            if a != b:
+                pairs.append((position[a], position[b]))
+
+        adjacency = [[] for _ in nodes]
+        for i, j in set(pairs):
+            adjacency[i].append(j)
+
+        component = strongly_connected_components(len(nodes), adjacency)
+        component_edges = {
+            (component[i], component[j])
+            for i, succ in enumerate(adjacency)
+            for j in succ
+            if component[i] != component[j]
+        }
+        return cls(nodes, component, sorted(component_edges))
+
+    @classmethod
+    def from_dependency_csv(cls, csv_dir: Path, level: str) -> "ImpactIndex":
+        """Build the index from the dependency report CSV of a level."""
+        filename, c_src, c_dst = LEVELS[level]
+        df = load_dataset(Path(csv_dir) / filename, [c_src, c_dst])
+        if df.empty or c_src not in df.columns or c_dst not in df.columns:
+            return cls([], [], [])
+        return cls.from_edges(df[c_src].tolist(), df[c_dst].tolist())
+
+    @classmethod
+    def load(cls, csv_dir: Path, level: str) -> "ImpactIndex":
+        """Load a previously written index artifact; empty index if missing."""
+        nodes_df = load_dataset(Path(csv_dir) / index_csv_name(level), ["node", "component"])
+        if nodes_df.empty:
+            return cls([], [], [])
+        edges_df = load_dataset(Path(csv_dir) / edges_csv_name(level))
+        edges = []
+        if not edges_df.empty:
+            edges = list(zip(edges_df["sourceComponent"].astype(int), edges_df["targetComponent"].astype(int)))
+        return cls(nodes_df["node"].astype(str).tolist(), nodes_df["component"].astype(int).tolist(), edges)
+
+    def save(self, csv_dir: Path, level: str):
+        """Write the per-node summary and the condensed edges next to the source CSVs."""
+        csv_dir = Path(csv_dir)
+        self.summary().to_csv(csv_dir / index_csv_name(level), index=False)
+        edges = [(s, d) for s, succ in enumerate(self.successors) for d in succ]
+        pd.DataFrame(edges, columns=["sourceComponent", "targetComponent"]).to_csv(
+            csv_dir / edges_csv_name(level), index=False)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def forward(self) -> list:
+        if self._forward is None:
+            self._forward = _closure(self.num_components, self.successors, ascending=True)
+        return self._forward
+
+    @property
+    def backward(self) -> list:
+        if self._backward is None:
+            self._backward = _closure(self.num_components, self.predecessors, ascending=False)
+        return self._backward
+
+    def __contains__(self, node) -> bool:
+        return node in self.position
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def _expand(self, node: str, closed: list) -> list:
+        i = self.position[node]
+        c = self.component[i]
+        result = [self.nodes[j] for j in self.members[c] if j != i]
+        for other in _set_bits(closed[c] ^ (1 << c)):
+            result.extend(self.nodes[j] for j in self.members[other])
+        return sorted(result)
+
+    def dependencies(self, node: str) -> list:
+        """All nodes `node` transitively depends on."""
+        return self._expand(node, self.forward)
+
+    def dependents(self, node: str) -> list:
+        """All nodes that transitively depend on `node` (its blast radius)."""
+        return self._expand(node, self.backward)
+
+    def search(self, text: str, limit: int = 50) -> list:
+        """Nodes containing `text` (case-insensitive), shortest first."""
+        t = str(text).lower()
+        hits = [n for n in self.nodes if t in n.lower()]
+        return sorted(hits, key=lambda n: (len(n), n))[:limit]
+
+    def _counts(self, closed: list) -> list:
+        """Transitive node counts per component (excluding the node itself)."""
+        sizes = [len(m) for m in self.members]
+        cyclic_mask = 0
+        for c, size in enumerate(sizes):
+            if size > 1:
+                cyclic_mask |= 1 << c
+
+        counts = []
+        for c in range(self.num_components):
+            strict = closed[c] ^ (1 << c)
+            total = strict.bit_count() + sizes[c] - 1
+            cyclic = strict & cyclic_mask
+            while cyclic:
+                lowest = cyclic & -cyclic
+                total += sizes[lowest.bit_length() - 1] - 1
+                cyclic ^= lowest
+            counts.append(total)
+        return counts
+
+    def summary(self) -> pd.DataFrame:
+        """One row per node with its component and transitive counts."""
+        deps = self._counts(self.forward)
+        dependents = self._counts(self.backward)
+        return pd.DataFrame({
+            "node": self.nodes,
+            "component": self.component,
+            "componentSize": [len(self.members[c]) for c in self.component],
+            "transitiveDependencies": [deps[c] for c in self.component],
+            "transitiveDependents": [dependents[c] for c in self.component],
+        }).sort_values(["transitiveDependents", "node"], ascending=[False, True])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the transitive impact index for packages and types.")
+    parser.add_argument("--csv-dir", required=True, type=Path,
+                        help="Directory with the Dependencies CSV reports (index files are written there too)")
+    parser.add_argument("--levels", nargs="+", choices=sorted(LEVELS), default=sorted(LEVELS))
+    args = parser.parse_args(argv)
+
+    for level in args.levels:
+        index = ImpactIndex.from_dependency_csv(args.csv_dir, level)
+        if not len(index):
+            print(f"[info] No {level.lower()} dependency data; skipping impact index.")
+            continue
+        index.save(args.csv_dir, level)
+        print(f"[info] Impact index ({level}): {len(index)} nodes, "
+              f"{index.num_components} components → {args.csv_dir / index_csv_name(level)}")
+
+
+if __name__ == "__main__":
+    main()
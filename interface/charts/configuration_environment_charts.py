@@ -5,7 +5,9 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import labelize_na, ext_from_name, pick_col
+from utils.memo import memoize
 
+@memoize
 def create_annotation_chart(df_cfg, c_ann):
     counts = labelize_na(df_cfg[c_ann]).value_counts().reset_index()
     counts.columns = ["annotationType", "count"]
@@ -15,8 +17,10 @@ def create_annotation_chart(df_cfg, c_ann):
     fig.update_traces(textposition="outside")
     return fig
 
+@memoize
 def create_extension_chart(df_files, name_col, DEFAULT_BAR_COLOR):
     names = labelize_na(df_files[name_col])
+    df_files = df_files.copy()
     df_files["ext"] = names.map(ext_from_name)
     ext_counts = df_files["ext"].value_counts().reset_index()
     ext_counts.columns = ["extension", "count"]
@@ -26,6 +30,7 @@ def create_extension_chart(df_files, name_col, DEFAULT_BAR_COLOR):
     fig.update_layout(width=820, height=440, xaxis_title="extension", yaxis_title="count")
     return fig
 
+@memoize
 def create_flag_chart(df_flags, c_src):
     counts = labelize_na(df_flags[c_src]).value_counts().reset_index()
     counts.columns = ["source", "count"]
@@ -35,6 +40,7 @@ def create_flag_chart(df_flags, c_src):
     fig.update_traces(textposition="outside")
     return fig
 
+@memoize
 def create_injected_properties_chart(df_inj, c_type, DEFAULT_BAR_COLOR):
     counts = labelize_na(df_inj[c_type]).value_counts().reset_index()
     counts.columns = ["fieldType", "count"]
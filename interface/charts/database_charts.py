@@ -1,40 +1,18 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
-import ast
 from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
-from utils.helpers import labelize_na, find_col
+from utils.helpers import labelize_na, find_col, parse_listlike
+from utils.aggregation import oversized, histogram_figure
+from utils.memo import memoize
 
 MAX_BARS = 25  
 
-def parse_listlike(x):
-    """Return a list from cell x tolerant to JSON/Python lists or common separators."""
-    if x is None or (isinstance(x, float) and np.isnan(x)):
-        return []
-    if isinstance(x, (list, tuple, set)):
-        return [str(i).strip() for i in x if str(i).strip()]
-    s = str(x).strip()
-    if not s or s in {"N/A", "NA", "null", "None"}:
-        return []
-    if (s.startswith("[") and s.endswith("]")) or (s.startswith("(") and s.endswith(")")):
-        try:
-            val = ast.literal_eval(s)
-            if isinstance(val, (list, tuple, set)):
-                return [str(i).strip() for i in val if str(i).strip()]
-        except Exception:
-            pass
-    for sep in [";", ",", "|"]:
-        if sep in s:
-            return [t.strip() for t in s.split(sep) if t.strip()]
-    return [s]
-
-
-
 
+@memoize
 def create_tables_treemap(df: pd.DataFrame, c_entity: str, c_table: str):
     """Create treemap for tables by number of mapped entities."""
     tmp = pd.DataFrame({
@@ -42,7 +20,7 @@ def create_tables_treemap(df: pd.DataFrame, c_entity: str, c_table: str):
         "table": labelize_na(df[c_table]),
         "value": 1
     })
-    agg = tmp.groupby("table")["value"].sum().reset_index(name="entities")
+    agg = tmp.groupby("table", observed=True)["value"].sum().reset_index(name="entities")
 
     fig = px.treemap(agg, path=["table"], values="entities",
                      title="Tables by Number of Mapped Entities (Treemap)")
@@ -50,6 +28,7 @@ def create_tables_treemap(df: pd.DataFrame, c_entity: str, c_table: str):
     return fig
 
 
+@memoize
 def create_tables_bar(df: pd.DataFrame, c_entity: str, c_table: str):
     """Create bar chart for tables by number of mapped entities."""
     tmp = pd.DataFrame({
@@ -57,7 +36,7 @@ def create_tables_bar(df: pd.DataFrame, c_entity: str, c_table: str):
         "table": labelize_na(df[c_table]),
         "value": 1
     })
-    agg = tmp.groupby("table")["value"].sum().reset_index(name="entities")
+    agg = tmp.groupby("table", observed=True)["value"].sum().reset_index(name="entities")
     top_tabs = agg.sort_values("entities", ascending=False).head(MAX_BARS)
 
     fig = px.bar(top_tabs, x="table", y="entities", text="entities",
@@ -71,6 +50,7 @@ def create_tables_bar(df: pd.DataFrame, c_entity: str, c_table: str):
 
 
 
+@memoize
 def create_top_annotations_bar(df: pd.DataFrame, c_entity: str, c_ann: str):
     """Create bar chart for top field annotations."""
     rows = []
@@ -84,7 +64,7 @@ def create_top_annotations_bar(df: pd.DataFrame, c_entity: str, c_ann: str):
     if ann_df.empty:
         return None
 
-    top_ann = (ann_df.groupby("annotation").size()
+    top_ann = (ann_df.groupby("annotation", observed=True).size()
                .reset_index(name="count")
                .sort_values("count", ascending=False)
                .head(MAX_BARS))
@@ -100,6 +80,7 @@ def create_top_annotations_bar(df: pd.DataFrame, c_entity: str, c_ann: str):
 
 
 
+@memoize
 def create_top_relationships_bar(df: pd.DataFrame, c_entity: str, c_rel: str):
     """Create bar chart for top entities by relationships."""
     rel_series = pd.to_numeric(df[c_rel], errors="coerce").fillna(0)
@@ -119,20 +100,25 @@ def create_top_relationships_bar(df: pd.DataFrame, c_entity: str, c_rel: str):
     return fig
 
 
+@memoize
 def create_relationships_histogram(df: pd.DataFrame, c_rel: str):
     """Create histogram for distribution of relationships per entity."""
     rel_series = pd.to_numeric(df[c_rel], errors="coerce").fillna(0)
     df_rel = pd.DataFrame({"Relationships": rel_series.astype(int)})
 
-    fig = px.histogram(df_rel, x="Relationships", nbins=20,
-                       title="Distribution of Relationships per Entity",
-                       color_discrete_sequence=["#636EFA"])
+    if oversized(len(df_rel)):
+        fig = histogram_figure(df_rel["Relationships"], 20, "Distribution of Relationships per Entity", "#636EFA")
+    else:
+        fig = px.histogram(df_rel, x="Relationships", nbins=20,
+                           title="Distribution of Relationships per Entity",
+                           color_discrete_sequence=["#636EFA"])
     fig.update_layout(width=900, height=450, xaxis_title="Relationships", yaxis_title="Count")
     return fig
 
 
 
 
+@memoize
 def create_entity_sankey(df: pd.DataFrame, c_from: str, c_to: str, c_rel: str):
     """Create Sankey diagram for Entity → Entity relationships."""
     e2e = df.dropna(subset=[c_from, c_to])
@@ -140,12 +126,12 @@ def create_entity_sankey(df: pd.DataFrame, c_from: str, c_to: str, c_rel: str):
     if e2e.empty:
         return None
 
-    g = e2e.groupby([c_from, c_to, c_rel]).size().reset_index(name="count")
+    g = e2e.groupby([c_from, c_to, c_rel], observed=True).size().reset_index(name="count")
 
     # Cap nodes by degree to keep legible
     deg = pd.concat([
-        g.groupby(c_from)["count"].sum(),
-        g.groupby(c_to)["count"].sum()
+        g.groupby(c_from, observed=True)["count"].sum(),
+        g.groupby(c_to, observed=True)["count"].sum()
     ], axis=1).fillna(0).sum(axis=1)
 
     keep = set(deg.nlargest(80).index) if not deg.empty else set()
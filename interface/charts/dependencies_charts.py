@@ -6,6 +6,8 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import labelize_na, find_col
+from utils.aggregation import oversized, density_scatter
+from utils.memo import memoize
 
 MAX_BARS = 25  # cap for long bar charts
 
@@ -13,17 +15,24 @@ MAX_BARS = 25  # cap for long bar charts
 # SECTION 1: CIRCULAR DEPENDENCIES
 # ============================================================================
 
-def create_circular_pairs_bar(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str, c_bwd: str):
-    """Create bar chart for top circular package pairs by total dependencies."""
+@memoize
+def top_circular_pairs(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str, c_bwd: str) -> pd.DataFrame:
+    """Top circular package pairs by total dependencies (shared by the bar and the heatmap)."""
     tmp = df[[c_p1, c_p2, c_fwd, c_bwd]].copy()
     tmp.columns = ["package1", "package2", "fwd", "bwd"]
     tmp["fwd"] = pd.to_numeric(tmp["fwd"], errors="coerce").fillna(0)
     tmp["bwd"] = pd.to_numeric(tmp["bwd"], errors="coerce").fillna(0)
     tmp["total"] = tmp["fwd"] + tmp["bwd"]
-    top_pairs = tmp.sort_values("total", ascending=False).head(MAX_BARS)
+    return tmp.sort_values("total", ascending=False).head(MAX_BARS)
+
+
+@memoize
+def create_circular_pairs_bar(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str, c_bwd: str):
+    """Create bar chart for top circular package pairs by total dependencies."""
+    top_pairs = top_circular_pairs(df, c_p1, c_p2, c_fwd, c_bwd)
 
     fig = px.bar(top_pairs,
-                 x=top_pairs["package1"] + " ⇄ " + top_pairs["package2"],
+                 x=top_pairs["package1"].astype(str) + " ⇄ " + top_pairs["package2"].astype(str),
                  y="total", text="total",
                  title="Top circular package pairs by total dependencies",
                  color_discrete_sequence=["#1f77b4"])
@@ -33,14 +42,10 @@ def create_circular_pairs_bar(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str
     return fig
 
 
+@memoize
 def create_circular_heatmap(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str, c_bwd: str):
     """Create heatmap for circular dependencies (top pairs)."""
-    tmp = df[[c_p1, c_p2, c_fwd, c_bwd]].copy()
-    tmp.columns = ["package1", "package2", "fwd", "bwd"]
-    tmp["fwd"] = pd.to_numeric(tmp["fwd"], errors="coerce").fillna(0)
-    tmp["bwd"] = pd.to_numeric(tmp["bwd"], errors="coerce").fillna(0)
-    tmp["total"] = tmp["fwd"] + tmp["bwd"]
-    top_pairs = tmp.sort_values("total", ascending=False).head(MAX_BARS)
+    top_pairs = top_circular_pairs(df, c_p1, c_p2, c_fwd, c_bwd)
 
     fig = px.density_heatmap(top_pairs, x="package1", y="package2", z="total",
                               title="Circular dependencies heatmap (top pairs)")
@@ -52,13 +57,17 @@ def create_circular_heatmap(df: pd.DataFrame, c_p1: str, c_p2: str, c_fwd: str,
 # SECTION 2: EXTERNAL DEPENDENCIES
 # ============================================================================
 
+@memoize
+def external_group_counts(df: pd.DataFrame, c_group: str, c_name: str) -> pd.DataFrame:
+    """Rows per (group, artifact), N/A-labelled (shared by the treemap and the groups bar)."""
+    df_work = pd.DataFrame({"group": labelize_na(df[c_group]), "name": labelize_na(df[c_name])})
+    return df_work.groupby(["group", "name"], observed=True).size().reset_index(name="count")
+
+
+@memoize
 def create_external_treemap(df: pd.DataFrame, c_group: str, c_name: str):
     """Create treemap for external dependencies (group → artifact)."""
-    df_work = df.copy()
-    df_work["group"] = labelize_na(df_work[c_group])
-    df_work["name"] = labelize_na(df_work[c_name])
-    treemap = (df_work.groupby(["group", "name"]).size()
-                      .reset_index(name="count"))
+    treemap = external_group_counts(df, c_group, c_name)
 
     fig = px.treemap(treemap, path=["group", "name"], values="count",
                      title="External dependencies (group → artifact)")
@@ -66,15 +75,12 @@ def create_external_treemap(df: pd.DataFrame, c_group: str, c_name: str):
     return fig
 
 
+@memoize
 def create_top_groups_bar(df: pd.DataFrame, c_group: str, c_name: str):
     """Create bar chart for top groups by number of artifacts used."""
-    df_work = df.copy()
-    df_work["group"] = labelize_na(df_work[c_group])
-    df_work["name"] = labelize_na(df_work[c_name])
-    treemap = (df_work.groupby(["group", "name"]).size()
-                      .reset_index(name="count"))
+    treemap = external_group_counts(df, c_group, c_name)
 
-    by_group = treemap.groupby("group")["count"].sum().reset_index(name="artifacts")
+    by_group = treemap.groupby("group", observed=True)["count"].sum().reset_index(name="artifacts")
     top_groups = by_group.sort_values("artifacts", ascending=False).head(MAX_BARS)
 
     fig = px.bar(top_groups, x="group", y="artifacts", text="artifacts",
@@ -90,11 +96,18 @@ def create_top_groups_bar(df: pd.DataFrame, c_group: str, c_name: str):
 # SECTION 3: LINES OF CODE
 # ============================================================================
 
+@memoize
+def top_classes_by_loc(df: pd.DataFrame, c_cls: str, c_loc: str) -> pd.DataFrame:
+    """The MAX_BARS largest classes with an integer LoC column (shared by the bar and the donut)."""
+    df_work = df[[c_cls]].copy()
+    df_work["LoC"] = pd.to_numeric(df[c_loc], errors="coerce").fillna(0).astype(int)
+    return df_work.sort_values("LoC", ascending=False).head(MAX_BARS)
+
+
+@memoize
 def create_top_loc_bar(df: pd.DataFrame, c_cls: str, c_loc: str):
     """Create bar chart for top classes by lines of code."""
-    df_work = df.copy()
-    df_work["LoC"] = pd.to_numeric(df_work[c_loc], errors="coerce").fillna(0).astype(int)
-    top_loc = df_work.sort_values("LoC", ascending=False).head(MAX_BARS)
+    top_loc = top_classes_by_loc(df, c_cls, c_loc)
 
     fig = px.bar(top_loc, x=c_cls, y="LoC", text="LoC",
                  title="Top classes by lines of code",
@@ -105,11 +118,10 @@ def create_top_loc_bar(df: pd.DataFrame, c_cls: str, c_loc: str):
     return fig
 
 
+@memoize
 def create_loc_share_donut(df: pd.DataFrame, c_cls: str, c_loc: str):
     """Create donut chart for LoC share (Top classes)."""
-    df_work = df.copy()
-    df_work["LoC"] = pd.to_numeric(df_work[c_loc], errors="coerce").fillna(0).astype(int)
-    top_loc = df_work.sort_values("LoC", ascending=False).head(MAX_BARS)
+    top_loc = top_classes_by_loc(df, c_cls, c_loc)
 
     fig = px.pie(top_loc, names=c_cls, values="LoC", hole=0.35,
                  title=f"LoC share — Top {len(top_loc)} classes")
@@ -122,28 +134,37 @@ def create_loc_share_donut(df: pd.DataFrame, c_cls: str, c_loc: str):
 # SECTION 4: MODULES & ARTIFACTS
 # ============================================================================
 
-def create_artifact_degree_scatter(df: pd.DataFrame, c_a1: str, c_a2: str):
-    """Create scatter plot for artifact degree: outgoing vs incoming."""
+@memoize
+def artifact_degrees(df: pd.DataFrame, c_a1: str, c_a2: str) -> pd.DataFrame:
+    """Outgoing, incoming and total dependencies per artifact (shared by the scatter and the bar)."""
     a1 = df[c_a1].astype(str)
     a2 = df[c_a2].astype(str)
     out_deg = a1.value_counts().rename("outgoing").to_frame()
     in_deg = a2.value_counts().rename("incoming").to_frame()
     deg = out_deg.join(in_deg, how="outer").fillna(0).astype(int).reset_index().rename(columns={"index": "artifact"})
     deg["total"] = deg["outgoing"] + deg["incoming"]
+    return deg
 
-    fig = px.scatter(deg, x="outgoing", y="incoming", size="total", hover_name="artifact",
-                     title="Artifact degree: outgoing vs incoming (size = total)")
+
+@memoize
+def create_artifact_degree_scatter(df: pd.DataFrame, c_a1: str, c_a2: str):
+    """Create scatter plot for artifact degree: outgoing vs incoming."""
+    deg = artifact_degrees(df, c_a1, c_a2)
+
+    if oversized(len(deg)):
+        fig = density_scatter(deg, "outgoing", "incoming", "artifact",
+                              title="Artifact degree: outgoing vs incoming (density)")
+    else:
+        fig = px.scatter(deg, x="outgoing", y="incoming", size="total", hover_name="artifact",
+                         title="Artifact degree: outgoing vs incoming (size = total)")
     fig.update_layout(width=900, height=650, xaxis_title="outgoing", yaxis_title="incoming")
     return fig
 
 
+@memoize
 def create_top_outgoing_bar(df: pd.DataFrame, c_a1: str, c_a2: str):
     """Create bar chart for top artifacts by number of outgoing dependencies."""
-    a1 = df[c_a1].astype(str)
-    a2 = df[c_a2].astype(str)
-    out_deg = a1.value_counts().rename("outgoing").to_frame()
-    in_deg = a2.value_counts().rename("incoming").to_frame()
-    deg = out_deg.join(in_deg, how="outer").fillna(0).astype(int).reset_index().rename(columns={"index": "artifact"})
+    deg = artifact_degrees(df, c_a1, c_a2)
 
     top_out = deg.sort_values("outgoing", ascending=False).head(MAX_BARS)
 
@@ -160,6 +181,7 @@ def create_top_outgoing_bar(df: pd.DataFrame, c_a1: str, c_a2: str):
 # SECTION 5: PACKAGE DEPENDENCIES
 # ============================================================================
 
+@memoize
 def create_package_deps_grouped_bar(df: pd.DataFrame, c_org: str, c_dst: str, c_types: str, c_total: str):
     """Create grouped bar chart for top origin packages: total deps vs distinct dependent types."""
     tmp = df[[c_org, c_dst, c_types, c_total]].copy()
@@ -167,7 +189,7 @@ def create_package_deps_grouped_bar(df: pd.DataFrame, c_org: str, c_dst: str, c_
     tmp["types"] = pd.to_numeric(tmp["types"], errors="coerce").fillna(0).astype(int)
     tmp["total"] = pd.to_numeric(tmp["total"], errors="coerce").fillna(0).astype(int)
 
-    agg = tmp.groupby("origin").agg(
+    agg = tmp.groupby("origin", observed=True).agg(
         totalDeps=("total", "sum"),
         distinctTypes=("types", "sum")
     ).reset_index()
@@ -183,6 +205,7 @@ def create_package_deps_grouped_bar(df: pd.DataFrame, c_org: str, c_dst: str, c_
     return fig
 
 
+@memoize
 def create_package_pairs_heatmap(df: pd.DataFrame, c_org: str, c_dst: str, c_total: str):
     """Create heatmap for top origin → destination package pairs by total dependencies."""
     tmp = df[[c_org, c_dst, c_total]].copy()
@@ -201,6 +224,7 @@ def create_package_pairs_heatmap(df: pd.DataFrame, c_org: str, c_dst: str, c_tot
 # SECTION 6: PACKAGE DEPENDENCIES CLASSES
 # ============================================================================
 
+@memoize
 def create_class_pairs_bar(df: pd.DataFrame, c_c1: str, c_w: str, c_c2: str):
     """Create bar chart for top class-to-class dependencies by weight."""
     tmp = df[[c_c1, c_w, c_c2]].copy()
@@ -210,7 +234,7 @@ def create_class_pairs_bar(df: pd.DataFrame, c_c1: str, c_w: str, c_c2: str):
     top_pairs = tmp.sort_values("weight", ascending=False).head(MAX_BARS)
 
     fig = px.bar(top_pairs,
-                 x=top_pairs["class1"] + " → " + top_pairs["class2"],
+                 x=top_pairs["class1"].astype(str) + " → " + top_pairs["class2"].astype(str),
                  y="weight", text="weight",
                  title="Top class-to-class dependencies by weight",
                  color_discrete_sequence=["#1f77b4"])
@@ -220,6 +244,85 @@ def create_class_pairs_bar(df: pd.DataFrame, c_c1: str, c_w: str, c_c2: str):
     return fig
 
 
+# ============================================================================
+# SECTION 7: IMPACT INDEX (BLAST RADIUS)
+# ============================================================================
+
+@memoize
+def create_blast_radius_bar(df: pd.DataFrame, level: str):
+    """Create bar chart for nodes with the most transitive dependents."""
+    top = df.sort_values("transitiveDependents", ascending=False).head(MAX_BARS)
+
+    fig = px.bar(top, x="node", y="transitiveDependents", text="transitiveDependents",
+                 hover_data=["transitiveDependencies", "componentSize"],
+                 title=f"{level} with the largest blast radius (transitive dependents)",
+                 color_discrete_sequence=["#1f77b4"])
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    fig.update_layout(xaxis_tickangle=-35, width=1200, height=550,
+                      xaxis_title=level.lower(), yaxis_title="transitive dependents")
+    return fig
+
+
+# ============================================================================
+# SECTION 8: PACKAGE COUPLING METRICS
+# ============================================================================
+
+@memoize
+def create_main_sequence_scatter(df: pd.DataFrame, c_pkg: str, c_i: str, c_a: str, c_d: str, c_types: str):
+    """Create main-sequence scatter: instability vs abstractness (color = distance, size = types)."""
+    tmp = df[[c_pkg, c_i, c_a, c_d, c_types]].copy()
+    tmp.columns = ["package", "instability", "abstractness", "distance", "types"]
+    for c in ["instability", "abstractness", "distance", "types"]:
+        tmp[c] = pd.to_numeric(tmp[c], errors="coerce").fillna(0)
+
+    fig = px.scatter(tmp, x="instability", y="abstractness", color="distance", size="types",
+                     hover_name="package", color_continuous_scale="RdYlGn_r", range_color=[0, 1],
+                     title="Main sequence: instability vs abstractness (size = types)")
+    fig.add_shape(type="line", x0=0, y0=1, x1=1, y1=0, line=dict(color="grey", dash="dash"))
+    fig.add_annotation(x=0.1, y=0.05, text="zone of pain", showarrow=False, font=dict(color="grey"))
+    fig.add_annotation(x=0.9, y=0.95, text="zone of uselessness", showarrow=False, font=dict(color="grey"))
+    fig.update_layout(width=900, height=750, xaxis_title="instability (I)", yaxis_title="abstractness (A)",
+                      xaxis=dict(range=[-0.05, 1.05]), yaxis=dict(range=[-0.05, 1.05]))
+    return fig
+
+
+# ============================================================================
+# SECTION 9: CLASS SIMILARITY CLUSTERS
+# ============================================================================
+
+@memoize
+def create_cluster_sizes_bar(df: pd.DataFrame, c_cluster: str):
+    """Create bar chart for the largest dependency-similarity clusters."""
+    clustered = df[pd.to_numeric(df[c_cluster], errors="coerce").fillna(-1) >= 0]
+    sizes = clustered[c_cluster].astype(int).value_counts().head(MAX_BARS).reset_index()
+    sizes.columns = ["cluster", "classes"]
+    sizes["cluster"] = "cluster " + sizes["cluster"].astype(str)
+
+    fig = px.bar(sizes, x="cluster", y="classes", text="classes",
+                 title="Largest dependency-similarity clusters",
+                 color_discrete_sequence=["#1f77b4"])
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    fig.update_layout(xaxis_tickangle=-35, width=1100, height=550,
+                      xaxis_title="cluster", yaxis_title="classes")
+    return fig
+
+
+@memoize
+def create_cluster_packages_bar(df: pd.DataFrame, c_cls: str):
+    """Create bar chart for the packages the classes of one cluster belong to."""
+    packages = df[c_cls].astype(str).str.rsplit(".", n=1).str[0]
+    counts = packages.value_counts().head(MAX_BARS).reset_index()
+    counts.columns = ["package", "classes"]
+
+    fig = px.bar(counts, x="package", y="classes", text="classes",
+                 title="Packages of the selected cluster",
+                 color_discrete_sequence=["#1f77b4"])
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    fig.update_layout(xaxis_tickangle=-35, width=1100, height=500,
+                      xaxis_title="package", yaxis_title="classes")
+    return fig
+
+
 # ============================================================================
 # STREAMLIT RENDER FUNCTIONS
 # ============================================================================
@@ -378,3 +481,104 @@ def render_package_dependencies_classes(df: pd.DataFrame):
     fig = create_class_pairs_bar(df, c_c1, c_w, c_c2)
     if fig:
         st.plotly_chart(fig, use_container_width=True)
+
+
+def render_impact_analysis(index, level: str):
+    """Render transitive impact ("blast radius") lookup in Streamlit."""
+    import streamlit as st
+
+    if not len(index):
+        st.info(f"No impact index available for {level.lower()}. Run the Dependencies CSV reports first.")
+        return
+
+    summary = index.summary()
+
+    st.subheader("7A) Largest Blast Radius")
+    fig = create_blast_radius_bar(summary, level)
+    if fig:
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("7B) Impact Lookup")
+    query = st.text_input(f"{level[:-1]} FQN (or part of it)", key=f"impact_query_{level}")
+    if not query:
+        return
+
+    node = query if query in index else None
+    if node is None:
+        matches = index.search(query)
+        if not matches:
+            st.warning(f"No {level.lower()} match `{query}`.")
+            return
+        node = st.selectbox("Matches", matches, key=f"impact_match_{level}")
+
+    dependents = index.dependents(node)
+    dependencies = index.dependencies(node)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Transitive dependents (affected if it changes)", len(dependents))
+        st.dataframe(pd.DataFrame({"dependent": dependents}), use_container_width=True, height=400)
+    with col2:
+        st.metric("Transitive dependencies", len(dependencies))
+        st.dataframe(pd.DataFrame({"dependency": dependencies}), use_container_width=True, height=400)
+
+
+def render_package_coupling_metrics(df: pd.DataFrame):
+    """Render package coupling metrics (main sequence) in Streamlit."""
+    import streamlit as st
+
+    if df.empty:
+        st.info("No data available for Package Coupling Metrics analysis. The CSV file may be missing or empty.")
+        return
+
+    c_pkg = find_col(df, "package", default=None)
+    c_i = find_col(df, "instability", default=None)
+    c_a = find_col(df, "abstractness", default=None)
+    c_d = find_col(df, "distance", default=None)
+    c_types = find_col(df, "types", default=None)
+
+    if not all([c_pkg, c_i, c_a, c_d, c_types]):
+        st.warning("Missing required columns for Package Coupling Metrics analysis.")
+        return
+
+    st.subheader("8A) Main Sequence")
+    fig = create_main_sequence_scatter(df, c_pkg, c_i, c_a, c_d, c_types)
+    if fig:
+        st.plotly_chart(fig, use_container_width=True)
+
+    st.subheader("8B) Packages Farthest from the Main Sequence")
+    st.dataframe(df.sort_values(c_d, ascending=False).head(MAX_BARS), use_container_width=True, hide_index=True)
+
+
+def render_class_similarity_clusters(df: pd.DataFrame):
+    """Render dependency-similarity clusters in Streamlit."""
+    import streamlit as st
+
+    if df.empty:
+        st.info("No data available for Class Similarity Clusters analysis. The CSV file may be missing or empty.")
+        return
+
+    c_cls = find_col(df, "class", default=None)
+    c_cluster = find_col(df, "cluster", default=None)
+
+    if not all([c_cls, c_cluster]):
+        st.warning("Missing required columns for Class Similarity Clusters analysis.")
+        return
+
+    st.subheader("9A) Largest Clusters")
+    fig = create_cluster_sizes_bar(df, c_cluster)
+    if fig:
+        st.plotly_chart(fig, use_container_width=True)
+
+    clusters = sorted(c for c in pd.to_numeric(df[c_cluster], errors="coerce").dropna().astype(int).unique() if c >= 0)
+    if not clusters:
+        st.info("No clusters with more than one class.")
+        return
+
+    st.subheader("9B) Cluster Members")
+    selected = st.selectbox("Cluster", clusters, key="similarity_cluster")
+    members = df[pd.to_numeric(df[c_cluster], errors="coerce") == selected]
+    fig = create_cluster_packages_bar(members, c_cls)
+    if fig:
+        st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(members[[c_cls]], use_container_width=True, hide_index=True, height=400)
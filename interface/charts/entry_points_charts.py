@@ -7,8 +7,10 @@ import sys
 # Add parent directory to path to import helpers
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import fillna_safe, shorten_label
+from utils.memo import memoize
 
 
+@memoize
 def create_visibility_chart(df: pd.DataFrame, c_vis: str):
     """Create visibility distribution chart.
 
@@ -24,6 +26,7 @@ def create_visibility_chart(df: pd.DataFrame, c_vis: str):
     fig.update_layout(width=900, height=420, xaxis_title="visibility", yaxis_title="count")
     return fig
 
+@memoize
 def create_static_chart(df: pd.DataFrame, c_static: str):
     """Create static vs non-static pie chart.
 
@@ -41,6 +44,7 @@ def create_static_chart(df: pd.DataFrame, c_static: str):
     fig.update_traces(textposition="outside")
     return fig
 
+@memoize
 def create_top_classes_chart(df: pd.DataFrame, c_main: str):
     """Create top classes with main() chart.
 
@@ -57,6 +61,7 @@ def create_top_classes_chart(df: pd.DataFrame, c_main: str):
                      xaxis_title="class", yaxis_title="count")
     return fig
 
+@memoize
 def create_signature_chart(df: pd.DataFrame, c_sig: str):
     """Create method signature variants chart.
 
@@ -125,6 +130,7 @@ def render_main_classes_charts(df: pd.DataFrame):
         st.warning("Column 'signature' not found — skipping signature chart.")
 
 
+@memoize
 def create_controller_stereotypes_chart(df: pd.DataFrame, c_pkg: str):
     """Create controller stereotypes pie chart.
 
@@ -142,6 +148,7 @@ def create_controller_stereotypes_chart(df: pd.DataFrame, c_pkg: str):
     fig.update_traces(textposition="outside")
     return fig
 
+@memoize
 def create_top_controllers_chart(df: pd.DataFrame, c_cls: str):
     """Create top controllers bar chart.
 
@@ -192,6 +199,7 @@ def render_spring_controllers_charts(df: pd.DataFrame):
         st.warning("Column 'ControllerClassFqn' not found — skipping top controllers chart.")
 
 
+@memoize
 def create_endpoints_sunburst_chart(df: pd.DataFrame, c_ctrl: str, c_http: str, c_path: str):
     """Create endpoints sunburst chart (Controller → HTTP Method → Path).
 
@@ -208,6 +216,7 @@ def create_endpoints_sunburst_chart(df: pd.DataFrame, c_ctrl: str, c_http: str,
                       uniformtext_minsize=10, uniformtext_mode='hide')
     return fig
 
+@memoize
 def create_http_method_distribution_chart(df: pd.DataFrame, c_http: str):
     """Create HTTP method distribution bar chart.
 
@@ -223,6 +232,7 @@ def create_http_method_distribution_chart(df: pd.DataFrame, c_http: str):
     fig.update_layout(width=900, height=420, xaxis_title="httpMethod", yaxis_title="count")
     return fig
 
+@memoize
 def create_endpoints_per_controller_chart(df: pd.DataFrame, c_ctrl: str, c_path: str):
     """Create endpoints per controller horizontal bar chart.
 
@@ -232,7 +242,7 @@ def create_endpoints_per_controller_chart(df: pd.DataFrame, c_ctrl: str, c_path:
         return None
 
     per_ctrl = (
-        df.groupby(c_ctrl)[c_path]
+        df.groupby(c_ctrl, observed=True)[c_path]
             .nunique()
             .reset_index()
             .sort_values(c_path, ascending=False)
@@ -271,7 +281,8 @@ def render_spring_endpoints_charts(df: pd.DataFrame):
     c_http = cols.get("httpmethod") or cols.get("httprequestmethod") or cols.get("methodtype")
     c_path = cols.get("completeendpoint") or cols.get("path") or cols.get("endpoint")
 
-    # Ensure string types
+    # Ensure string types (on a copy: the caller's frame may be cached)
+    df = df.copy()
     if c_ctrl: df[c_ctrl] = df[c_ctrl].astype(str)
     if c_meth: df[c_meth] = df[c_meth].astype(str)
     if c_http: df[c_http] = df[c_http].astype(str)
@@ -6,16 +6,25 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import labelize_na, find_col
+from utils.memo import memoize
 
 MAX_BARS = 25
 
 
 
-def create_sdk_treemap(df: pd.DataFrame, c_grp: str, c_art: str):
-    """Create treemap for external SDK usage (Group → Artifact)."""
-    usage = df.groupby([c_grp, c_art]).size().reset_index(name="count")
+@memoize
+def sdk_usage(df: pd.DataFrame, c_grp: str, c_art: str) -> pd.DataFrame:
+    """Class references per (group, artifact), N/A-labelled (shared by the SDK charts)."""
+    usage = df.groupby([c_grp, c_art], observed=True).size().reset_index(name="count")
     usage[c_grp] = labelize_na(usage[c_grp])
     usage[c_art] = labelize_na(usage[c_art])
+    return usage
+
+
+@memoize
+def create_sdk_treemap(df: pd.DataFrame, c_grp: str, c_art: str):
+    """Create treemap for external SDK usage (Group → Artifact)."""
+    usage = sdk_usage(df, c_grp, c_art)
 
     fig = px.treemap(usage, path=[c_grp, c_art], values="count",
                      title="External SDK usage (Group → Artifact)")
@@ -23,13 +32,12 @@ def create_sdk_treemap(df: pd.DataFrame, c_grp: str, c_art: str):
     return fig
 
 
+@memoize
 def create_top_artifacts_bar(df: pd.DataFrame, c_grp: str, c_art: str):
     """Create bar chart for top external SDK artifacts by usage."""
-    usage = df.groupby([c_grp, c_art]).size().reset_index(name="count")
-    usage[c_grp] = labelize_na(usage[c_grp])
-    usage[c_art] = labelize_na(usage[c_art])
+    usage = sdk_usage(df, c_grp, c_art)
 
-    top_art = (usage.groupby(c_art)["count"].sum()
+    top_art = (usage.groupby(c_art, observed=True)["count"].sum()
                     .reset_index()
                     .sort_values("count", ascending=False)
                     .head(MAX_BARS))
@@ -43,12 +51,12 @@ def create_top_artifacts_bar(df: pd.DataFrame, c_grp: str, c_art: str):
     return fig
 
 
+@memoize
 def create_groups_bar(df: pd.DataFrame, c_grp: str, c_art: str):
     """Create bar chart for external SDK usage by group."""
-    usage = df.groupby([c_grp, c_art]).size().reset_index(name="count")
-    usage[c_grp] = labelize_na(usage[c_grp])
+    usage = sdk_usage(df, c_grp, c_art)
 
-    by_group = usage.groupby(c_grp)["count"].sum().reset_index(name="usage")
+    by_group = usage.groupby(c_grp, observed=True)["count"].sum().reset_index(name="usage")
     top_groups = by_group.sort_values("usage", ascending=False).head(MAX_BARS)
 
     fig = px.bar(top_groups, x=c_grp, y="usage", text="usage",
@@ -62,6 +70,7 @@ def create_groups_bar(df: pd.DataFrame, c_grp: str, c_art: str):
 
 
 
+@memoize
 def parse_url_components(df: pd.DataFrame, c_ep: str):
     """Helper to parse URLs and extract scheme and host."""
     work = df[[c_ep]].copy()
@@ -81,14 +90,18 @@ def parse_url_components(df: pd.DataFrame, c_ep: str):
     return work
 
 
+@memoize
+def host_counts(df: pd.DataFrame, c_ep: str) -> pd.DataFrame:
+    """Hardcoded URLs per host, most frequent first."""
+    return (parse_url_components(df, c_ep).groupby("host", observed=True).size()
+            .reset_index(name="count")
+            .sort_values("count", ascending=False))
+
+
+@memoize
 def create_top_hosts_bar(df: pd.DataFrame, c_ep: str):
     """Create bar chart for top hardcoded URL hosts."""
-    work = parse_url_components(df, c_ep)
-
-    top_hosts = (work.groupby("host").size()
-                     .reset_index(name="count")
-                     .sort_values("count", ascending=False)
-                     .head(MAX_BARS))
+    top_hosts = host_counts(df, c_ep).head(MAX_BARS)
 
     fig = px.bar(top_hosts, x="host", y="count", text="count",
                  title="Top hardcoded URL hosts",
@@ -99,14 +112,12 @@ def create_top_hosts_bar(df: pd.DataFrame, c_ep: str):
     return fig
 
 
+@memoize
 def create_host_class_treemap(df: pd.DataFrame, c_ep: str, c_cls: str):
     """Create treemap for Host → Declaring Class (limited to top hosts)."""
     work = parse_url_components(df, c_ep)
 
-    top_hosts = (work.groupby("host").size()
-                     .reset_index(name="count")
-                     .sort_values("count", ascending=False)
-                     .head(12))
+    top_hosts = host_counts(df, c_ep).head(12)
     top_host_set = set(top_hosts["host"])
 
     sub = df[df[c_ep].isin(work[work["host"].isin(top_host_set)]["endpoint"])].copy()
@@ -121,11 +132,12 @@ def create_host_class_treemap(df: pd.DataFrame, c_ep: str, c_cls: str):
     return fig
 
 
+@memoize
 def create_scheme_share_donut(df: pd.DataFrame, c_ep: str):
     """Create donut chart for scheme share (http vs https)."""
     work = parse_url_components(df, c_ep)
 
-    scheme_share = work.groupby("scheme").size().reset_index(name="count")
+    scheme_share = work.groupby("scheme", observed=True).size().reset_index(name="count")
 
     fig = px.pie(scheme_share, names="scheme", values="count", hole=0.35,
                  title="Scheme share (http vs https)")
@@ -5,11 +5,14 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import read_csv_safe, find_col
+from utils.aggregation import oversized, density_scatter, histogram_figure
+from utils.memo import memoize
 
 MAX_BARS = 25  # cap for long bar charts
 
 
 
+@memoize
 def load_and_merge_fanin_fanout(df_in: pd.DataFrame, df_out: pd.DataFrame) -> pd.DataFrame:
     """
     Load and merge Fan_In and Fan_Out dataframes.
@@ -33,7 +36,9 @@ def load_and_merge_fanin_fanout(df_in: pd.DataFrame, df_out: pd.DataFrame) -> pd
         b = pd.DataFrame(columns=["type", "fanOut"])
 
     # Merge
-    merged = pd.merge(a, b, on="type", how="outer").fillna(0)
+    # Only the counts: "type" may stay categorical (utils/datasets.py), which rejects a 0
+    merged = pd.merge(a, b, on="type", how="outer")
+    merged[["fanIn", "fanOut"]] = merged[["fanIn", "fanOut"]].fillna(0)
     merged["fanIn"] = pd.to_numeric(merged["fanIn"], errors="coerce").fillna(0).astype(int)
     merged["fanOut"] = pd.to_numeric(merged["fanOut"], errors="coerce").fillna(0).astype(int)
 
@@ -42,6 +47,7 @@ def load_and_merge_fanin_fanout(df_in: pd.DataFrame, df_out: pd.DataFrame) -> pd
 
 
 
+@memoize
 def create_top_fanin_bar(df: pd.DataFrame):
     """Create bar chart for top classes by Fan-In."""
     if df.empty:
@@ -58,6 +64,7 @@ def create_top_fanin_bar(df: pd.DataFrame):
     return fig
 
 
+@memoize
 def create_top_fanout_bar(df: pd.DataFrame):
     """Create bar chart for top classes by Fan-Out."""
     if df.empty:
@@ -74,6 +81,7 @@ def create_top_fanout_bar(df: pd.DataFrame):
     return fig
 
 
+@memoize
 def create_fanin_vs_fanout_scatter(df: pd.DataFrame):
     """Create scatter plot for Fan-In vs Fan-Out."""
     if df.empty:
@@ -82,37 +90,49 @@ def create_fanin_vs_fanout_scatter(df: pd.DataFrame):
     df_work = df.copy()
     df_work["total"] = df_work["fanIn"] + df_work["fanOut"]
 
-    fig = px.scatter(df_work, x="fanOut", y="fanIn", size="total",
-                     hover_name="type",
-                     title="Fan-In vs Fan-Out (size = fanIn + fanOut)")
+    if oversized(len(df_work)):
+        fig = density_scatter(df_work, "fanOut", "fanIn", "type", title="Fan-In vs Fan-Out (density)")
+    else:
+        fig = px.scatter(df_work, x="fanOut", y="fanIn", size="total",
+                         hover_name="type",
+                         title="Fan-In vs Fan-Out (size = fanIn + fanOut)")
     fig.update_layout(width=950, height=700, xaxis_title="fan-out", yaxis_title="fan-in")
     return fig
 
 
+@memoize
 def create_fanin_distribution(df: pd.DataFrame):
     """Create histogram for distribution of Fan-In."""
     if df.empty:
         return None
 
-    fig = px.histogram(df, x="fanIn", nbins=30,
-                       title="Distribution of Fan-In",
-                       color_discrete_sequence=["#636EFA"])
+    if oversized(len(df)):
+        fig = histogram_figure(df["fanIn"], 30, "Distribution of Fan-In", "#636EFA")
+    else:
+        fig = px.histogram(df, x="fanIn", nbins=30,
+                           title="Distribution of Fan-In",
+                           color_discrete_sequence=["#636EFA"])
     fig.update_layout(width=800, height=450, xaxis_title="fan-in", yaxis_title="count")
     return fig
 
 
+@memoize
 def create_fanout_distribution(df: pd.DataFrame):
     """Create histogram for distribution of Fan-Out."""
     if df.empty:
         return None
 
-    fig = px.histogram(df, x="fanOut", nbins=30,
-                       title="Distribution of Fan-Out",
-                       color_discrete_sequence=["#EF553B"])
+    if oversized(len(df)):
+        fig = histogram_figure(df["fanOut"], 30, "Distribution of Fan-Out", "#EF553B")
+    else:
+        fig = px.histogram(df, x="fanOut", nbins=30,
+                           title="Distribution of Fan-Out",
+                           color_discrete_sequence=["#EF553B"])
     fig.update_layout(width=800, height=450, xaxis_title="fan-out", yaxis_title="count")
     return fig
 
 
+@memoize
 def create_ratio_bar(df: pd.DataFrame):
     """Create bar chart for top classes by Fan-In to Fan-Out ratio."""
     if df.empty:
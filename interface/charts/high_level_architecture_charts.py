@@ -5,6 +5,8 @@ from pathlib import Path
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
+from utils.aggregation import oversized, histogram_figure, violin_figure
+from utils.memo import memoize
 
 DEFAULT_BAR_COLOR = ["#1f77b4"]
 
@@ -76,6 +78,7 @@ def build_hierarchy_from_fqns(fqns):
 
 
 
+@memoize
 def create_controllers_violations_chart(df, c_controller):
     """Create donut chart for controllers with most layer violations (Top 15)."""
     if not c_controller:
@@ -89,6 +92,7 @@ def create_controllers_violations_chart(df, c_controller):
     fig.update_layout(height=620, width=950)
     return fig
 
+@memoize
 def create_repositories_bypassed_chart(df, c_repository):
     """Create treemap for repositories most frequently bypassed (Top 25)."""
     if not c_repository:
@@ -102,6 +106,7 @@ def create_repositories_bypassed_chart(df, c_repository):
     fig.update_layout(height=650, width=900)
     return fig
 
+@memoize
 def create_layer_violation_sankey(df, c_controller, c_repository, sample_size=180):
     """Create Sankey diagram for Controller → Repository relationships (sampled)."""
     if not c_controller or not c_repository:
@@ -123,6 +128,7 @@ def create_layer_violation_sankey(df, c_controller, c_repository, sample_size=18
 
 
 
+@memoize
 def create_complexity_violin_chart(df, c_cc):
     """Create violin chart for cyclomatic complexity distribution."""
     if not c_cc:
@@ -132,11 +138,16 @@ def create_complexity_violin_chart(df, c_cc):
     df = df.dropna(subset=[c_cc])
     if df.empty:
         return None
-    fig = px.violin(df, y=c_cc, box=True, points="outliers",
-                    title="Cyclomatic complexity — violin")
+    if oversized(len(df)):
+        fig = violin_figure(df[c_cc], "Cyclomatic complexity — violin")
+        fig.update_layout(yaxis_title=c_cc)
+    else:
+        fig = px.violin(df, y=c_cc, box=True, points="outliers",
+                        title="Cyclomatic complexity — violin")
     fig.update_layout(height=450, width=600)
     return fig
 
+@memoize
 def create_complexity_scatter_chart(df, c_class, c_method, c_cc, top_n=120):
     """Create scatter plot for top methods by cyclomatic complexity."""
     if not all([c_class, c_method, c_cc]):
@@ -154,6 +165,7 @@ def create_complexity_scatter_chart(df, c_class, c_method, c_cc, top_n=120):
 
 
 
+@memoize
 def create_deepest_inheritance_bar(df, c_class, c_depth, top_n=25):
     """Create bar chart for classes with deepest inheritance."""
     if not c_class or not c_depth:
@@ -171,6 +183,7 @@ def create_deepest_inheritance_bar(df, c_class, c_depth, top_n=25):
                       xaxis_title="class", yaxis_title="depth")
     return fig
 
+@memoize
 def create_inheritance_distribution_histogram(df, c_depth):
     """Create improved histogram for inheritance depth distribution with statistics."""
     if not c_depth:
@@ -185,9 +198,12 @@ def create_inheritance_distribution_histogram(df, c_depth):
     p75_val = float(df[c_depth].quantile(0.75))
     p90_val = float(df[c_depth].quantile(0.90))
 
-    fig = px.histogram(df, x=c_depth, nbins=30,
-                       title="Inheritance depth — distribution with statistics",
-                       color_discrete_sequence=["#636EFA"])
+    if oversized(len(df)):
+        fig = histogram_figure(df[c_depth], 30, "Inheritance depth — distribution with statistics", "#636EFA")
+    else:
+        fig = px.histogram(df, x=c_depth, nbins=30,
+                           title="Inheritance depth — distribution with statistics",
+                           color_discrete_sequence=["#636EFA"])
 
     fig.add_vline(x=mean_val, line_dash="dash", line_color="red", line_width=2,
                   annotation_text=f"Mean: {mean_val:.1f}",
@@ -215,6 +231,7 @@ def create_inheritance_distribution_histogram(df, c_depth):
 
 
 
+@memoize
 def create_excessive_dependencies_treemap(df, c_fqn, c_dep, top_n=50):
     """Create treemap for classes with excessive dependencies."""
     if not c_fqn or not c_dep:
@@ -231,6 +248,7 @@ def create_excessive_dependencies_treemap(df, c_fqn, c_dep, top_n=50):
 
 
 
+@memoize
 def create_general_count_donut(df, c_info, c_count):
     """Create donut chart for general counts proportions."""
     if not c_info or not c_count:
@@ -246,6 +264,7 @@ def create_general_count_donut(df, c_info, c_count):
 
 
 
+@memoize
 def create_god_classes_treemap(df, c_fqn, c_cnt, top_n=50):
     """Create treemap for God classes by method count."""
     if not c_fqn or not c_cnt:
@@ -260,6 +279,7 @@ def create_god_classes_treemap(df, c_fqn, c_cnt, top_n=50):
     fig.update_layout(height=650, width=900)
     return fig
 
+@memoize
 def create_god_classes_histogram(df, c_cnt):
     """Create improved histogram for methods per class distribution (God classes)."""
     if not c_cnt:
@@ -274,9 +294,12 @@ def create_god_classes_histogram(df, c_cnt):
     p75_val = float(df[c_cnt].quantile(0.75))
     p90_val = float(df[c_cnt].quantile(0.90))
 
-    fig = px.histogram(df, x=c_cnt, nbins=40,
-                       title="Methods per class — distribution (God classes)",
-                       color_discrete_sequence=["#EF553B"])
+    if oversized(len(df)):
+        fig = histogram_figure(df[c_cnt], 40, "Methods per class — distribution (God classes)", "#EF553B")
+    else:
+        fig = px.histogram(df, x=c_cnt, nbins=40,
+                           title="Methods per class — distribution (God classes)",
+                           color_discrete_sequence=["#EF553B"])
 
     fig.add_vline(x=mean_val, line_dash="dash", line_color="blue", line_width=2,
                   annotation_text=f"Mean: {mean_val:.1f}",
@@ -304,6 +327,7 @@ def create_god_classes_histogram(df, c_cnt):
 
 
 
+@memoize
 def create_methods_polar_chart(df, c_class, c_cnt, top_n=25):
     """Create polar bar chart for top classes by number of methods."""
     if not c_class or not c_cnt:
@@ -318,6 +342,7 @@ def create_methods_polar_chart(df, c_class, c_cnt, top_n=25):
     fig.update_layout(height=750, width=900)
     return fig
 
+@memoize
 def create_methods_violin_chart(df, c_cnt):
     """Create violin chart for methods per class distribution."""
     if not c_cnt:
@@ -326,13 +351,18 @@ def create_methods_violin_chart(df, c_cnt):
     df[c_cnt] = pd.to_numeric(df[c_cnt], errors="coerce").fillna(0)
     if df.empty:
         return None
-    fig = px.violin(df, y=c_cnt, box=True, points=False,
-                    title="Methods per class — violin")
+    if oversized(len(df)):
+        fig = violin_figure(df[c_cnt], "Methods per class — violin", show_outliers=False)
+        fig.update_layout(yaxis_title=c_cnt)
+    else:
+        fig = px.violin(df, y=c_cnt, box=True, points=False,
+                        title="Methods per class — violin")
     fig.update_layout(height=450, width=600)
     return fig
 
 
 
+@memoize
 def create_inheritance_sankey(df, c_c1, c_c2, sample_size=50):
     if not c_c1 or not c_c2:
         return None
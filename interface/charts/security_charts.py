@@ -5,12 +5,14 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils.helpers import find_col
+from utils.memo import memoize
 
 MAX_ROWS_PREVIEW = 5
 MAX_BARS = 30
 
 
 
+@memoize
 def create_deprecated_adapter_donut(df: pd.DataFrame, c_depr: str):
     """Create donut chart for deprecated adapter usage."""
     donut = df[c_depr].value_counts().rename_axis("usesDeprecatedAdapter").reset_index(name="count")
@@ -22,10 +24,11 @@ def create_deprecated_adapter_donut(df: pd.DataFrame, c_depr: str):
     return fig
 
 
+@memoize
 def create_parent_class_sunburst(df: pd.DataFrame, c_ext: str, c_cls: str, c_cfgc: str):
     """Create sunburst for parent class → config class (size = config method count)."""
     sb = df.copy()
-    sb[c_ext] = sb[c_ext].fillna("").replace({"": "(no parent)"})
+    sb[c_ext] = sb[c_ext].astype(object).fillna("").replace({"": "(no parent)"})
 
     fig = px.sunburst(sb, path=[c_ext, c_cls], values=c_cfgc,
                       title="Security configs by parent class (size = config method count)")
@@ -33,6 +36,7 @@ def create_parent_class_sunburst(df: pd.DataFrame, c_ext: str, c_cls: str, c_cfg
     return fig
 
 
+@memoize
 def create_annotation_density_treemap(df: pd.DataFrame, c_cls: str, c_annc: str):
     """Create treemap for annotation density per config class."""
     fig = px.treemap(df.sort_values(c_annc, ascending=False).head(60),
@@ -42,6 +46,7 @@ def create_annotation_density_treemap(df: pd.DataFrame, c_cls: str, c_annc: str)
     return fig
 
 
+@memoize
 def create_config_methods_pie(df: pd.DataFrame, c_cls: str, c_cfgs: str):
     """Create optional pie chart for configuration methods used."""
     if c_cfgs not in df.columns:
@@ -65,6 +70,7 @@ def create_config_methods_pie(df: pd.DataFrame, c_cls: str, c_cfgs: str):
 
 
 
+@memoize
 def create_annotations_popularity_donut(df: pd.DataFrame, c_ann: str):
     """Create donut chart for security annotations popularity."""
     by_ann = df[c_ann].value_counts().rename_axis("annotation").reset_index(name="count")
@@ -75,9 +81,10 @@ def create_annotations_popularity_donut(df: pd.DataFrame, c_ann: str):
     return fig
 
 
+@memoize
 def create_class_annotation_sunburst(df: pd.DataFrame, c_decl: str, c_ann: str):
     """Create sunburst for class → annotation breakdown."""
-    sb = df.groupby([c_decl, c_ann]).size().reset_index(name="count")
+    sb = df.groupby([c_decl, c_ann], observed=True).size().reset_index(name="count")
 
     fig = px.sunburst(sb, path=[c_decl, c_ann], values="count",
                       title="Annotated methods by class and annotation")
@@ -85,6 +92,7 @@ def create_class_annotation_sunburst(df: pd.DataFrame, c_decl: str, c_ann: str):
     return fig
 
 
+@memoize
 def create_top_classes_treemap(df: pd.DataFrame, c_decl: str):
     """Create treemap for top classes by number of security-annotated methods."""
     by_class = df[c_decl].value_counts().rename_axis("class").reset_index(name="count")
@@ -96,6 +104,7 @@ def create_top_classes_treemap(df: pd.DataFrame, c_decl: str):
 
 
 
+@memoize
 def create_http_method_donut(df: pd.DataFrame, c_http: str):
     """Create donut chart for potentially unsecured endpoints by HTTP method."""
     by_http = df[c_http].value_counts().rename_axis("httpMethod").reset_index(name="count")
@@ -106,9 +115,10 @@ def create_http_method_donut(df: pd.DataFrame, c_http: str):
     return fig
 
 
+@memoize
 def create_controller_method_sunburst(df: pd.DataFrame, c_ctrl: str, c_http: str):
     """Create sunburst for controller → HTTP method."""
-    sun = df.groupby([c_ctrl, c_http]).size().reset_index(name="count")
+    sun = df.groupby([c_ctrl, c_http], observed=True).size().reset_index(name="count")
 
     fig = px.sunburst(sun, path=[c_ctrl, c_http], values="count",
                       title="Potentially unsecured endpoints by controller and method")
@@ -116,6 +126,7 @@ def create_controller_method_sunburst(df: pd.DataFrame, c_ctrl: str, c_http: str
     return fig
 
 
+@memoize
 def create_controllers_treemap(df: pd.DataFrame, c_ctrl: str):
     """Create treemap for controllers with most potentially unsecured endpoints."""
     by_ctrl = df[c_ctrl].value_counts().rename_axis("controller").reset_index(name="count")
@@ -149,6 +160,7 @@ def render_security_configurations(df: pd.DataFrame):
         return
 
     # Ensure numeric/bool types
+    df = df.copy()
     df[c_annc] = pd.to_numeric(df[c_annc], errors="coerce").fillna(0)
     df[c_cfgc] = pd.to_numeric(df[c_cfgc], errors="coerce").fillna(0)
     if df[c_depr].dtype != bool:
@@ -273,7 +285,7 @@ def render_unsecured_endpoints(df: pd.DataFrame):
 
     st.subheader("3E) Unsecured Endpoints Breakdown by HTTP Method")
 
-    method_breakdown = detailed_endpoints.groupby('HTTP Method').size().reset_index(name='Count')
+    method_breakdown = detailed_endpoints.groupby('HTTP Method', observed=True).size().reset_index(name='Count')
     method_breakdown = method_breakdown.sort_values('Count', ascending=False)
     st.dataframe(
         method_breakdown,
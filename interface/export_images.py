@@ -0,0 +1,168 @@
+"""Batch export of every report chart to PNG/SVG (kaleido), in parallel.
+
+The figures are the ones the dashboard and the static site show: each
+section of sections.py is rendered through the chart modules' render_*
+functions (static_site.py's Streamlit stand-in), collecting the figures
+instead of drawing them. Images are written to
+<out>/<Section>/<NN>_<chart>.<format>, numbered in display order.
+
+Rendering is spread over a process pool (one kaleido browser per worker).
+Each image's key is a hash of the figure JSON and the export options,
+kept in <out>/.image-cache.json; an image whose key is unchanged and whose
+file still exists is not rendered again (--force renders everything).
+
+Usage:
+  python interface/export_images.py [--csv-dir reports/csv-reports] [--out-dir reports/images]
+                                    [--format png --format svg] [--scale 2] [--jobs N] [--section Security]
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import sys
+import time
+import traceback
+
+sys.path.append(str(Path(__file__).parent))
+import sections
+import static_site
+
+CACHE_FILE = ".image-cache.json"
+FORMATS = ("png", "svg", "pdf", "jpeg", "webp")
+
+
+def default_out_dir() -> Path:
+    return Path(os.environ.get("REPORTS_DIRECTORY") or os.environ.get("REPORTS_DIR")
+                or static_site.REPO_ROOT / "reports") / "images"
+
+
+def slug(text: str, limit: int = 60) -> str:
+    text = re.sub(r"<[^>]+>", " ", text)  # titles may carry <br><sup> notes
+    return re.sub(r"[^\w]+", "_", text).strip("_")[:limit].rstrip("_").lower() or "chart"
+
+
+class FigureCollector(static_site.StaticPage):
+    """Stand-in page that keeps the figures (as plotly JSON) instead of HTML."""
+
+    def __init__(self):
+        super().__init__(max_points=0)
+        self.figures = []
+
+    def figure(self, fig) -> str:
+        title = fig.layout.title.text or ""
+        self.figures.append((self.heading or title, fig.to_json()))
+        return ""
+
+
+def collect_section(key: str, csv_dir: Path) -> dict:
+    """Figures of one section as [(name, figure JSON)] (runs in a worker process)."""
+    sec = sections.get_section(key)
+    page = FigureCollector()
+    sys.modules["streamlit"] = page
+    errors = []
+    frames = {}
+    for _, rep in sections.reports(sec):
+        try:
+            static_site.render_report(page, sec, rep, csv_dir, frames)
+        except Exception as e:
+            errors.append(f"{rep['title']}: {type(e).__name__}: {e}")
+            page.stack[1:] = []
+            traceback.print_exc()
+    figures = [(f"{i:02d}_{slug(name)}", spec) for i, (name, spec) in enumerate(page.figures, 1)]
+    return {"section": key, "figures": figures, "errors": errors}
+
+
+def image_key(spec: str, fmt: str, scale: float) -> str:
+    import plotly
+
+    h = hashlib.sha256(spec.encode("utf-8"))
+    h.update(f"|{fmt}|{scale}|plotly={plotly.__version__}".encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def render_image(spec: str, target: str, fmt: str, scale: float) -> str:
+    """Write one image with kaleido (runs in a worker process)."""
+    import plotly.io as pio
+
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    data = pio.from_json(spec).to_image(format=fmt, scale=scale)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+    return str(target)
+
+
+def load_cache(out_dir: Path) -> dict:
+    try:
+        return json.loads((out_dir / CACHE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(out_dir: Path, cache: dict):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / f"{CACHE_FILE}.tmp"
+    tmp.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, out_dir / CACHE_FILE)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every report chart as PNG/SVG images.")
+    parser.add_argument("--csv-dir", type=Path, default=static_site.default_csv_dir())
+    parser.add_argument("--out-dir", type=Path, default=default_out_dir())
+    parser.add_argument("--format", action="append", choices=FORMATS, help="Repeatable (default: png and svg)")
+    parser.add_argument("--scale", type=float, default=2.0, help="Pixel density of raster formats")
+    parser.add_argument("--jobs", type=int, default=int(os.environ.get("E2E_IMAGE_JOBS", "0")) or os.cpu_count())
+    parser.add_argument("--section", action="append", help="Only these sections (repeatable)")
+    parser.add_argument("--force", action="store_true", help="Render all images, ignoring the cache")
+    args = parser.parse_args(argv)
+    formats = args.format or ["png", "svg"]
+    keys = [s["key"] for s in sections.SECTIONS
+            if (not args.section or s["key"] in args.section) and s["tabs"]]
+
+    t0 = time.monotonic()
+    cache = {} if args.force else load_cache(args.out_dir)
+    rendered = reused = failed = 0
+    with ProcessPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+        # 1) figures of every section
+        collected = [f.result() for f in [executor.submit(collect_section, k, args.csv_dir) for k in keys]]
+
+        # 2) images whose figure or options changed
+        pending = {}
+        for result in collected:
+            for error in result["errors"]:
+                print(f"[warn] {result['section']}: {error}")
+            for name, spec in result["figures"]:
+                for fmt in formats:
+                    rel = f"{result['section']}/{name}.{fmt}"
+                    key = image_key(spec, fmt, args.scale)
+                    if cache.get(rel) == key and (args.out_dir / rel).is_file():
+                        reused += 1
+                        continue
+                    future = executor.submit(render_image, spec, str(args.out_dir / rel), fmt, args.scale)
+                    pending[future] = (rel, key)
+
+        for future in as_completed(pending):
+            rel, key = pending[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                cache.pop(rel, None)
+                print(f"[error] {rel}: {type(e).__name__}: {e}")
+                continue
+            rendered += 1
+            cache[rel] = key
+
+    save_cache(args.out_dir, cache)
+    print(f"[done] {rendered} rendered, {reused} unchanged, {failed} failed in "
+          f"{time.monotonic() - t0:.1f}s → {args.out_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
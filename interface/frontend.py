@@ -1,606 +1,221 @@
 import streamlit as st
-import plotly.express as px
 import pandas as pd
 from pathlib import Path
+import os
 import sys
+import time
 
 sys.path.append(str(Path(__file__).parent))
-from utils.helpers import read_csv_safe, get_csv_path
-from charts.entry_points_charts import (
-    render_main_classes_charts,
-    render_spring_controllers_charts,
-    render_spring_endpoints_charts
-)
-from charts.configuration_environment_charts import (
-    render_annotation_chart,
-    render_feature_flag_chart,
-    render_injected_properties_chart,
-    render_extension_chart
-)
-from charts.high_level_architecture_charts import (
-    render_layer_violations,
-    render_cyclomatic_complexity,
-    render_deepest_inheritance,
-    render_excessive_dependencies,
-    render_general_count_overview,
-    render_god_classes,
-    render_highest_methods,
-    render_inheritance_between_classes,
-    render_package_structure
-)
-from charts.dependencies_charts import (
-    render_circular_dependencies,
-    render_external_dependencies,
-    render_lines_of_code,
-    render_modules_and_artifacts,
-    render_package_dependencies,
-    render_package_dependencies_classes
-)
-from charts.database_charts import (
-    render_jpa_entities,
-    render_entity_fields,
-    render_db_schema,
-    render_entity_relationships
-)
-from charts.fan_in_fan_out_charts import (
-    render_fan_in_fan_out
-)
-from charts.security_charts import (
-    render_security_configurations,
-    render_spring_security,
-    render_unsecured_endpoints
-)
-from charts.external_integration_charts import (
-    render_external_sdks,
-    render_hardcoded_urls
-)
+from utils.helpers import CSV_BASE, get_csv_path
+from utils.report_cache import ReportCache
+from utils.memo import tag
+from utils import live_queries
+from analysis.impact_index import ImpactIndex, index_csv_name
+import sections
+
+# Only the selected section and view are rendered: their CSVs are loaded and
+# their chart module imported on demand, so a rerun costs one view however
+# many reports sections.py registers. The selection is kept in session state
+# and in the URL (?section=<key>&view=<tab>), so reloads and links keep it.
+# Charts get only the report columns sections.py lists for them; the raw data
+# expander parses the whole CSV when asked to.
+#
+# With the "Live (Neo4j)" data source the reports' Cypher queries run against
+# the database instead (utils/live_queries.py), with the scope and thresholds
+# chosen here. Results are cached per parameter set for E2E_LIVE_TTL seconds,
+# and raw data is paged by the server with SKIP/LIMIT.
 
 st.set_page_config(page_title="Analysis decomposition insights", layout="wide")
 
-st.title("🔍 Analysis decomposition insights")
-
-stack, arch, entryPoints, db, dep, integration, fanInOut, sec, config, test = st.tabs(["| Technology Stack | ","| High Level Architecture | ", "| Entry Points |"
-                            , "| Database |", "| Dependencies |", "| External Integration |"
-                            , "| Fan In/Out |",  "| Security |", "| Configuration environment |", "| Testing |"])
-
-with stack:
-    st.header("Technology stack analysis")
-
-
-with arch:
-    st.header("High level architecture analysis")
-
-    code_quality_tab, code_smells_tab, overview_tab = st.tabs([
-        "Code Quality",
-        "Code Smells",
-        "Overview"
-    ])
-
-    with code_quality_tab:
-        st.markdown("### Architectural Layer Violations")
-        csv_path = get_csv_path("High_Level_Architecture", "Architectural_Layer_Violation.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_layer_violations(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### Cyclomatic Complexity")
-        csv_path = get_csv_path("High_Level_Architecture", "Cyclomatic_Complexity.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_cyclomatic_complexity(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### Deepest Inheritance")
-        csv_path = get_csv_path("High_Level_Architecture", "Deepest_Inheritance.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_deepest_inheritance(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with code_smells_tab:
-        st.markdown("### Excessive Dependencies")
-        csv_path = get_csv_path("High_Level_Architecture", "Excessive_Dependencies.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_excessive_dependencies(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### God Classes")
-        csv_path = get_csv_path("High_Level_Architecture", "God_Classes.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_god_classes(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### Highest Number of Methods")
-        csv_path = get_csv_path("High_Level_Architecture", "Highest_Number_Methods_Class.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_highest_methods(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with overview_tab:
-        st.markdown("### General Count Overview")
-        csv_path = get_csv_path("High_Level_Architecture", "General_Count_Overview.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_general_count_overview(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### Inheritance Between Classes")
-        csv_path = get_csv_path("High_Level_Architecture", "Inheritance_Between_Classes.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_inheritance_between_classes(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-        st.divider()
-
-        st.markdown("### Package Structure")
-        csv_path = get_csv_path("High_Level_Architecture", "Package_Structure.csv")
-        df = read_csv_safe(csv_path)
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-            render_package_structure(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with entryPoints:
-    st.header("Entry points and controller analysis")
-
-    main_classes_tab, controllers_tab, endpoints_tab = st.tabs([
-        "Main Classes",
-        "Spring Controllers",
-        "Spring Endpoints"
-    ])
-
-    with main_classes_tab:
-        st.subheader("Main Classes Analysis")
-        st.markdown("Distribution and analysis of classes with `main(String[])` methods.")
-
-        csv_path = get_csv_path("API_Entry_Points", "Main_Classes.csv")
-        df_main = read_csv_safe(csv_path)
-
-        if not df_main.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_main.head(20))
-
-            render_main_classes_charts(df_main)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with controllers_tab:
-        st.subheader("Spring Controllers Analysis")
-        st.markdown("Analysis of Spring `@Controller` and `@RestController` annotated classes.")
-
-        csv_path = get_csv_path("API_Entry_Points", "Spring_Controller.csv")
-        df_ctrl = read_csv_safe(csv_path)
-
-        if not df_ctrl.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_ctrl.head(20))
-
-            render_spring_controllers_charts(df_ctrl)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with endpoints_tab:
-        st.subheader("Spring Endpoints Analysis")
-        st.markdown("Analysis of REST endpoints exposed by Spring controllers.")
-
-        csv_path = get_csv_path("API_Entry_Points", "Spring_Endpoints.csv")
-        df_ep = read_csv_safe(csv_path)
-
-        if not df_ep.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_ep.head(20))
-
-            render_spring_endpoints_charts(df_ep)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with db:
-    st.header("Database analysis")
-
-    jpa_tab, fields_tab, schema_tab, relationships_tab = st.tabs([
-        "JPA Entities",
-        "Entity Fields",
-        "DB Schema",
-        "Entity Relationships"
-    ])
-
-    with jpa_tab:
-        st.subheader("JPA Entities Analysis")
-        st.markdown("Tables by number of mapped entities.")
-
-        csv_path = get_csv_path("Database", "Jpa_Entities.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_jpa_entities(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with fields_tab:
-        st.subheader("Entity Fields Analysis")
-        st.markdown("Top field annotations across all entities.")
-
-        csv_path = get_csv_path("Database", "Entity_Fields.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_entity_fields(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with schema_tab:
-        st.subheader("DB Schema Analysis")
-        st.markdown("Relationship statistics for database entities.")
-
-        csv_path = get_csv_path("Database", "DB_Schema.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_db_schema(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with relationships_tab:
-        st.subheader("Entity Relationships Analysis")
-        st.markdown("Entity → Entity relationships visualized as a Sankey diagram.")
-
-        csv_path = get_csv_path("Database", "Entity_Relationship_Edges.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_entity_relationships(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with dep:
-    st.header("Dependency overview analysis")
-
-    circular_tab, external_tab, loc_tab, modules_tab, packages_tab, classes_tab = st.tabs([
-        "Circular Dependencies",
-        "External Dependencies",
-        "Lines of Code",
-        "Modules & Artifacts",
-        "Package Dependencies",
-        "Package Dependencies - Classes"
-    ])
-
-    with circular_tab:
-        st.subheader("Circular Dependencies Analysis")
-        st.markdown("Analysis of circular dependencies between packages.")
-
-        csv_path = get_csv_path("Dependencies", "Circular_Dependencies.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_circular_dependencies(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with external_tab:
-        st.subheader("External Dependencies Analysis")
-        st.markdown("Overview of external dependencies (group → artifact).")
-
-        csv_path = get_csv_path("Dependencies", "External_Dependencies.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_external_dependencies(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with loc_tab:
-        st.subheader("Lines of Code Analysis")
-        st.markdown("Top classes by lines of code and their distribution.")
-
-        csv_path = get_csv_path("Dependencies", "Lines_Of_Code.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_lines_of_code(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with modules_tab:
-        st.subheader("Modules & Artifacts Analysis")
-        st.markdown("In/Out degree per artifact and top outgoing dependencies.")
-
-        csv_path = get_csv_path("Dependencies", "Modules_And_Artifacts.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_modules_and_artifacts(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with packages_tab:
-        st.subheader("Package Dependencies Analysis")
-        st.markdown("Analysis of package-to-package dependencies (origin → destination).")
-
-        csv_path = get_csv_path("Dependencies", "Package_Dependencies.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_package_dependencies(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with classes_tab:
-        st.subheader("Package Dependencies - Classes Analysis")
-        st.markdown("Top class-to-class dependency pairs by weight.")
-
-        csv_path = get_csv_path("Dependencies", "Package_Dependencies_Classes.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_package_dependencies_classes(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with integration:
-    st.header("External integration analysis")
-
-    sdks_tab, urls_tab = st.tabs([
-        "External SDKs",
-        "Hardcoded URLs"
-    ])
-
-    with sdks_tab:
-        st.subheader("External SDKs Analysis")
-        st.markdown("Analysis of external SDK dependencies (group → artifact).")
-
-        csv_path = get_csv_path("External_Integration", "External_SDKs.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_external_sdks(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with urls_tab:
-        st.subheader("Hardcoded URLs Analysis")
-        st.markdown("Analysis of hardcoded URLs found in the codebase.")
-
-        csv_path = get_csv_path("External_Integration", "Hardcoded_URLs.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_hardcoded_urls(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with fanInOut:
-    st.header("Fan in and Fan out analysis")
-    st.markdown("""
-    Fan-In measures how many classes depend on a given class (incoming dependencies).
-    Fan-Out measures how many classes a given class depends on (outgoing dependencies).
-    """)
-
-    # Load both CSVs
-    csv_path_in = get_csv_path("Fan_In_Fan_Out", "Fan_In.csv")
-    csv_path_out = get_csv_path("Fan_In_Fan_Out", "Fan_Out.csv")
-
-    df_in = read_csv_safe(csv_path_in)
-    df_out = read_csv_safe(csv_path_out)
-
-    if not df_in.empty or not df_out.empty:
-        with st.expander("View raw data"):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("**Fan-In Data**")
-                st.dataframe(df_in.head(20) if not df_in.empty else pd.DataFrame())
-            with col2:
-                st.markdown("**Fan-Out Data**")
-                st.dataframe(df_out.head(20) if not df_out.empty else pd.DataFrame())
-
-        render_fan_in_fan_out(df_in, df_out)
+SOURCES = {"csv": "Reports (CSV)", "live": "Live (Neo4j)"}
+PAGE_SIZES = [20, 50, 100, 500]
+
+
+@st.cache_resource
+def report_cache() -> ReportCache:
+    """Parsed CSVs shared by all reruns and sessions (bounded by E2E_REPORT_CACHE_MB)."""
+    return ReportCache()
+
+
+def load_report(csv_path: Path, columns=None) -> pd.DataFrame:
+    """Cached report CSV, re-read when the file's mtime or size changed; empty when missing."""
+    df = report_cache().get(csv_path, columns)
+    if df is None:
+        print(f"[info] Missing CSV: {csv_path}")
+        return pd.DataFrame()
+    return df
+
+
+@st.cache_resource(show_spinner="Loading impact index…")
+def load_impact_index(level: str, mtime: float) -> ImpactIndex:
+    """Load the impact index once per artifact version (mtime is part of the cache key)."""
+    return ImpactIndex.load(get_csv_path("Dependencies", index_csv_name(level)).parent, level)
+
+
+@st.cache_resource(ttl=int(os.environ.get("E2E_LIVE_TTL", "600")),
+                   max_entries=int(os.environ.get("E2E_LIVE_CACHE_ENTRIES", "128")),
+                   show_spinner="Querying Neo4j…")
+def live_result(section: str, csv_name: str, parameters: tuple, skip: int, limit) -> pd.DataFrame:
+    """Rows of a report query for one parameter set and page (shared by all sessions)."""
+    df = live_queries.run(live_queries.query_for(section, csv_name), dict(parameters), skip, limit)
+    tag(df, f"live:{section}/{csv_name}:{parameters}:{skip}:{limit}@{time.time_ns()}")
+    return df
+
+
+def choose(label: str, options: list, param: str, key: str, container=st, default=None, **kwargs):
+    """Radio whose choice survives reruns (widget key) and reloads (query parameter)."""
+    wanted = st.query_params.get(param, default)
+    index = options.index(wanted) if wanted in options else 0
+    choice = container.radio(label, options, index=index, key=key, **kwargs)
+    if st.query_params.get(param) != choice:
+        st.query_params[param] = choice
+    return choice
+
+
+def live_settings() -> dict:
+    """Sidebar inputs shared by every live query."""
+    scope = st.sidebar.text_input("Scope package", os.environ.get("SCOPE_PACKAGE", ""), key="live_scope",
+                                  help="FQN prefix; empty analyzes the whole project")
+    row_limit = st.sidebar.number_input("Rows per chart query", min_value=0, step=1000, key="live_row_limit",
+                                        value=int(os.environ.get("E2E_LIVE_ROW_LIMIT", "50000")),
+                                        help="Charts use the first rows in query order; 0 fetches all rows")
+    if st.sidebar.button("Re-run live queries"):
+        live_result.clear()
+    return {"scope": scope.strip(), "row_limit": int(row_limit) or None}
+
+
+def query_parameters(sec: dict, step: dict, settings: dict) -> tuple:
+    """Parameters of one report query: the script's defaults, the scope and the thresholds set here."""
+    parameters = live_queries.default_parameters(step)
+    parameters[live_queries.SCOPE_PARAMETER] = settings["scope"]
+    editable = [n for n in live_queries.parameter_names(step) if n != live_queries.SCOPE_PARAMETER]
+    for col, name in zip(st.columns(len(editable)) if editable else [], editable):
+        default = parameters.get(name, "")
+        key = f"live:{sec['key']}/{step['csv']}:{name}"
+        with col:
+            if str(default).lstrip("-").isdigit():
+                parameters[name] = st.number_input(name, value=int(default), step=1, key=key)
+            else:
+                parameters[name] = st.text_input(name, str(default), key=key)
+    return tuple(sorted(parameters.items()))
+
+
+def render_live_page(sec: dict, step: dict, parameters: tuple):
+    """One page of a query's rows, fetched with SKIP/LIMIT."""
+    key = f"live:{sec['key']}/{step['csv']}:{hash(parameters)}"
+    size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}:size")
+    page = st.session_state.get(f"{key}:page", 0)
+
+    rows = live_result(sec["key"], step["csv"], parameters, page * size, size + 1)  # one extra: is there a next page?
+    st.dataframe(rows.head(size))
+
+    prev_col, info_col, next_col = st.columns([1, 4, 1])
+    if prev_col.button("← Previous", key=f"{key}:prev", disabled=page == 0):
+        st.session_state[f"{key}:page"] = page - 1
+        st.rerun()
+    shown = min(len(rows), size)
+    info_col.caption(f"Rows {page * size + 1:,}–{page * size + shown:,}" if shown else "No rows")
+    if next_col.button("Next →", key=f"{key}:next", disabled=len(rows) <= size):
+        st.session_state[f"{key}:page"] = page + 1
+        st.rerun()
+
+
+def render_impact(sec: dict, rep: dict):
+    level = st.radio("Level", ["Packages", "Types"], horizontal=True, key="impact_level")
+    csv_path = get_csv_path(sec["key"], index_csv_name(level))
+
+    if csv_path.exists():
+        sections.render_function(sec, rep)(load_impact_index(level, csv_path.stat().st_mtime), level)
     else:
-        st.warning(f"No data available. Please ensure the CSVs exist at: `{csv_path_in}` and `{csv_path_out}`")
-
-with sec:
-    st.header("Security overview analysis")
-
-    sec_configs_tab, spring_sec_tab, unsecured_tab = st.tabs([
-        "Security Configurations",
-        "Spring Security",
-        "Unsecured Endpoints"
-    ])
-
-    with sec_configs_tab:
-        st.subheader("Security Configurations Analysis")
-        st.markdown("Analysis of security configuration classes and their properties.")
+        st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
+
+
+def render_live_report(sec: dict, rep: dict, steps: list, settings: dict):
+    parameters = [query_parameters(sec, step, settings) for step in steps]
+    limit = settings["row_limit"]
+    try:
+        dfs = [live_result(sec["key"], step["csv"], params, 0, limit) for step, params in zip(steps, parameters)]
+    except Exception as e:
+        st.error(f"Live query failed: {type(e).__name__}: {e}")
+        return
+
+    if all(df.empty for df in dfs):
+        st.warning("The query returned no rows for these parameters.")
+        return
+    if limit and any(len(df) >= limit for df in dfs):
+        st.caption(f"Charts use the first {limit:,} rows in query order; raise the row limit in the sidebar to include more.")
+
+    with st.expander("View raw data"):
+        for col, step, params in zip(st.columns(len(steps)), steps, parameters):
+            with col:
+                if len(steps) > 1:
+                    st.markdown(f"**{Path(step['csv']).stem.replace('_', '-')} Data**")
+                render_live_page(sec, step, params)
+
+    sections.render_function(sec, rep)(*dfs)
+
+
+def render_report(sec: dict, rep: dict, settings: dict = None):
+    st.subheader(rep["title"])
+    if rep["description"]:
+        st.markdown(rep["description"])
+
+    if rep["kind"] == "impact":
+        render_impact(sec, rep)
+        return
+
+    if settings is not None:
+        steps = [live_queries.query_for(sec["key"], name) for name in rep["csvs"]]
+        if all(steps):
+            render_live_report(sec, rep, steps, settings)
+            return
+        st.info("This report is computed by the pipeline from other reports; showing the last run's CSV.")
+
+    paths = sections.csv_paths(sec, rep, CSV_BASE)
+    dfs = [load_report(path, rep["columns"]) for path in paths]  # only the columns the chart reads
+
+    if all(df.empty for df in dfs):
+        where = " and ".join(f"`{p}`" for p in paths)
+        st.warning(f"No data available. Please ensure the CSV exists at: {where}")
+        return
+
+    with st.expander("View raw data"):
+        # The whole report is parsed only on request, not for every rerun of the chart
+        raw = dfs
+        if rep["columns"] is not None and st.checkbox("All report columns", key=f"raw:{sec['key']}/{rep['title']}"):
+            raw = [load_report(path) for path in paths]
+        if len(raw) == 1:
+            st.dataframe(raw[0].head(20))
+        else:
+            for col, path, df in zip(st.columns(len(raw)), paths, raw):
+                with col:
+                    st.markdown(f"**{path.stem.replace('_', '-')} Data**")
+                    st.dataframe(df.head(20))
+
+    sections.render_function(sec, rep)(*dfs)
 
-        csv_path = get_csv_path("Security", "Security_Configurations.csv")
-        df = read_csv_safe(csv_path)
 
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_security_configurations(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with spring_sec_tab:
-        st.subheader("Spring Security Analysis")
-        st.markdown("Analysis of Spring Security annotations on methods.")
-
-        csv_path = get_csv_path("Security", "Spring_Security.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_spring_security(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    with unsecured_tab:
-        st.subheader("Potentially Unsecured Endpoints Analysis")
-        st.markdown("Analysis of endpoints that may lack security annotations.")
-
-        csv_path = get_csv_path("Security", "Unsecured_Endpoints.csv")
-        df = read_csv_safe(csv_path)
-
-        if not df.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df.head(20))
-
-            render_unsecured_endpoints(df)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with config:
-    st.header("Configuration environment analysis")
-
-    config_classes, config_files, feature_flags, injected_properties = st.tabs([
-        "Configuration Classes",
-        "Configuration Files",
-        "Feature Flags",
-        "Injected Properties"
-    ])
-
-    with config_classes:
-        st.subheader("Configuration Classes Analysis")
-        st.markdown("Distribution and analysis of classes with `configuration` annotations types.")
-
-        csv_path = get_csv_path("Configuration_Environment", "Configuration_Classes.csv")
-        df_main = read_csv_safe(csv_path)
-
-        if not df_main.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_main.head(20))
-
-            render_annotation_chart(df_main)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-    
-    with config_files:
-        st.subheader("Configuration Files Analysis")
-        st.markdown("Analysis of configuration files and their paths/extensions")
-
-        csv_path = get_csv_path("Configuration_Environment", "Configuration_Files.csv")
-        df_main = read_csv_safe(csv_path)
-
-        if not df_main.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_main.head(20))
-
-            render_extension_chart(df_main)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-
-    with feature_flags:
-        st.subheader("Feature Flags Analysis")
-        st.markdown("Discovery and analysis of feature flags used in the application ")
-
-        csv_path = get_csv_path("Configuration_Environment", "Feature_Flags.csv")
-        df_main = read_csv_safe(csv_path)
-
-        if not df_main.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_main.head(20))
-
-            render_feature_flag_chart(df_main)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-
-    with injected_properties:
-        st.subheader("Injected Properties Analysis")
-        st.markdown("Discovery and analysis of injected properties used in the application ")
-
-        csv_path = get_csv_path("Configuration_Environment", "Injected_Properties.csv")
-        df_main = read_csv_safe(csv_path)
-
-        if not df_main.empty:
-            with st.expander("View raw data"):
-                st.dataframe(df_main.head(20))
-
-            render_injected_properties_chart(df_main)
-        else:
-            st.warning(f"No data available. Please ensure the CSV exists at: `{csv_path}`")
-
-with test:
-    st.header("Testing analysis")
-    st.warning("Testing queries were disabled for this analysis")
+st.title("🔍 Analysis decomposition insights")
 
+section_key = choose("Section", [s["key"] for s in sections.SECTIONS], "section", "section", st.sidebar,
+                     format_func=lambda k: sections.get_section(k)["title"])
+source = choose("Data source", list(SOURCES), "source", "source", st.sidebar,
+                default=os.environ.get("E2E_DASHBOARD_SOURCE", "csv"), format_func=SOURCES.get)
+settings = live_settings() if source == "live" else None
+sec = sections.get_section(section_key)
+
+st.header(sec["header"])
+if sec["intro"]:
+    st.markdown(sec["intro"])
+if sec["notice"]:
+    st.warning(sec["notice"])
+
+if sec["tabs"]:
+    titles = [t["title"] for t in sec["tabs"]]
+    view = choose("View", titles, "view", f"view_{section_key}", horizontal=True, label_visibility="collapsed")
+    for i, rep in enumerate(sec["tabs"][titles.index(view)]["reports"]):
+        if i:
+            st.divider()
+        render_report(sec, rep, settings)
+elif "view" in st.query_params:
+    del st.query_params["view"]
@@ -0,0 +1,188 @@
+"""Registry of the report sections shown by the dashboard and the static site.
+
+Section → tabs → reports, in display order. A section is one CSV category
+(reports/csv-reports/<key>/) with its chart module; a report names the CSV
+files it reads and the `render_*` function of that module that draws them
+(called with one DataFrame per CSV, in order). `columns` names the CSV
+columns the chart reads when it needs fewer than the whole report; see
+utils/datasets.py.
+
+Reports with kind "impact" are drawn from the precomputed impact index
+(analysis/impact_index.py) instead of a plain CSV.
+"""
+import importlib
+from pathlib import Path
+
+
+def report(title: str, csvs, render: str, description: str = "", kind: str = "csv", columns=None) -> dict:
+    csvs = (csvs,) if isinstance(csvs, str) else tuple(csvs)
+    return {"title": title, "csvs": csvs, "render": render, "description": description, "kind": kind,
+            "columns": tuple(columns) if columns is not None else None}
+
+
+def tab(title: str, *reports) -> dict:
+    return {"title": title, "reports": list(reports)}
+
+
+def section(key: str, title: str, header: str, module: str = None, tabs=(), intro: str = "",
+            notice: str = "") -> dict:
+    return {"key": key, "title": title, "header": header, "module": module, "tabs": list(tabs),
+            "intro": intro, "notice": notice}
+
+
+SECTIONS = [
+    section("Technology_Stack", "Technology Stack", "Technology stack analysis"),
+
+    section("High_Level_Architecture", "High Level Architecture", "High level architecture analysis",
+            "high_level_architecture_charts", [
+                tab("Code Quality",
+                    report("Architectural Layer Violations", "Architectural_Layer_Violation.csv",
+                           "render_layer_violations"),
+                    report("Cyclomatic Complexity", "Cyclomatic_Complexity.csv", "render_cyclomatic_complexity"),
+                    report("Deepest Inheritance", "Deepest_Inheritance.csv", "render_deepest_inheritance")),
+                tab("Code Smells",
+                    report("Excessive Dependencies", "Excessive_Dependencies.csv", "render_excessive_dependencies"),
+                    report("God Classes", "God_Classes.csv", "render_god_classes"),
+                    report("Highest Number of Methods", "Highest_Number_Methods_Class.csv",
+                           "render_highest_methods")),
+                tab("Overview",
+                    report("General Count Overview", "General_Count_Overview.csv", "render_general_count_overview"),
+                    report("Inheritance Between Classes", "Inheritance_Between_Classes.csv",
+                           "render_inheritance_between_classes"),
+                    report("Package Structure", "Package_Structure.csv", "render_package_structure")),
+            ]),
+
+    section("API_Entry_Points", "Entry Points", "Entry points and controller analysis", "entry_points_charts", [
+        tab("Main Classes",
+            report("Main Classes Analysis", "Main_Classes.csv", "render_main_classes_charts",
+                   "Distribution and analysis of classes with `main(String[])` methods.")),
+        tab("Spring Controllers",
+            report("Spring Controllers Analysis", "Spring_Controller.csv", "render_spring_controllers_charts",
+                   "Analysis of Spring `@Controller` and `@RestController` annotated classes.")),
+        tab("Spring Endpoints",
+            report("Spring Endpoints Analysis", "Spring_Endpoints.csv", "render_spring_endpoints_charts",
+                   "Analysis of REST endpoints exposed by Spring controllers.")),
+    ]),
+
+    section("Database", "Database", "Database analysis", "database_charts", [
+        tab("JPA Entities",
+            report("JPA Entities Analysis", "Jpa_Entities.csv", "render_jpa_entities",
+                   "Tables by number of mapped entities.", columns=("Entity", "TableName"))),
+        tab("Entity Fields",
+            report("Entity Fields Analysis", "Entity_Fields.csv", "render_entity_fields",
+                   "Top field annotations across all entities.", columns=("Entity", "Annotations"))),
+        tab("DB Schema",
+            report("DB Schema Analysis", "DB_Schema.csv", "render_db_schema",
+                   "Relationship statistics for database entities.", columns=("Entity", "Relationships"))),
+        tab("Entity Relationships",
+            report("Entity Relationships Analysis", "Entity_Relationship_Edges.csv", "render_entity_relationships",
+                   "Entity → Entity relationships visualized as a Sankey diagram.")),
+    ]),
+
+    section("Dependencies", "Dependencies", "Dependency overview analysis", "dependencies_charts", [
+        tab("Circular Dependencies",
+            report("Circular Dependencies Analysis", "Circular_Dependencies.csv", "render_circular_dependencies",
+                   "Analysis of circular dependencies between packages.",
+                   columns=("package1", "package2", "totalDepsP1toP2", "totalDepsP2toP1"))),
+        tab("External Dependencies",
+            report("External Dependencies Analysis", "External_Dependencies.csv", "render_external_dependencies",
+                   "Overview of external dependencies (group → artifact).",
+                   columns=("artifact.group", "artifact.name"))),
+        tab("Lines of Code",
+            report("Lines of Code Analysis", "Lines_Of_Code.csv", "render_lines_of_code",
+                   "Top classes by lines of code and their distribution.")),
+        tab("Modules & Artifacts",
+            report("Modules & Artifacts Analysis", "Modules_And_Artifacts.csv", "render_modules_and_artifacts",
+                   "In/Out degree per artifact and top outgoing dependencies.",
+                   columns=("Artifact_1_Name", "Artifact_2_Name"))),
+        tab("Package Dependencies",
+            report("Package Dependencies Analysis", "Package_Dependencies.csv", "render_package_dependencies",
+                   "Analysis of package-to-package dependencies (origin → destination).")),
+        tab("Package Dependencies - Classes",
+            report("Package Dependencies - Classes Analysis", "Package_Dependencies_Classes.csv",
+                   "render_package_dependencies_classes", "Top class-to-class dependency pairs by weight.")),
+        tab("Package Coupling",
+            report("Package Coupling Metrics", "Package_Coupling_Metrics.csv", "render_package_coupling_metrics",
+                   "Afferent/efferent coupling, instability, abstractness and distance from the main sequence "
+                   "per package.")),
+        tab("Similarity Clusters",
+            report("Class Similarity Clusters", "Class_Similarity_Clusters.csv", "render_class_similarity_clusters",
+                   "Classes grouped by shared dependencies and dependents (service extraction candidates).")),
+        tab("Impact Analysis",
+            report("Impact Analysis", (), "render_impact_analysis",
+                   "Transitive dependents (blast radius) and dependencies from the precomputed impact index.",
+                   kind="impact")),
+    ]),
+
+    section("External_Integration", "External Integration", "External integration analysis",
+            "external_integration_charts", [
+                tab("External SDKs",
+                    report("External SDKs Analysis", "External_SDKs.csv", "render_external_sdks",
+                           "Analysis of external SDK dependencies (group → artifact).")),
+                tab("Hardcoded URLs",
+                    report("Hardcoded URLs Analysis", "Hardcoded_URLs.csv", "render_hardcoded_urls",
+                           "Analysis of hardcoded URLs found in the codebase.")),
+            ]),
+
+    section("Fan_In_Fan_Out", "Fan In/Out", "Fan in and Fan out analysis", "fan_in_fan_out_charts", [
+        tab("Fan In/Out",
+            report("Fan-In / Fan-Out", ("Fan_In.csv", "Fan_Out.csv"), "render_fan_in_fan_out")),
+    ], intro="Fan-In measures how many classes depend on a given class (incoming dependencies).\n"
+             "Fan-Out measures how many classes a given class depends on (outgoing dependencies)."),
+
+    section("Security", "Security", "Security overview analysis", "security_charts", [
+        tab("Security Configurations",
+            report("Security Configurations Analysis", "Security_Configurations.csv",
+                   "render_security_configurations",
+                   "Analysis of security configuration classes and their properties.")),
+        tab("Spring Security",
+            report("Spring Security Analysis", "Spring_Security.csv", "render_spring_security",
+                   "Analysis of Spring Security annotations on methods.")),
+        tab("Unsecured Endpoints",
+            report("Potentially Unsecured Endpoints Analysis", "Unsecured_Endpoints.csv",
+                   "render_unsecured_endpoints", "Analysis of endpoints that may lack security annotations.")),
+    ]),
+
+    section("Configuration_Environment", "Configuration environment", "Configuration environment analysis",
+            "configuration_environment_charts", [
+                tab("Configuration Classes",
+                    report("Configuration Classes Analysis", "Configuration_Classes.csv", "render_annotation_chart",
+                           "Distribution and analysis of classes with `configuration` annotations types.")),
+                tab("Configuration Files",
+                    report("Configuration Files Analysis", "Configuration_Files.csv", "render_extension_chart",
+                           "Analysis of configuration files and their paths/extensions")),
+                tab("Feature Flags",
+                    report("Feature Flags Analysis", "Feature_Flags.csv", "render_feature_flag_chart",
+                           "Discovery and analysis of feature flags used in the application ")),
+                tab("Injected Properties",
+                    report("Injected Properties Analysis", "Injected_Properties.csv",
+                           "render_injected_properties_chart",
+                           "Discovery and analysis of injected properties used in the application ")),
+            ]),
+
+    section("Testing", "Testing", "Testing analysis", notice="Testing queries were disabled for this analysis"),
+]
+
+
+def get_section(key: str) -> dict:
+    for s in SECTIONS:
+        if s["key"] == key:
+            return s
+    raise KeyError(f"Unknown section: {key}")
+
+
+def reports(sec: dict):
+    """(tab, report) pairs of a section, in display order."""
+    for t in sec["tabs"]:
+        for r in t["reports"]:
+            yield t, r
+
+
+def csv_paths(sec: dict, rep: dict, base: Path) -> list:
+    return [Path(base) / sec["key"] / name for name in rep["csvs"]]
+
+
+def render_function(sec: dict, rep: dict):
+    """The chart module's render_* function (imported on first use)."""
+    module = importlib.import_module(f"charts.{sec['module']}")
+    return getattr(module, rep["render"])
@@ -0,0 +1,280 @@
+"""Warm analysis service: regenerate single reports and notebooks without cold starts.
+
+A long-running process that keeps what every pipeline invocation pays for
+again: the Neo4j driver and its connection pool, the report datasets already
+parsed into DataFrames, the analysis modules, and a Jupyter kernel with
+pandas/plotly and the chart modules imported. Iterating on one query or one
+chart is then a single HTTP call.
+
+Endpoints (JSON responses):
+  GET  /health                                  uptime, dataset cache usage, kernel state
+  GET  /reports                                 report ids (<Section>/<Name>)
+  POST /reports/<Section>/<Name>[?scope=pkg]    re-run the query, rewrite the CSV and
+                                                the derived reports that read it
+  GET  /datasets/<Section>/<Name>[?scope=pkg&limit=N]
+                                                rows of the CSV (cached until it changes)
+  POST /notebooks/<Stem>[?scope=pkg]            execute jupyter/<Stem>.ipynb in the warm
+                                                kernel and export the HTML report
+
+Reports come from the same registry as scripts/pipeline/stage_dag.py (the
+category scripts). Without ?scope the SCOPE_PACKAGE of the environment is used
+and the CSV lands in the regular reports; another scope writes under
+reports/scopes/<scope>/csv-reports/ instead ("." and ".." are rejected).
+Notebook runs see the scope as SCOPE_PACKAGE and read that scope's CSVs
+(CSV_REPORTS_DIRECTORY). Chart modules edited since the kernel imported them
+are reloaded before the next notebook run.
+
+Usage (after `source scripts/env.sh`):
+  python interface/service.py [--port 8765 | --socket runtime/service.sock] [--no-kernel]
+  curl -X POST localhost:8765/reports/High_Level_Architecture/God_Classes
+  curl -X POST 'localhost:8765/notebooks/High_Level_Architecture?scope=com.acme.billing'
+"""
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import importlib.util
+import json
+import os
+from pathlib import Path
+import re
+import socketserver
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(str(Path(__file__).parent))
+from utils import neo4j_client
+from utils.report_cache import ReportCache
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+NOTEBOOKS_DIR = REPO_ROOT / "jupyter"
+
+sys.path.append(str(REPO_ROOT / "scripts" / "pipeline"))
+sys.path.append(str(REPO_ROOT / "scripts" / "jupyter"))
+import stage_dag  # noqa: E402  (report registry shared with the stage DAG)
+from notebook_executor import WarmKernel, export_notebook  # noqa: E402  (kernel shared with the batch executor)
+
+
+class ServiceError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def scope_dir_name(scope: str) -> str:
+    name = re.sub(r"[^\w.-]", "_", scope) or "FULL"
+    if name in (".", ".."):
+        raise ServiceError(400, f"Invalid scope: {scope!r}")
+    return name
+
+
+class AnalysisService:
+    """State shared by all requests."""
+
+    def __init__(self, use_kernel: bool = True):
+        self.started = time.monotonic()
+        self.datasets = ReportCache()
+        self.kernel = WarmKernel() if use_kernel else None
+        self.steps = stage_dag.category_steps()
+        self.reports = {f"{s['section']}/{s['name']}": s for s in self.steps if s["kind"] == "query"}
+        self._modules = {}
+        self._derived_lock = threading.Lock()
+
+    # --- warm-up ------------------------------------------------------
+
+    def warm_up(self):
+        try:
+            neo4j_client.get_driver()
+            print(f"[info] Neo4j driver ready ({neo4j_client.bolt_uri()})")
+        except Exception as e:  # the service stays usable for datasets and notebooks
+            print(f"[warn] Neo4j not reachable yet: {e}")
+        print(f"[info] Datasets loaded: {self.datasets.preload(stage_dag.csv_base())}")
+        for step in self.steps:
+            if step["kind"] == "derived":
+                self._module(step["script"])
+        if self.kernel:
+            self.kernel.start()
+            print("[info] Notebook kernel ready")
+
+    def _module(self, script: Path):
+        """Analysis script imported once; its main(argv) is called per request."""
+        if script not in self._modules:
+            spec = importlib.util.spec_from_file_location(f"e2e_analysis_{script.stem}", script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._modules[script] = module
+        return self._modules[script]
+
+    # --- paths --------------------------------------------------------
+
+    def default_scope(self) -> str:
+        return os.environ.get("SCOPE_PACKAGE", "")
+
+    def csv_dir(self, section: str, scope: str) -> Path:
+        if scope == self.default_scope():
+            return stage_dag.csv_base() / section
+        return stage_dag.csv_base().parent / "scopes" / scope_dir_name(scope) / "csv-reports" / section
+
+    def notebooks_dir(self, scope: str) -> Path:
+        if scope == self.default_scope():
+            return stage_dag.notebooks_base()
+        return stage_dag.notebooks_base().parent / "scopes" / scope_dir_name(scope) / "notebooks"
+
+    # --- operations ---------------------------------------------------
+
+    def regenerate_report(self, report_id: str, scope: str) -> dict:
+        step = self.reports.get(report_id)
+        if step is None:
+            raise ServiceError(404, f"Unknown report: {report_id}")
+        if step["helper"] == "execute_cypher_md":
+            raise ServiceError(400, f"{report_id} is a Markdown report; only CSV reports are served")
+
+        parameters = {}
+        for arg in step["args"]:
+            key, _, value = arg.partition("=")
+            parameters[key] = value.strip("\"'")
+        parameters.setdefault("scopePackage", scope)
+
+        t0 = time.monotonic()
+        columns, rows = neo4j_client.run_query(neo4j_client.read_cypher(step["cypher"]), parameters)
+        query_seconds = time.monotonic() - t0
+        source = step["cypher"] if step["helper"] == "execute_cypher" else None
+        text = neo4j_client.rows_to_csv(columns, rows, source)
+
+        out_dir = self.csv_dir(step["section"], scope)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / step["csv"]
+        changed = not path.exists() or path.read_text(encoding="utf-8") != text
+        if changed:
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, path)
+
+        derived = []
+        if changed:
+            for d in self.steps:
+                if d["kind"] == "derived" and d["section"] == step["section"] and step["csv"] in d["reads"]:
+                    with self._derived_lock:
+                        self._module(d["script"]).main(["--csv-dir", str(out_dir)])
+                    derived.append(d["script"].name)
+
+        return {"report": report_id, "scope": scope, "rows": len(rows), "path": str(path), "changed": changed,
+                "derived": derived, "querySeconds": round(query_seconds, 3),
+                "seconds": round(time.monotonic() - t0, 3)}
+
+    def dataset(self, report_id: str, scope: str, limit: int = None) -> dict:
+        step = self.reports.get(report_id)
+        section, _, name = report_id.partition("/")
+        csv_name = step["csv"] if step else f"{name}.csv"
+        df = self.datasets.get(self.csv_dir(section, scope) / csv_name)
+        if df is None:
+            raise ServiceError(404, f"No CSV for {report_id} (scope {scope or 'FULL'})")
+        rows = df if limit is None else df.head(limit)
+        return {"report": report_id, "scope": scope, "rows": len(df), "columns": list(df.columns),
+                "data": json.loads(rows.to_json(orient="records"))}
+
+    def regenerate_notebook(self, stem: str, scope: str) -> dict:
+        if self.kernel is None:
+            raise ServiceError(400, "Notebook kernel disabled (--no-kernel)")
+        nb_path = NOTEBOOKS_DIR / f"{stem}.ipynb"
+        if not nb_path.is_file():
+            raise ServiceError(404, f"Unknown notebook: {stem}")
+        t0 = time.monotonic()
+        # The notebooks read CSV_REPORTS_DIRECTORY: the scope's reports, not the default ones
+        nb = self.kernel.execute(nb_path, scope, self.csv_dir("", scope))
+        html = export_notebook(nb, nb_path, self.notebooks_dir(scope) / stem)[0]
+        return {"notebook": stem, "scope": scope, "path": str(html), "seconds": round(time.monotonic() - t0, 3)}
+
+    def health(self) -> dict:
+        return {"status": "ok", "uptimeSeconds": round(time.monotonic() - self.started, 1),
+                "datasets": self.datasets.stats(), "reports": len(self.reports),
+                "kernel": bool(self.kernel and self.kernel.alive())}
+
+
+class Handler(BaseHTTPRequestHandler):
+    service: AnalysisService = None
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send(self, status: int, payload: dict):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+        scope = query.get("scope", [self.service.default_scope()])[0]
+        try:
+            if method == "GET" and parts == ["health"]:
+                return self._send(200, self.service.health())
+            if method == "GET" and parts == ["reports"]:
+                return self._send(200, {"reports": sorted(self.service.reports)})
+            if len(parts) == 3 and parts[0] == "reports" and method == "POST":
+                return self._send(200, self.service.regenerate_report(f"{parts[1]}/{parts[2]}", scope))
+            if len(parts) == 3 and parts[0] == "datasets" and method == "GET":
+                limit = int(query["limit"][0]) if "limit" in query else None
+                return self._send(200, self.service.dataset(f"{parts[1]}/{parts[2]}", scope, limit))
+            if len(parts) == 2 and parts[0] == "notebooks" and method == "POST":
+                return self._send(200, self.service.regenerate_notebook(parts[1], scope))
+            raise ServiceError(404, f"No route for {method} {url.path}")
+        except ServiceError as e:
+            self._send(e.status, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm analysis service (reports and notebooks on demand).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("E2E_SERVICE_PORT", "8765")))
+    parser.add_argument("--socket", type=Path, help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--no-kernel", action="store_true", help="Do not start a notebook kernel")
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(use_kernel=not args.no_kernel)
+    service.warm_up()
+    Handler.service = service
+
+    if args.socket:
+        args.socket.parent.mkdir(parents=True, exist_ok=True)
+        if args.socket.exists():
+            args.socket.unlink()
+        server = UnixHTTPServer(str(args.socket), Handler)
+        where = f"unix:{args.socket}"
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), Handler)
+        where = f"http://{args.host}:{args.port}"
+    print(f"[info] Analysis service listening on {where}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if service.kernel:
+            service.kernel.shutdown()
+        neo4j_client.close()
+        if args.socket and args.socket.exists():
+            args.socket.unlink()
+
+
+if __name__ == "__main__":
+    main()
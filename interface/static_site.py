@@ -0,0 +1,396 @@
+"""Static HTML report site built straight from the chart modules (no Jupyter).
+
+For every section of sections.py the report CSVs are loaded once and the
+chart modules' render_* functions are run against a small stand-in for the
+Streamlit API that writes HTML instead of widgets, so the site shows the
+same charts, headings and messages as the dashboard. Each section becomes
+one self-contained page (<out>/<Section>.html, plotly.js inlined) and
+<out>/index.html links them; sections are built in parallel processes.
+
+Figures go through scripts/jupyter/lean_html.py: scatter traces above
+--max-points points are thinned and figure JSON is embedded compressed.
+Interactive widgets render their default (first option / empty lookup).
+
+Usage:
+  python interface/static_site.py [--csv-dir reports/csv-reports] [--out-dir reports/site]
+                                  [--jobs N] [--shared-plotly] [--section Dependencies ...]
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import html
+import json
+import os
+from pathlib import Path
+import re
+import sys
+import time
+import traceback
+
+sys.path.append(str(Path(__file__).parent))
+import sections
+from utils.datasets import load as load_dataset
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(REPO_ROOT / "scripts" / "jupyter"))
+import lean_html  # noqa: E402
+
+DATAFRAME_ROWS = 20
+
+PAGE_CSS = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 0 auto; max-width: 1400px; padding: 0 24px 48px; color: #222; }
+nav { position: sticky; top: 0; background: #fff; padding: 8px 0; border-bottom: 1px solid #ddd; z-index: 10; }
+nav a { margin-right: 14px; text-decoration: none; color: #1f77b4; white-space: nowrap; }
+h2 { margin-top: 40px; border-bottom: 2px solid #1f77b4; padding-bottom: 4px; }
+.row { display: flex; gap: 24px; } .row > div { flex: 1; min-width: 0; }
+.info, .warning, .error { padding: 8px 12px; border-radius: 4px; margin: 8px 0; }
+.info { background: #e8f1fb; } .warning { background: #fff6e0; } .error { background: #fdecea; }
+.metric { font-size: 0.9em; color: #555; } .metric b { display: block; font-size: 1.8em; color: #222; }
+table.dataframe { border-collapse: collapse; font-size: 0.85em; margin: 8px 0; }
+table.dataframe td, table.dataframe th { border: 1px solid #ddd; padding: 3px 6px; text-align: left; }
+.note { font-size: smaller; color: #666; }
+"""
+
+
+def default_csv_dir() -> Path:
+    return Path(os.environ.get("CSV_REPORTS_DIRECTORY") or REPO_ROOT / "reports" / "csv-reports")
+
+
+def default_out_dir() -> Path:
+    return Path(os.environ.get("REPORTS_DIRECTORY") or os.environ.get("REPORTS_DIR")
+                or REPO_ROOT / "reports") / "site"
+
+
+def markdown_html(text: str) -> str:
+    """The Markdown subset the chart modules use: headings, **bold**, `code`, line breaks."""
+    lines = []
+    for line in str(text).strip().splitlines():
+        line = html.escape(line.strip())
+        line = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", line)
+        line = re.sub(r"`(.+?)`", r"<code>\1</code>", line)
+        heading = re.match(r"(#{1,6})\s+(.*)", line)
+        if heading:
+            level = min(len(heading.group(1)) + 1, 6)
+            line = f"<h{level}>{heading.group(2)}</h{level}>"
+        lines.append(line)
+    return "<p>" + "<br>".join(lines) + "</p>"
+
+
+# ----------------------------------------------------------------------
+# Streamlit stand-in
+# ----------------------------------------------------------------------
+
+class Block:
+    """Receives what the render_* functions would draw in Streamlit, as HTML."""
+
+    def __init__(self, page: "StaticPage"):
+        self.page = page
+        self.parts = []
+
+    def _sink(self) -> "Block":
+        return self
+
+    def _emit(self, part):
+        self._sink().parts.append(part)
+
+    def html(self) -> str:
+        return "".join(p if isinstance(p, str) else p.html() for p in self.parts)
+
+    # --- text ---------------------------------------------------------
+
+    def header(self, text, **_):
+        self.page.heading = str(text)
+        self._emit(f"<h3>{html.escape(str(text))}</h3>")
+
+    def subheader(self, text, **_):
+        self.page.heading = str(text)
+        self._emit(f"<h4>{html.escape(str(text))}</h4>")
+
+    def markdown(self, text, **_):
+        self._emit(markdown_html(text))
+
+    def write(self, *items, **_):
+        for item in items:
+            if hasattr(item, "to_html"):
+                self.dataframe(item)
+            else:
+                self.markdown(str(item))
+
+    def caption(self, text, **_):
+        self._emit(f'<p class="note">{html.escape(str(text))}</p>')
+
+    def info(self, text, **_):
+        self._emit(f'<div class="info">{markdown_html(text)}</div>')
+
+    def warning(self, text, **_):
+        self._emit(f'<div class="warning">{markdown_html(text)}</div>')
+
+    def error(self, text, **_):
+        self._emit(f'<div class="error">{markdown_html(text)}</div>')
+
+    success = info
+
+    def divider(self):
+        self._emit("<hr>")
+
+    # --- data ---------------------------------------------------------
+
+    def plotly_chart(self, fig, **_):
+        if fig is None:
+            return
+        self.page.charts += 1
+        self._emit(self.page.figure(fig))
+
+    def dataframe(self, df, **_):
+        df = getattr(df, "data", df)  # a pandas Styler: show its frame
+        shown = df.head(DATAFRAME_ROWS)
+        self._emit(shown.to_html(index=False, border=0, classes="dataframe", na_rep=""))
+        if len(df) > len(shown):
+            self._emit(f'<p class="note">First {len(shown)} of {len(df):,} rows.</p>')
+
+    table = dataframe
+
+    def metric(self, label, value, delta=None, **_):
+        extra = f" ({html.escape(str(delta))})" if delta is not None else ""
+        self._emit(f'<div class="metric">{html.escape(str(label))}<b>{html.escape(str(value))}{extra}</b></div>')
+
+    # --- layout -------------------------------------------------------
+
+    def columns(self, spec, **_):
+        count = spec if isinstance(spec, int) else len(spec)
+        row = Row(self.page, count)
+        self._emit(row)
+        return row.columns
+
+    def tabs(self, labels):
+        blocks = []
+        for label in labels:
+            block = Column(self.page, f"<h5>{html.escape(str(label))}</h5>")
+            self._emit(block)
+            blocks.append(block)
+        return blocks
+
+    def expander(self, label, **_):
+        block = Column(self.page, f"<details><summary>{html.escape(str(label))}</summary>", "</details>")
+        self._emit(block)
+        return block
+
+    def container(self, **_):
+        block = Column(self.page)
+        self._emit(block)
+        return block
+
+    @contextmanager
+    def spinner(self, *_args, **_kwargs):
+        yield
+
+    # --- widgets: the static page shows their default -----------------
+
+    def _widget_note(self, label, value):
+        self._emit(f'<p class="note">{html.escape(str(label))}: <b>{html.escape(str(value))}</b> '
+                   f'(selectable in the dashboard)</p>')
+
+    def selectbox(self, label, options, index=0, **_):
+        options = list(options)
+        value = options[index] if options and index is not None else None
+        if value is not None:
+            self._widget_note(label, value)
+        return value
+
+    def radio(self, label, options, index=0, **_):
+        return self.selectbox(label, options, index)
+
+    def text_input(self, label, value="", **_):
+        return value
+
+    def slider(self, label, min_value=None, max_value=None, value=None, **_):
+        return value if value is not None else min_value
+
+    def checkbox(self, label, value=False, **_):
+        return value
+
+    def __getattr__(self, name):
+        # Anything else Streamlit offers (set_page_config, cache decorators...) is a no-op here
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def noop(*args, **_):
+            return args[0] if len(args) == 1 and callable(args[0]) else None
+        return noop
+
+
+class Column(Block):
+    """A nested block; `with block:` routes module-level st.* calls into it."""
+
+    def __init__(self, page: "StaticPage", before: str = "", after: str = ""):
+        super().__init__(page)
+        self.before = before
+        self.after = after
+
+    def html(self) -> str:
+        return self.before + super().html() + self.after
+
+    def __enter__(self):
+        self.page.stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.page.stack.pop()
+        return False
+
+
+class Row:
+    def __init__(self, page: "StaticPage", count: int):
+        self.columns = [Column(page) for _ in range(count)]
+
+    def html(self) -> str:
+        return '<div class="row">' + "".join(f"<div>{c.html()}</div>" for c in self.columns) + "</div>"
+
+
+class StaticPage(Block):
+    """Installed as sys.modules["streamlit"] while a section is rendered."""
+
+    def __init__(self, max_points: int):
+        super().__init__(self)
+        self.stack = [self]
+        self.charts = 0
+        self.max_points = max_points
+        self.heading = ""  # last header/subheader, names the figures that follow it
+
+    def _sink(self) -> Block:
+        return self.stack[-1]
+
+    def figure(self, fig) -> str:
+        return lean_html.figure_html(json.loads(fig.to_json()), self.max_points)
+
+
+# ----------------------------------------------------------------------
+# Pages
+# ----------------------------------------------------------------------
+
+def anchor(text: str) -> str:
+    return re.sub(r"[^\w]+", "-", text).strip("-").lower()
+
+
+def page_html(title: str, body: str, plotly_script: str) -> str:
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>{html.escape(title)}</title><style>{PAGE_CSS}</style>\n"
+            f"{plotly_script}\n{lean_html.PAGE_SCRIPT}\n</head><body>\n{body}\n</body></html>\n")
+
+
+def render_report(page: StaticPage, sec: dict, rep: dict, csv_dir: Path, frames: dict):
+    if rep["kind"] == "impact":
+        from analysis.impact_index import ImpactIndex
+
+        render = sections.render_function(sec, rep)
+        for level in ("Packages", "Types"):
+            page.header(level)
+            render(ImpactIndex.load(csv_dir / sec["key"], level), level)
+        return
+
+    paths = sections.csv_paths(sec, rep, csv_dir)
+    for path in paths:
+        if (path, rep["columns"]) not in frames:
+            frames[path, rep["columns"]] = load_dataset(path, rep["columns"])
+    dfs = [frames[p, rep["columns"]] for p in paths]
+    if all(df.empty for df in dfs):
+        where = " and ".join(f"`{p}`" for p in paths)
+        page.warning(f"No data available. Please ensure the CSV exists at: {where}")
+        return
+    sections.render_function(sec, rep)(*dfs)
+
+
+def build_section(key: str, csv_dir: Path, out_dir: Path, plotly_script: str, max_points: int) -> dict:
+    """Render one section page (runs in a worker process)."""
+    t0 = time.monotonic()
+    sec = sections.get_section(key)
+    page = StaticPage(max_points)
+    sys.modules["streamlit"] = page
+
+    errors = []
+    frames = {}  # each CSV is read once per section, even when several reports use it
+    nav = "".join(f'<a href="#{anchor(t["title"])}">{html.escape(t["title"])}</a>' for t in sec["tabs"])
+    page.parts.append(f'<nav><a href="index.html">← All sections</a> {nav}</nav>'
+                      f"<h1>{html.escape(sec['header'])}</h1>")
+    if sec["intro"]:
+        page.markdown(sec["intro"])
+    if sec["notice"]:
+        page.warning(sec["notice"])
+
+    for t in sec["tabs"]:
+        page.parts.append(f'<h2 id="{anchor(t["title"])}">{html.escape(t["title"])}</h2>')
+        for rep in t["reports"]:
+            page.parts.append(f"<h3>{html.escape(rep['title'])}</h3>")
+            if rep["description"]:
+                page.markdown(rep["description"])
+            try:
+                render_report(page, sec, rep, csv_dir, frames)
+            except Exception as e:
+                errors.append(f"{rep['title']}: {type(e).__name__}: {e}")
+                page.stack[1:] = []
+                page.error(f"Could not render this report: {type(e).__name__}: {e}")
+                traceback.print_exc()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    target = out_dir / f"{key}.html"
+    target.write_text(page_html(sec["title"], page.html(), plotly_script), encoding="utf-8")
+    return {"section": key, "title": sec["title"], "path": str(target), "charts": page.charts,
+            "errors": errors, "seconds": round(time.monotonic() - t0, 2)}
+
+
+def index_html(results: list) -> str:
+    rows = []
+    for r in results:
+        status = "ok" if not r["errors"] else f"{len(r['errors'])} error(s)"
+        rows.append(f'<tr><td><a href="{r["section"]}.html">{html.escape(r["title"])}</a></td>'
+                    f"<td>{r['charts']}</td><td>{status}</td></tr>")
+    body = ("<h1>Analysis Reports</h1><table class=\"dataframe\"><tr><th>Section</th><th>Charts</th>"
+            "<th>Status</th></tr>" + "".join(rows) + "</table>"
+            f'<p class="note">Generated {time.strftime("%Y-%m-%d %H:%M")}</p>')
+    return page_html("Analysis Reports", body, "")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Static HTML report site from the chart modules.")
+    parser.add_argument("--csv-dir", type=Path, default=default_csv_dir())
+    parser.add_argument("--out-dir", type=Path, default=default_out_dir())
+    parser.add_argument("--jobs", type=int, default=int(os.environ.get("E2E_SITE_JOBS", "0")) or os.cpu_count())
+    parser.add_argument("--section", action="append", help="Only these sections (repeatable)")
+    parser.add_argument("--shared-plotly", action="store_true",
+                        help="Reference one plotly.js in <out-dir>/assets/ instead of inlining it per page")
+    parser.add_argument("--max-points", type=int, default=lean_html.max_points())
+    args = parser.parse_args(argv)
+
+    from plotly.offline import get_plotlyjs
+
+    keys = [s["key"] for s in sections.SECTIONS if not args.section or s["key"] in args.section]
+    if args.shared_plotly:
+        bundle = lean_html.ensure_bundle(args.out_dir / lean_html.ASSETS_DIR_NAME)
+        plotly_script = f'<script src="{lean_html.ASSETS_DIR_NAME}/{bundle}"></script>'
+    else:
+        plotly_script = f"<script>{get_plotlyjs()}</script>"
+
+    t0 = time.monotonic()
+    results = []
+    jobs = max(min(args.jobs, len(keys)), 1)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(build_section, key, args.csv_dir, args.out_dir, plotly_script, args.max_points)
+                   for key in keys]
+        for future in as_completed(futures):
+            r = future.result()
+            results.append(r)
+            flag = "[ok]  " if not r["errors"] else "[warn]"
+            print(f"{flag} {r['section']}: {r['charts']} charts in {r['seconds']:.1f}s")
+            for error in r["errors"]:
+                print(f"       {error}")
+
+    order = {k: i for i, k in enumerate(keys)}
+    results.sort(key=lambda r: order[r["section"]])
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    (args.out_dir / "index.html").write_text(index_html(results), encoding="utf-8")
+    print(f"[done] {len(results)} sections in {time.monotonic() - t0:.1f}s → {args.out_dir / 'index.html'}")
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
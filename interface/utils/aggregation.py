@@ -0,0 +1,185 @@
+"""Pre-binned figures for chart inputs too large to send point by point.
+
+Above E2E_PLOT_MAX_POINTS rows (default 5000) the chart modules switch from
+handing every row to plotly to a summary computed here with NumPy, so the
+figure size no longer grows with the project:
+
+  - scatter   → 2D count heatmap of the bulk, the extreme rows as points
+  - violin    → KDE outline and box statistics, the Tukey outliers as points
+  - histogram → bin counts drawn as bars
+
+Outliers are capped at MAX_OUTLIERS, keeping the most extreme ones.
+"""
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+MAX_OUTLIERS = 500
+GRID_SIZE = 256  # KDE evaluation points
+
+
+def max_points() -> int:
+    return int(os.environ.get("E2E_PLOT_MAX_POINTS", "5000"))
+
+
+def oversized(n: int) -> bool:
+    return n > max_points()
+
+
+def finite_values(values) -> np.ndarray:
+    arr = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+    return arr[np.isfinite(arr)]
+
+
+def bin_edges(values: np.ndarray, nbins: int) -> np.ndarray:
+    """nbins equal bins over the values; integer data gets whole-number bins."""
+    lo, hi = float(values.min()), float(values.max())
+    if np.all(values == np.round(values)):
+        width = max(1, math.ceil((hi - lo + 1) / nbins))
+        count = math.ceil((hi - lo + 1) / width)
+        return lo - 0.5 + width * np.arange(count + 1)
+    if hi == lo:
+        return np.array([lo - 0.5, hi + 0.5])
+    return np.linspace(lo, hi, nbins + 1)
+
+
+def fences(values: np.ndarray, tukey: bool = True):
+    """(low, high) limits beyond which values are outliers.
+
+    Tukey's 1.5·IQR fences; with tukey=False they are widened to the 1st/99th
+    percentiles so skewed data (most values 0 or 1) keeps its bulk inside.
+    """
+    q1, q3 = np.percentile(values, [25, 75])
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    if not tukey:
+        p1, p99 = np.percentile(values, [1, 99])
+        low, high = min(low, p1), max(high, p99)
+    return low, high
+
+
+def extreme_rows(excess: np.ndarray, limit: int = MAX_OUTLIERS) -> np.ndarray:
+    """Indices of rows with positive excess, the largest `limit` of them."""
+    idx = np.flatnonzero(excess > 0)
+    if len(idx) > limit:
+        idx = idx[np.argsort(excess[idx])[::-1][:limit]]
+    return idx
+
+
+def binned_note(n: int) -> str:
+    return f"<br><sup>{n:,} points aggregated</sup>"
+
+
+# ----------------------------------------------------------------------
+# Histogram
+# ----------------------------------------------------------------------
+
+def histogram_figure(values, nbins: int, title: str, color: str) -> go.Figure:
+    """Bar chart of precomputed bin counts (same look as px.histogram)."""
+    arr = finite_values(values)
+    fig = go.Figure()
+    if len(arr):
+        edges = bin_edges(arr, nbins)
+        counts, _ = np.histogram(arr, bins=edges)
+        fig.add_trace(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                             marker_color=color, customdata=np.column_stack([edges[:-1], edges[1:]]),
+                             hovertemplate="%{customdata[0]:.4g} – %{customdata[1]:.4g}: %{y:,}<extra></extra>"))
+    fig.update_layout(title=title + binned_note(len(arr)), bargap=0)
+    return fig
+
+
+# ----------------------------------------------------------------------
+# Scatter
+# ----------------------------------------------------------------------
+
+def density_scatter(df: pd.DataFrame, x: str, y: str, hover_name: str, title: str, bins: int = 60) -> go.Figure:
+    """Count heatmap of the bulk of (x, y) with the extreme rows drawn as points."""
+    work = pd.DataFrame({"x": pd.to_numeric(df[x], errors="coerce"),
+                         "y": pd.to_numeric(df[y], errors="coerce"),
+                         "name": df[hover_name].astype(str)}).dropna(subset=["x", "y"])
+    xs, ys = work["x"].to_numpy(dtype=float), work["y"].to_numpy(dtype=float)
+    fig = go.Figure()
+    if not len(work):
+        return fig
+
+    (x_lo, x_hi), (y_lo, y_hi) = fences(xs, tukey=False), fences(ys, tukey=False)
+    x_scale = (x_hi - x_lo) or 1.0
+    y_scale = (y_hi - y_lo) or 1.0
+    excess = np.maximum.reduce([(xs - x_hi) / x_scale, (x_lo - xs) / x_scale,
+                                (ys - y_hi) / y_scale, (y_lo - ys) / y_scale])
+    inside = excess <= 0
+
+    if inside.any():
+        x_edges, y_edges = bin_edges(xs[inside], bins), bin_edges(ys[inside], bins)
+        counts, _, _ = np.histogram2d(xs[inside], ys[inside], bins=[x_edges, y_edges])
+        counts = counts.T  # heatmap rows are y
+        with np.errstate(divide="ignore"):
+            z = np.where(counts > 0, np.log10(counts), np.nan)
+        top = int(math.ceil(np.nanmax(z))) if np.isfinite(z).any() else 0
+        fig.add_trace(go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2, z=z, customdata=counts,
+            colorscale="Blues", zmin=0, zmax=max(top, 1), name="density",
+            colorbar=dict(title="count", tickvals=list(range(top + 1)), ticktext=[f"{10 ** k:,}" for k in range(top + 1)]),
+            hovertemplate=f"{x} ≈ %{{x:.3g}}<br>{y} ≈ %{{y:.3g}}<br>%{{customdata:,}} rows<extra></extra>"))
+
+    keep = extreme_rows(excess)
+    if len(keep):
+        outliers = work.iloc[keep]
+        fig.add_trace(go.Scatter(
+            x=outliers["x"], y=outliers["y"], mode="markers", text=outliers["name"],
+            name=f"outliers ({len(keep):,} of {int((~inside).sum()):,})",
+            marker=dict(color="#EF553B", size=7, line=dict(width=0.5, color="white")),
+            hovertemplate=f"%{{text}}<br>{x}: %{{x}}<br>{y}: %{{y}}<extra></extra>"))
+    fig.update_layout(title=title + binned_note(len(work)), legend=dict(orientation="h", y=-0.12))
+    return fig
+
+
+# ----------------------------------------------------------------------
+# Violin
+# ----------------------------------------------------------------------
+
+def kde(values: np.ndarray, grid_size: int = GRID_SIZE):
+    """Gaussian KDE on a grid (Scott's bandwidth), from binned counts."""
+    lo, hi = float(values.min()), float(values.max())
+    if hi == lo:
+        return np.array([lo]), np.array([1.0])
+    counts, edges = np.histogram(values, bins=grid_size, range=(lo, hi))
+    grid = (edges[:-1] + edges[1:]) / 2
+    step = edges[1] - edges[0]
+    std = float(values.std()) or step
+    bandwidth = max(1.06 * std * len(values) ** (-1 / 5), step)
+    sigma = bandwidth / step
+    half = int(math.ceil(4 * sigma))
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) / sigma) ** 2)
+    density = np.convolve(counts, kernel, mode="full")[half:half + grid_size]
+    return grid, density / (density.max() or 1.0)
+
+
+def violin_figure(values, title: str, show_outliers: bool = True, color: str = "#636EFA") -> go.Figure:
+    """Violin from a precomputed KDE and box statistics."""
+    arr = finite_values(values)
+    fig = go.Figure()
+    if not len(arr):
+        return fig
+    grid, density = kde(arr)
+    width = 0.4 * density
+    fig.add_trace(go.Scatter(x=np.concatenate([width, -width[::-1]]), y=np.concatenate([grid, grid[::-1]]),
+                             fill="toself", mode="lines", line=dict(color=color, width=1), opacity=0.5,
+                             hoverinfo="skip", showlegend=False))
+
+    q1, median, q3 = np.percentile(arr, [25, 50, 75])
+    low, high = fences(arr)
+    fig.add_trace(go.Box(x=[0], q1=[q1], median=[median], q3=[q3], mean=[float(arr.mean())],
+                         lowerfence=[max(low, arr.min())], upperfence=[min(high, arr.max())],
+                         width=0.08, marker_color=color, fillcolor="white", name="", showlegend=False))
+
+    if show_outliers:
+        keep = extreme_rows(np.maximum(arr - high, low - arr))
+        if len(keep):
+            fig.add_trace(go.Scatter(x=np.zeros(len(keep)), y=arr[keep], mode="markers", showlegend=False,
+                                     marker=dict(color=color, size=5), hovertemplate="%{y}<extra>outlier</extra>"))
+    fig.update_layout(title=title + binned_note(len(arr)),
+                      xaxis=dict(visible=False, range=[-0.5, 0.5]))
+    return fig
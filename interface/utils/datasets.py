@@ -0,0 +1,184 @@
+"""Schemas of the report CSVs and a typed, column-pruning loader.
+
+Every report written to reports/csv-reports/<Category>/<Report>.csv is
+declared here with its columns (as returned by cypher/<Category>/<Report>.cypher
+or the analysis scripts) and their kind:
+
+  fqn       fully-qualified names; categorical (each distinct name stored once)
+  category  low-cardinality labels (HTTP methods, annotation names, versions)
+  text      free text, kept as Python strings
+  int       counts; int32 when there are no gaps, float64 otherwise
+  float     ratios and scores
+  bool      true/false flags
+  list      Neo4j lists ("[a, b]") or ';'-joined values, parsed into Python lists
+
+load() reads only the requested columns with these dtypes, so large reports
+(Package_Dependencies_Classes.csv has millions of rows) keep one copy of each
+FQN instead of one Python string per cell. CSVs without a schema are read
+like read_csv_safe().
+"""
+from pathlib import Path
+
+import pandas as pd
+
+from utils.helpers import parse_listlike, read_csv_safe
+
+FQN = "fqn"
+CATEGORY = "category"
+TEXT = "text"
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+LIST = "list"
+
+# Dtype handed to the CSV parser; the other kinds are converted after reading
+PARSER_DTYPES = {FQN: "category", CATEGORY: "category", TEXT: str}
+TRUE_LITERALS = {"true": True, "false": False, "1": True, "0": False}
+
+
+def dataset(category: str, report: str, columns: dict) -> tuple:
+    return f"{category}/{report}.csv", columns
+
+
+DATASETS = dict([
+    # ---- High_Level_Architecture
+    dataset("High_Level_Architecture", "Architectural_Layer_Violation",
+            {"Controller": FQN, "Repository": FQN, "Violation": CATEGORY}),
+    dataset("High_Level_Architecture", "Cyclomatic_Complexity",
+            {"Class": FQN, "Method": TEXT, "cyclomaticComplexity": INT}),
+    dataset("High_Level_Architecture", "Deepest_Inheritance", {"Class": FQN, "Depth": INT}),
+    dataset("High_Level_Architecture", "Excessive_Dependencies", {"classFqn": FQN, "dependencies": INT}),
+    dataset("High_Level_Architecture", "General_Count_Overview", {"Info": TEXT, "Count": INT}),
+    dataset("High_Level_Architecture", "God_Classes", {"fqn_god_class": FQN, "methodCount": INT}),
+    dataset("High_Level_Architecture", "Highest_Number_Methods_Class", {"Class": FQN, "methodCount": INT}),
+    dataset("High_Level_Architecture", "Inheritance_Between_Classes",
+            {"class_1_fqn": FQN, "relation": CATEGORY, "class_2_fqn": FQN}),
+    dataset("High_Level_Architecture", "Package_Structure", {"packageFqn": FQN}),
+    # ---- API_Entry_Points
+    dataset("API_Entry_Points", "Main_Classes",
+            {"mainClass": FQN, "isStatic": BOOL, "visibility": CATEGORY, "signature": CATEGORY}),
+    dataset("API_Entry_Points", "Spring_Controller", {"ControllerClassFqn": FQN, "Package": FQN}),
+    dataset("API_Entry_Points", "Spring_Endpoints",
+            {"controller": FQN, "method": TEXT, "httpMethod": CATEGORY, "completeEndpoint": TEXT}),
+    # ---- Database
+    dataset("Database", "DB_Schema", {"Entity": FQN, "Fields": LIST, "Relationships": INT}),
+    dataset("Database", "Entity_Fields",
+            {"Entity": FQN, "Field": TEXT, "Type": CATEGORY, "Annotations": LIST, "ColumnNames": LIST}),
+    dataset("Database", "Entity_Relationship_Edges", {"fromEntity": FQN, "toEntity": FQN, "relation": CATEGORY}),
+    dataset("Database", "Jpa_Entities", {"Entity": FQN, "TableName": TEXT, "HasInheritance": BOOL}),
+    # ---- Dependencies
+    dataset("Dependencies", "Circular_Dependencies",
+            {"artifact1": CATEGORY, "package1": FQN, "artifact2": CATEGORY, "package2": FQN,
+             "totalDepsP1toP2": INT, "totalDepsP2toP1": INT, "sampleDepsP1toP2": LIST, "sampleDepsP2toP1": LIST}),
+    dataset("Dependencies", "External_Dependencies",
+            {"artifact.group": CATEGORY, "artifact.name": CATEGORY, "artifact.version": CATEGORY}),
+    dataset("Dependencies", "External_Dependencies_Used_By_Scoped_Code",
+            {"group": CATEGORY, "name": CATEGORY, "version": CATEGORY}),
+    dataset("Dependencies", "Lines_Of_Code", {"CompleteClassPath": FQN, "LoC": INT}),
+    dataset("Dependencies", "Modules_And_Artifacts",
+            {f"Artifact_{i}_{field}": CATEGORY for i in (1, 2) for field in ("Name", "Type", "Version", "Group")}),
+    dataset("Dependencies", "Package_Coupling_Metrics",
+            {"package": FQN, "types": INT, "abstractTypes": INT, "afferentCoupling": INT,
+             "efferentCoupling": INT, "instability": FLOAT, "abstractness": FLOAT, "distance": FLOAT}),
+    dataset("Dependencies", "Package_Dependencies",
+            {"originPackage": FQN, "destinationPackage": FQN, "typesThatDepend": INT, "totalDependencies": INT}),
+    dataset("Dependencies", "Package_Dependencies_Classes",
+            {"Class_1_fqn": FQN, "dependencyWeight": INT, "Class_2_fqn": FQN}),
+    dataset("Dependencies", "Class_Similarity_Clusters", {"class": FQN, "cluster": INT, "clusterSize": INT}),
+    dataset("Dependencies", "Class_Similarity_Pairs", {"class1": FQN, "class2": FQN, "similarity": FLOAT}),
+    *[dataset("Dependencies", f"Impact_Index_{level}",
+              {"node": FQN, "component": INT, "componentSize": INT,
+               "transitiveDependencies": INT, "transitiveDependents": INT})
+      for level in ("Packages", "Types")],
+    *[dataset("Dependencies", f"Impact_Index_{level}_Edges", {"sourceComponent": INT, "targetComponent": INT})
+      for level in ("Packages", "Types")],
+    # ---- External_Integration
+    dataset("External_Integration", "External_SDKs",
+            {"className": TEXT, "artifactGroup": CATEGORY, "artifactName": CATEGORY, "artifactVersion": CATEGORY}),
+    dataset("External_Integration", "Hardcoded_URLs", {"endpoint": TEXT, "declaringClass": FQN, "fieldName": TEXT}),
+    # ---- Fan_In_Fan_Out
+    dataset("Fan_In_Fan_Out", "Fan_In", {"type": FQN, "fanIn": INT}),
+    dataset("Fan_In_Fan_Out", "Fan_Out", {"type": FQN, "fanOut": INT}),
+    # ---- Security
+    dataset("Security", "Security_Configurations",
+            {"securityConfigClass": FQN, "extendsClass": CATEGORY, "annotationsCount": INT, "annotations": TEXT,
+             "configMethodsCount": INT, "configMethods": TEXT, "usesDeprecatedAdapter": BOOL}),
+    dataset("Security", "Spring_Security", {"declaringClass": FQN, "methodName": TEXT, "annotationName": CATEGORY}),
+    dataset("Security", "Unsecured_Endpoints",
+            {"Controller": FQN, "Method": TEXT, "HttpMethod": CATEGORY, "CompleteEndpoint": TEXT,
+             "SecurityStatus": CATEGORY}),
+    # ---- Configuration_Environment
+    dataset("Configuration_Environment", "Configuration_Classes",
+            {"configClass": FQN, "propertyPrefix": TEXT, "annotationType": CATEGORY}),
+    dataset("Configuration_Environment", "Configuration_Files", {"configurationFile": TEXT}),
+    dataset("Configuration_Environment", "Feature_Flags", {"fieldName": TEXT, "declaringClass": FQN, "source": CATEGORY}),
+    dataset("Configuration_Environment", "Injected_Properties",
+            {"fieldName": TEXT, "propertyKey": TEXT, "fieldType": CATEGORY}),
+    # ---- Technology_Stack
+    dataset("Technology_Stack", "Build_System",
+            {"BuildSystem": CATEGORY, "ProjectName": TEXT, "ProjectVersion": TEXT, "Packaging": CATEGORY}),
+    dataset("Technology_Stack", "Java_Version", {"JavaVersionFromBytecode": TEXT}),
+])
+
+
+def dataset_key(path: Path) -> str:
+    path = Path(path)
+    return f"{path.parent.name}/{path.name}"
+
+
+def get_schema(path: Path):
+    """Column → kind of a report CSV, or None when it is not registered."""
+    return DATASETS.get(dataset_key(path))
+
+
+def _convert(series: pd.Series, kind: str) -> pd.Series:
+    if kind == INT:
+        values = pd.to_numeric(series, errors="coerce")
+        if values.notna().all() and (values.empty or values.abs().max() < 2 ** 31):
+            return values.astype("int32")
+        return values.astype("float64")
+    if kind == FLOAT:
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+    if kind == BOOL and series.dtype != bool:
+        flags = series.astype(str).str.strip().str.lower().map(TRUE_LITERALS)
+        return flags.astype(bool) if flags.notna().all() else flags
+    if kind == LIST:
+        return series.map(parse_listlike)
+    return series
+
+
+def load(path: Path, columns=None, categorical: bool = True) -> pd.DataFrame:
+    """Read a report CSV with its declared dtypes.
+
+    columns: only these columns are parsed (unknown names are ignored; None
+    reads all). categorical=False keeps fqn/category columns as strings.
+    Missing or unreadable files give an empty DataFrame, as read_csv_safe().
+    """
+    path = Path(path)
+    schema = get_schema(path)
+    if schema is None:
+        df = read_csv_safe(path)
+        return df[[c for c in columns if c in df.columns]] if columns is not None and not df.empty else df
+    if not path.exists():
+        print(f"[info] Missing CSV: {path}")
+        return pd.DataFrame()
+
+    wanted = set(columns) if columns is not None else None
+    dtypes = {}
+    for name, kind in schema.items():
+        dtype = PARSER_DTYPES.get(kind)
+        if dtype == "category" and not categorical:
+            dtype = str
+        if dtype is not None:
+            dtypes[name] = dtype
+    try:
+        df = pd.read_csv(path, dtype=dtypes,
+                         usecols=(lambda c: str(c).strip() in wanted) if wanted is not None else None)
+    except Exception as e:
+        print(f"[warn] Failed to read {path}: {e}")
+        return pd.DataFrame()
+    df.columns = [str(c).strip() for c in df.columns]
+    for name in df.columns:
+        if name in schema:
+            df[name] = _convert(df[name], schema[name])
+    return df
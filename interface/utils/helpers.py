@@ -1,3 +1,4 @@
+import ast
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -39,7 +40,7 @@ def wrap_label_html(s: str, width: int = 28) -> str:
 
 def fillna_safe(series, value):
     """Mask NA values with a given literal without triggering downcast warnings."""
-    s = series.copy()
+    s = series.astype(object) if isinstance(series.dtype, pd.CategoricalDtype) else series.copy()
     s = s.mask(s.isna(), value)
     return s
 
@@ -49,7 +50,8 @@ def get_csv_path(category: str, filename: str) -> Path:
 
 def labelize_na(s, label="N/A"):
     """Replace NA-like values with a visible label for categorical charts."""
-    s = s.copy()
+    # Categorical columns (utils/datasets.py) cannot take a label outside their categories
+    s = s.astype(object) if isinstance(s.dtype, pd.CategoricalDtype) else s.copy()
     s = s.mask(s.isna(), label).astype(str)
     s = s.replace({"nan": label, "NaN": label})
     return s
@@ -70,6 +72,27 @@ def pick_col(df, names=None, kind=None):
             return got
     return None
 
+def parse_listlike(x):
+    """Return a list from cell x tolerant to JSON/Python lists or common separators."""
+    if x is None or (isinstance(x, float) and np.isnan(x)):
+        return []
+    if isinstance(x, (list, tuple, set)):
+        return [str(i).strip() for i in x if str(i).strip()]
+    s = str(x).strip()
+    if not s or s in {"N/A", "NA", "null", "None"}:
+        return []
+    if (s.startswith("[") and s.endswith("]")) or (s.startswith("(") and s.endswith(")")):
+        try:
+            val = ast.literal_eval(s)
+            if isinstance(val, (list, tuple, set)):
+                return [str(i).strip() for i in val if str(i).strip()]
+        except Exception:
+            pass
+    for sep in [";", ",", "|"]:
+        if sep in s:
+            return [t.strip() for t in s.split(sep) if t.strip()]
+    return [s]
+
 def ext_from_name(x: str) -> str:
     """Derive a file extension from a filename/path; 'unknown' if none."""
     s = str(x)
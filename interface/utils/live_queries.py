@@ -0,0 +1,91 @@
+"""Report queries run live against Neo4j (the dashboard's live mode).
+
+The queries are the ones the category scripts run (stage_dag.category_steps):
+same Cypher file and same parameters. The literal arguments a script passes
+(thresholds such as minMethodCount=20 for God_Classes) are the defaults the
+dashboard lets the user change. Results come through the pooled driver of
+utils/neo4j_client.
+
+run() pages on the server: SKIP/LIMIT are appended after the query's final
+ORDER BY, so only the requested rows cross the wire. Queries that already
+cap their result (a trailing LIMIT) or combine results with UNION are
+fetched whole and sliced here. Pages follow the query's ORDER BY; the few
+report queries without one page in the order Neo4j returns the rows.
+"""
+from pathlib import Path
+import re
+import sys
+
+import pandas as pd
+
+from utils import neo4j_client
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(REPO_ROOT / "scripts" / "pipeline"))
+import stage_dag  # noqa: E402  (report registry shared with the stage DAG)
+
+SCOPE_PARAMETER = "scopePackage"
+PARAMETER = re.compile(r"\$([A-Za-z_]\w*)")
+TRAILING_PAGE = re.compile(r"\b(SKIP|LIMIT)\s+\$?\w+\s*$", re.I)
+UNION = re.compile(r"\bUNION\b", re.I)
+
+_steps = None
+
+
+def report_queries() -> dict:
+    """(section, CSV name) → query step of the category scripts."""
+    global _steps
+    if _steps is None:
+        _steps = {(s["section"], s["csv"]): s for s in stage_dag.category_steps()
+                  if s["kind"] == "query" and s["helper"] != "execute_cypher_md"}
+    return _steps
+
+
+def query_for(section: str, csv_name: str):
+    """The step producing a report, or None for derived reports (similarity, impact index)."""
+    return report_queries().get((section, csv_name))
+
+
+def query_text(step: dict) -> str:
+    """The Cypher of a step without full-line comments and the trailing semicolon."""
+    lines = [line for line in neo4j_client.read_cypher(step["cypher"]).splitlines()
+             if not line.strip().startswith("//")]
+    return "\n".join(lines).strip().rstrip(";").rstrip()
+
+
+def default_parameters(step: dict) -> dict:
+    """Parameters the category script passes (key=value arguments), as strings."""
+    parameters = {}
+    for arg in step["args"]:
+        key, _, value = arg.partition("=")
+        parameters[key] = value.strip("\"'")
+    return parameters
+
+
+def parameter_names(step: dict) -> list:
+    """Parameters the query references, in order of appearance."""
+    return list(dict.fromkeys(PARAMETER.findall(query_text(step))))
+
+
+def pageable(text: str) -> bool:
+    return not TRAILING_PAGE.search(text) and not UNION.search(text)
+
+
+def run(step: dict, parameters: dict, skip: int = 0, limit: int = None) -> pd.DataFrame:
+    """Rows skip..skip+limit of a report query (all rows when limit is None).
+
+    Parameters the query references but that are not given are sent as null.
+    """
+    text = query_text(step)
+    params = {name: None for name in PARAMETER.findall(text)}
+    params.update(parameters)
+    page_on_server = limit is not None and pageable(text)
+    if page_on_server:
+        text += "\nSKIP $e2ePageSkip LIMIT $e2ePageLimit"
+        params.update(e2ePageSkip=int(skip), e2ePageLimit=int(limit))
+
+    columns, rows = neo4j_client.run_query(text, params)
+    df = pd.DataFrame(rows, columns=columns)
+    if limit is not None and not page_on_server:
+        df = df.iloc[skip:skip + limit].reset_index(drop=True)
+    return df
@@ -0,0 +1,111 @@
+"""Memoized chart figures and the aggregations sibling charts share.
+
+Every dashboard rerun, in every session of the Streamlit process, calls the
+render_* functions again. A create_* function decorated with @memoize hands
+back the figure it built before for the same data and parameters instead of
+re-deriving it. Keys are made of:
+
+  - a fingerprint per DataFrame/Series argument: the report file and its
+    mtime/size for frames handed out by ReportCache (see tag()), otherwise a
+    content hash, computed once per object;
+  - the other arguments, which must be hashable (column names, top_n...);
+  - E2E_PLOT_MAX_POINTS, which decides between raw and aggregated figures.
+
+Calls with any other argument type are not cached. Results are shared
+between callers, so figures and frames returned by a memoized function must
+not be modified in place. At most E2E_FIGURE_CACHE_SIZE results are kept
+(default 256), least recently used first out.
+"""
+from collections import OrderedDict
+import functools
+import hashlib
+import os
+import threading
+import weakref
+
+import pandas as pd
+
+from utils.aggregation import max_points
+
+_lock = threading.Lock()
+_tokens = {}  # id(frame) -> (weakref to the frame, fingerprint)
+_results = OrderedDict()
+
+
+def cache_size() -> int:
+    return int(os.environ.get("E2E_FIGURE_CACHE_SIZE", "256"))
+
+
+def tag(obj, token: str):
+    """Use token as the fingerprint of obj, a frame that will not be modified."""
+    key = id(obj)
+
+    def forget(ref):
+        with _lock:
+            if _tokens.get(key, (None,))[0] is ref:
+                del _tokens[key]
+
+    with _lock:
+        _tokens[key] = (weakref.ref(obj, forget), token)
+
+
+def content_hash(obj) -> str:
+    frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+    h = hashlib.sha1(repr((list(frame.columns), [str(t) for t in frame.dtypes], frame.shape)).encode("utf-8"))
+    try:
+        values = pd.util.hash_pandas_object(frame, index=True)
+    except TypeError:  # list cells (parsed Neo4j lists) are not hashable
+        values = pd.util.hash_pandas_object(frame.astype(str), index=True)
+    h.update(values.to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def fingerprint(obj) -> str:
+    with _lock:
+        entry = _tokens.get(id(obj))
+    if entry and entry[0]() is obj:
+        return entry[1]
+    token = content_hash(obj)
+    tag(obj, token)
+    return token
+
+
+def _arg_key(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return "frame", fingerprint(value)
+    hash(value)  # TypeError: not cacheable
+    return value
+
+
+def memoize(func):
+    """Cache func's results by data fingerprint and parameters (process-wide, LRU)."""
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (name, tuple(_arg_key(a) for a in args),
+                   tuple(sorted((k, _arg_key(v)) for k, v in kwargs.items())), max_points())
+        except TypeError:
+            return func(*args, **kwargs)
+        with _lock:
+            if key in _results:
+                _results.move_to_end(key)
+                return _results[key]
+
+        result = func(*args, **kwargs)
+        if isinstance(result, (pd.DataFrame, pd.Series)):
+            # Derived frames passed on to other memoized functions need no hashing
+            tag(result, hashlib.sha1(repr(key).encode("utf-8")).hexdigest())
+        with _lock:
+            _results[key] = result
+            while len(_results) > cache_size():
+                _results.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def clear():
+    with _lock:
+        _results.clear()
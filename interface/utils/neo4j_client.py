@@ -0,0 +1,113 @@
+"""Shared Neo4j access for the Python side (service mode, dashboards).
+
+One driver per process: the driver keeps a pool of Bolt connections, so only
+the first query pays for the handshake. Connection settings follow
+scripts/env.sh (NEO4J_BOLT_PORT, NEO4J_INITIAL_PASSWORD); NEO4J_BOLT_URI
+overrides the URI.
+
+CSV output matches scripts/cypher/cypher-run-query.sh (jq @csv): strings are
+quoted, lists are joined with ",", nulls are empty and a trailing
+"Source Cypher File: <path>" column is added unless disabled.
+"""
+import io
+import json
+import os
+from pathlib import Path
+import threading
+
+import pandas as pd
+
+_driver = None
+_lock = threading.Lock()
+
+
+def bolt_uri() -> str:
+    return os.environ.get("NEO4J_BOLT_URI") or f"bolt://localhost:{os.environ.get('NEO4J_BOLT_PORT', '7687')}"
+
+
+def get_driver():
+    """Process-wide driver (created and verified on first use)."""
+    global _driver
+    with _lock:
+        if _driver is None:
+            from neo4j import GraphDatabase
+
+            password = os.environ.get("NEO4J_INITIAL_PASSWORD")
+            if not password:
+                raise RuntimeError("NEO4J_INITIAL_PASSWORD not set (source scripts/env.sh).")
+            driver = GraphDatabase.driver(
+                bolt_uri(),
+                auth=("neo4j", password),
+                max_connection_pool_size=int(os.environ.get("NEO4J_POOL_SIZE", "16")),
+            )
+            driver.verify_connectivity()
+            _driver = driver
+        return _driver
+
+
+def close():
+    global _driver
+    with _lock:
+        if _driver is not None:
+            _driver.close()
+            _driver = None
+
+
+def read_cypher(path: Path) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def run_query(query: str, parameters: dict = None):
+    """(columns, rows) of a query; rows are lists of plain Python values."""
+    records, _, keys = get_driver().execute_query(
+        query, parameters_=parameters or {}, database_=os.environ.get("NEO4J_DATABASE", "neo4j"))
+    return list(keys), [list(r.values()) for r in records]
+
+
+def profile_query(query: str, parameters: dict = None) -> dict:
+    """Profiled plan of a query (the rows are fetched and dropped); PROFILE is prepended."""
+    _, summary, _ = get_driver().execute_query(
+        "PROFILE " + query, parameters_=parameters or {}, database_=os.environ.get("NEO4J_DATABASE", "neo4j"))
+    return summary.profile or {}
+
+
+def query_to_data_frame(query: str, parameters: dict = None) -> pd.DataFrame:
+    columns, rows = run_query(query, parameters)
+    return pd.DataFrame(rows, columns=columns)
+
+
+def cypher_file_to_data_frame(path: Path, parameters: dict = None) -> pd.DataFrame:
+    return query_to_data_frame(read_cypher(path), parameters)
+
+
+def source_reference(cypher_path: Path) -> str:
+    """Header of the source column, e.g. 'Source Cypher File: Security/X.cypher'."""
+    text = str(cypher_path)
+    marker = "/cypher/"
+    return f"Source Cypher File: {text[text.index(marker) + len(marker):] if marker in text else text}"
+
+
+def _csv_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        value = ",".join("" if v is None else str(v) for v in value)
+    elif isinstance(value, dict):
+        value = json.dumps(value, default=str)
+    text = str(value).replace('"', '""')
+    return f'"{text}"'
+
+
+def rows_to_csv(columns, rows, cypher_path: Path = None) -> str:
+    """CSV text in the format of cypher-run-query.sh."""
+    out = io.StringIO()
+    header = list(columns) + ([source_reference(cypher_path)] if cypher_path else [])
+    out.write(",".join(_csv_cell(c) for c in header) + "\n")
+    for row in rows:
+        cells = list(row) + ([""] if cypher_path else [])
+        out.write(",".join(_csv_cell(v) for v in cells) + "\n")
+    return out.getvalue()
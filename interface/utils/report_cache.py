@@ -0,0 +1,87 @@
+"""Parsed report CSVs shared across Streamlit reruns and service requests.
+
+Entries are keyed by path (and requested columns) and stamped with the
+file's mtime and size: when the pipeline rewrites a report the next get()
+parses it again. The cache holds at most E2E_REPORT_CACHE_MB of DataFrames
+(default 1024), evicting the least recently used ones.
+
+The same DataFrame object is returned to every caller; treat it as
+read-only (copy before adding or converting columns). Its fingerprint for
+utils/memo.py is the file version, so charts built from it are memoized
+without hashing the data.
+"""
+from collections import OrderedDict
+import os
+from pathlib import Path
+import threading
+
+from utils.datasets import load as load_dataset
+from utils.memo import tag
+
+
+def default_max_bytes() -> int:
+    return int(float(os.environ.get("E2E_REPORT_CACHE_MB", "1024")) * 1024 * 1024)
+
+
+def frame_bytes(df) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class ReportCache:
+    """Byte-bounded LRU of report DataFrames, reloaded when the file changed."""
+
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self._entries = OrderedDict()  # (path, columns) -> (stamp, df, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, path: Path, columns=None):
+        """The parsed CSV, or None when the file does not exist."""
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (path, tuple(columns) if columns is not None else None)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        df = load_dataset(path, columns)
+        tag(df, f"{key}@{stamp}")  # memoized charts key on the file version, not the content
+        nbytes = frame_bytes(df)
+        with self._lock:
+            self.loads += 1
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= old[2]
+            self._entries[key] = (stamp, df, nbytes)
+            self._bytes += nbytes
+            # Evict the least recently used, but always keep the entry just loaded
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return df
+
+    def preload(self, base: Path) -> int:
+        count = 0
+        for path in sorted(Path(base).glob("*/*.csv")):
+            if self.get(path) is not None:
+                count += 1
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "megabytes": round(self._bytes / 2 ** 20, 1),
+                    "maxMegabytes": round(self.max_bytes / 2 ** 20, 1), "hits": self.hits, "loads": self.loads}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -30,6 +30,19 @@ _resolve_cypher_path() {
 
 ensure_dir() { mkdir -p "$1"; }
 
+# Runs the query binary; inside a pipeline run (E2E_RUN_ID set) each query is
+# recorded in the run manifest (wall time, rows, bytes).
+RUN_MANIFEST_BIN="${HELPER_DIR}/../pipeline/run_manifest.py"
+_run_query() {
+  local cypher_path="$1"; shift
+  if [[ -n "${E2E_RUN_ID:-}" ]] && command -v python3 >/dev/null 2>&1; then
+    python3 "${RUN_MANIFEST_BIN}" exec --stage cypher --name "${cypher_path#/**/cypher/}" --count-output -- \
+      "${EXECUTE_QUERY_BIN}" "$@"
+  else
+    "${EXECUTE_QUERY_BIN}" "$@"
+  fi
+}
+
 # --- Internal: append scope parameter if missing (bash 3.2-friendly) ----------
 # Note: Implemented inline in wrappers to avoid nameref/local -n (unsupported on bash 3.2).
 # -----------------------------------------------------------------------------
@@ -49,7 +62,7 @@ execute_cypher() {
     params+=("scopePackage=${SCOPE_PACKAGE:-}")
   fi
 
-  "${EXECUTE_QUERY_BIN}" "${cypher_path}" "${params[@]}"
+  _run_query "${cypher_path}" "${cypher_path}" "${params[@]}"
 }
 
 execute_cypher_no_src() {
@@ -66,7 +79,7 @@ execute_cypher_no_src() {
     params+=("scopePackage=${SCOPE_PACKAGE:-}")
   fi
 
-  "${EXECUTE_QUERY_BIN}" --no-source-reference-column "${cypher_path}" "${params[@]}"
+  _run_query "${cypher_path}" --no-source-reference-column "${cypher_path}" "${params[@]}"
 }
 
 execute_cypher_md() {
@@ -83,7 +96,7 @@ execute_cypher_md() {
     params+=("scopePackage=${SCOPE_PACKAGE:-}")
   fi
 
-  "${EXECUTE_QUERY_BIN}" --output-markdown-table "${cypher_path}" "${params[@]}"
+  _run_query "${cypher_path}" --output-markdown-table "${cypher_path}" "${params[@]}"
 }
 
 execute_cypher_http_number_of_lines_in_result() {
@@ -0,0 +1,72 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Post-scan enrichment: runs cypher/Enrichment/*.cypher in order. Each file
+# computes derived facts once (fan-in/out, inheritance depth, package
+# dependency weights, annotation categories, layers) in
+# batched apoc.periodic.iterate transactions and stores them as properties
+# the reports read.
+#
+# Idempotent. Skipped when the graph was already enriched for the current
+# scan (E2EScan.id, written by jqa-run.sh) with the current version (hash of
+# the enrichment Cypher files). E2E_FORCE_ENRICH=true re-runs it.
+#
+# --check only verifies the graph (used with E2E_SKIP_ENRICH=true): it fails
+# when the graph was never enriched, since the reports reading the enriched
+# properties would come out empty, and warns when it was enriched for
+# another scan or version.
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+SCRIPTS_DIR="$( cd "${SCRIPT_DIR}/.." && pwd -P )"
+REPO_ROOT="$( cd "${SCRIPTS_DIR}/.." && pwd -P )"
+CYPHER_DIR="${REPO_ROOT}/cypher"
+source "${SCRIPTS_DIR}/cypher/cypher-helpers.sh"
+
+ENRICH_DIR="${CYPHER_DIR}/Enrichment"
+FORCE="${E2E_FORCE_ENRICH:-false}"
+
+sha256_of() {
+  if command -v sha256sum >/dev/null 2>&1; then
+    sha256sum "$@" | awk '{print $1}'
+  else
+    shasum -a 256 "$@" | awk '{print $1}'
+  fi
+}
+
+version="$(cat "${ENRICH_DIR}"/*.cypher | sha256_of /dev/stdin | cut -c1-16)"
+
+# "scanId","enrichedScanId","enrichmentVersion"
+status="$(execute_cypher_no_src "${CYPHER_DIR}/Maintenance/Enrichment_Status.cypher" | tail -n 1 | tr -d '"')"
+IFS=, read -r scan_id enriched_scan_id enriched_version <<< "${status}"
+
+if [[ "${1:-}" == "--check" ]]; then
+  if [[ -z "${enriched_version}" ]]; then
+    echo "[error] The graph has not been enriched: reports reading fanIn/fanOut, inheritance depth," >&2
+    echo "[error] package dependency weights, annotation categories or layers would be empty." >&2
+    echo "[error] Run scripts/enrichment/enrich-graph.sh or unset E2E_SKIP_ENRICH." >&2
+    exit 1
+  fi
+  if [[ "${scan_id}" != "${enriched_scan_id}" || "${version}" != "${enriched_version}" ]]; then
+    echo "[warn] Graph enriched for scan ${enriched_scan_id} (version ${enriched_version}), current scan ${scan_id:-unknown} (version ${version}): enriched properties may be stale."
+  else
+    echo "Enrichment: up to date (scan ${scan_id}, version ${version})."
+  fi
+  exit 0
+fi
+
+if [[ "${FORCE}" != "true" && -n "${scan_id}" && "${scan_id}" == "${enriched_scan_id}" && "${version}" == "${enriched_version}" ]]; then
+  echo "Enrichment: up to date (scan ${scan_id}, version ${version}); skipping."
+  exit 0
+fi
+
+echo "Enrichment: $(date +'%Y-%m-%dT%H:%M:%S%z') Running (scan ${scan_id:-unknown}, version ${version})…"
+for cypher_file in "${ENRICH_DIR}"/*.cypher; do
+  start_s=$(date +%s)
+  result="$(execute_cypher_no_src "${cypher_file}" | tail -n 1)"
+  echo "  $(basename "${cypher_file}" .cypher): ${result} ($(( $(date +%s) - start_s ))s)"
+done
+
+execute_cypher_no_src "${CYPHER_DIR}/Maintenance/Mark_Enrichment.cypher" \
+  "scanId=${scan_id}" "version=${version}" >/dev/null
+echo "Enrichment: Done (version ${version})"
@@ -96,6 +96,73 @@ export E2E_AUTO_INSTALL_JQ="true"
 # export E2E_SKIP_SETUP="true"
 # export E2E_SKIP_NEO4J="true"
 # export E2E_SKIP_JQA="true"
+# export E2E_SKIP_ENRICH="true"
 # export E2E_SKIP_CSV="true"
+# export E2E_SKIP_WARMUP="true"
 # export E2E_SKIP_NOTEBOOKS="true"
-# export E2E_STOP_NEO4J="true"
\ No newline at end of file
+# export E2E_STOP_NEO4J="true"
+
+# Escaneo incremental de jQAssistant (solo re-escanea los .jar/.war/.ear que cambiaron)
+# export JQA_INCREMENTAL="true"
+
+# Cache de snapshots del grafo (neo4j-admin dump/load) por checksum de los inputs
+# export E2E_SCAN_CACHE="true"
+# export E2E_SCAN_CACHE_DIR="${ROOT_DIRECTORY}/runtime/scan-cache"
+# export E2E_SCAN_CACHE_KEEP="5"
+
+# Escaneo en paralelo por shards (una instancia Neo4j por shard, puertos +100 por shard)
+# export E2E_SHARDS="4"
+# export E2E_INSTANCE_HEAP="2g"
+# export E2E_INSTANCE_PAGECACHE="1g"
+
+# Memoria de Neo4j (por defecto: recomendación de neo4j-admin para el 60% de la RAM)
+# export NEO4J_MEMORY_SHARE="60"
+# export NEO4J_MEMORY_AUTO="false"
+# export NEO4J_HEAP_SIZE="8g"
+# export NEO4J_PAGECACHE_SIZE="12g"
+# export NEO4J_TX_MEMORY_MAX="6g"
+
+# Manifiesto de ejecución (tiempos y recursos por etapa, query y notebook)
+# export E2E_RUN_MANIFEST="false"
+# export E2E_RUN_TREND_LAST="5"
+# Queries de reportes perfiladas (PROFILE) para el hit ratio del page cache ("0" = todas)
+# export E2E_PAGECACHE_SAMPLE="12"
+
+# Reconstruir solo los CSV/notebooks cuyos inputs cambiaron (hash de contenido)
+# export E2E_DAG="true"
+# export E2E_DAG_JOBS="4"
+
+# Notebooks ejecutados en paralelo (un kernel por notebook)
+# export E2E_NOTEBOOK_JOBS="4"
+# Reutilizar los HTML de notebooks cuyos inputs no cambiaron ("false" = ejecutar siempre)
+# export E2E_NOTEBOOK_CACHE="true"
+# Ejecutor de notebooks: "kernel" (kernels reutilizados, una sola ejecución) o "nbconvert"
+# export E2E_NOTEBOOK_EXECUTOR="kernel"
+# export E2E_KERNEL_MAX_RUNS="0"
+# HTML livianos: plotly.js compartido en reports/notebooks/assets y gráficos de dispersión reducidos
+# export E2E_NOTEBOOK_LEAN="true"
+# Por encima de este número de filas los gráficos se agregan (heatmap, KDE, bins) y muestran solo los outliers
+# export E2E_PLOT_MAX_POINTS="5000"
+# Reportes: "notebooks" (Jupyter) o "site" (HTML estático desde interface/charts, sin kernels)
+# export E2E_REPORT_MODE="notebooks"
+# Procesos para exportar gráficos a PNG/SVG (python interface/export_images.py)
+# export E2E_IMAGE_JOBS="4"
+
+# Servicio de análisis en caliente (python interface/service.py)
+# export E2E_SERVICE_PORT="8765"
+# Memoria máxima (MB) de CSVs parseados que conservan el servicio y el dashboard Streamlit
+# export E2E_REPORT_CACHE_MB="1024"
+# Cantidad de gráficos y agregaciones memorizados por el dashboard (0 = sin caché)
+# export E2E_FIGURE_CACHE_SIZE="256"
+# Dashboard en vivo: "csv" (últimos reportes) o "live" (consultas Cypher contra Neo4j)
+# export E2E_DASHBOARD_SOURCE="csv"
+# Filas por consulta para los gráficos en vivo (0 = todas), segundos y cantidad de resultados en caché
+# export E2E_LIVE_ROW_LIMIT="50000"
+# export E2E_LIVE_TTL="600"
+# export E2E_LIVE_CACHE_ENTRIES="128"
+
+# Varios proyectos en paralelo (scripts/pipeline-run-projects.sh, una instancia Neo4j por proyecto)
+# export E2E_PROJECTS_FILE="${ROOT_DIRECTORY}/config/projects.json"
+# export E2E_PROJECTS_PARALLEL="2"
+# export E2E_PROJECTS_NICE="10"
+# export E2E_PROJECTS_KEEP_RUNNING="false"
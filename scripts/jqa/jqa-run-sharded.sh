@@ -0,0 +1,96 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Sharded scan: splits the archives of TARGET into E2E_SHARDS groups (balanced
+# by file size) and scans each group in parallel into its own local Neo4j
+# instance (scripts/neo4j/neo4j-instance.sh, instances shard-1..shard-N).
+# Reports are produced per shard and merged by scripts/reports/ShardedCsvReports.sh.
+
+ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
+TARGET="${1:-${REPO_TO_ANALYZE:?missing REPO_TO_ANALYZE}}"
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+SCRIPTS_DIR="$( cd "${SCRIPT_DIR}/.." && pwd -P )"
+JQA_RUN="${SCRIPT_DIR}/jqa-run.sh"
+NEO4J_INSTANCE="${SCRIPTS_DIR}/neo4j/neo4j-instance.sh"
+
+INSTANCES_DIR="${E2E_INSTANCES_DIR:-${ROOT_DIR}/runtime/instances}"
+SHARDS_FILE="${INSTANCES_DIR}/shards.txt"
+PORT_STEP="${E2E_SHARD_PORT_STEP:-100}"
+
+say() { printf '[%s] %s\n' "$(date +'%H:%M:%S')" "$*"; }
+cpu_count() { getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 2; }
+
+[[ -d "${TARGET}" ]] || { echo "Sharded scan needs a directory target: ${TARGET}"; exit 1; }
+TARGET="$(cd "${TARGET}" && pwd -P)"
+
+# Each shard runs two JVMs (Neo4j + jQAssistant)
+SHARDS="${E2E_SHARDS:-$(( $(cpu_count) / 2 ))}"
+
+# "<size> <path>" per archive, largest first
+ARCHIVES=()
+SIZES=()
+while IFS= read -r line; do
+  SIZES+=("${line%% *}")
+  ARCHIVES+=("${line#* }")
+done < <(
+  find "${TARGET}" -type f \( -name '*.jar' -o -name '*.war' -o -name '*.ear' \) | while IFS= read -r f; do
+    printf '%s %s\n' "$(wc -c < "${f}" | tr -d ' ')" "${f}"
+  done | sort -rn
+)
+
+[[ ${#ARCHIVES[@]} -gt 0 ]] || { echo "No archives found under ${TARGET}"; exit 1; }
+[[ "${SHARDS}" -lt 1 ]] && SHARDS=1
+[[ "${SHARDS}" -gt ${#ARCHIVES[@]} ]] && SHARDS=${#ARCHIVES[@]}
+
+# Greedy balancing: next largest archive goes to the least loaded shard
+LOADS=()
+LISTS=()
+for ((s = 0; s < SHARDS; s++)); do LOADS[s]=0; LISTS[s]=""; done
+for ((i = 0; i < ${#ARCHIVES[@]}; i++)); do
+  best=0
+  for ((s = 1; s < SHARDS; s++)); do
+    if [[ ${LOADS[s]} -lt ${LOADS[best]} ]]; then best=${s}; fi
+  done
+  LOADS[best]=$(( LOADS[best] + SIZES[i] ))
+  LISTS[best]="${LISTS[best]:+${LISTS[best]},}${ARCHIVES[i]}"
+done
+
+say "Sharded scan of ${#ARCHIVES[@]} archives into ${SHARDS} shards"
+mkdir -p "${INSTANCES_DIR}"
+: > "${SHARDS_FILE}"
+for ((s = 0; s < SHARDS; s++)); do
+  name="shard-$((s + 1))"
+  "${NEO4J_INSTANCE}" setup "${name}" $(( (s + 1) * PORT_STEP ))
+  echo "${LISTS[s]}" | tr ',' '\n' > "${INSTANCES_DIR}/${name}/archives.txt"
+  echo "${name}" >> "${SHARDS_FILE}"
+  "${NEO4J_INSTANCE}" start "${name}"
+done
+
+PIDS=()
+for ((s = 0; s < SHARDS; s++)); do
+  name="shard-$((s + 1))"
+  log_file="${INSTANCES_DIR}/${name}/jqa-run.log"
+  say "Scanning ${name} ($(wc -l < "${INSTANCES_DIR}/${name}/archives.txt" | tr -d ' ') archives) → ${log_file}"
+  (
+    # shellcheck disable=SC1090
+    source "${INSTANCES_DIR}/${name}/instance.env"
+    JQA_INCREMENTAL=false "${JQA_RUN}" "${LISTS[s]}"
+  ) > "${log_file}" 2>&1 &
+  PIDS+=($!)
+done
+
+failed=0
+for ((s = 0; s < SHARDS; s++)); do
+  if wait "${PIDS[s]}"; then
+    say "shard-$((s + 1)) scanned"
+  else
+    say "ERROR: shard-$((s + 1)) scan failed, see ${INSTANCES_DIR}/shard-$((s + 1))/jqa-run.log"
+    failed=1
+  fi
+done
+[[ ${failed} -eq 0 ]] || exit 1
+
+say "Sharded scan done. Shards: ${SHARDS_FILE}"
@@ -2,6 +2,13 @@
 set -euo pipefail
 
 # Requires: source scripts/env.sh
+#
+# Incremental mode (JQA_INCREMENTAL=true, TARGET must be a directory):
+#   A sha256 manifest of the archives under TARGET is kept next to the jQA report.
+#   On the next run only archives whose checksum changed (or that were added)
+#   are rescanned; the subgraphs of changed and removed archives are deleted
+#   first. Unchanged archives are not touched. Without a usable manifest a
+#   full scan is done and the manifest is written afterwards.
 
 ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
 TOOLS_DIR="${TOOLS_DIRECTORY:?missing TOOLS_DIRECTORY}"
@@ -13,22 +20,132 @@ WORK_DIR="${ROOT_DIR}/jqassistant"
 CONF_MAIN="${WORK_DIR}/.jqassistant.yml"
 TARGET="${1:-${REPO_TO_ANALYZE:?missing REPO_TO_ANALYZE}}"
 
+JQA_INCREMENTAL="${JQA_INCREMENTAL:-false}"
+MANIFEST="${JQA_SCAN_MANIFEST:-${ROOT_DIR}/runtime/jqassistant/scan-manifest.sha256}"
+MAINTENANCE_CYPHER_DIR="${ROOT_DIR}/cypher/Maintenance"
+
+# Report directory override (e.g. one per shard instance); empty keeps .jqassistant.yml's
+ANALYZE_OPTS=()
+[[ -n "${JQA_REPORT_DIR:-}" ]] && ANALYZE_OPTS+=("-Djqassistant.analyze.report.directory=${JQA_REPORT_DIR}")
+
 [[ -x "${JQA_HOME}/bin/jqassistant" ]] || { echo "jQAssistant CLI not installed. Run scripts/setupJQAssistant.sh"; exit 1; }
 [[ -d "${WORK_DIR}" ]] || { echo "Missing jqassistant directory: ${WORK_DIR}"; exit 1; }
 [[ -f "${CONF_MAIN}" ]] || { echo "Config not found: ${CONF_MAIN}"; exit 1; }
 
+sha256_of() {
+  if command -v sha256sum >/dev/null 2>&1; then
+    sha256sum "$1" | awk '{print $1}'
+  else
+    shasum -a 256 "$1" | awk '{print $1}'
+  fi
+}
+
+# Prints "# target: <dir>" followed by "<sha256>  <path relative to dir>" per archive, sorted
+build_manifest() {
+  local target="$1" rel
+  echo "# target: ${target}"
+  ( cd "${target}" && find . -type f \( -name '*.jar' -o -name '*.war' -o -name '*.ear' \) ) \
+    | sed 's|^\./||' | LC_ALL=C sort \
+    | while IFS= read -r rel; do
+        printf '%s  %s\n' "$(sha256_of "${target}/${rel}")" "${rel}"
+      done
+}
+
+# Entries (without header) of a manifest, sorted for comm
+manifest_entries() { grep -v '^#' "$1" | LC_ALL=C sort || true; }
+entry_path() { sed 's/^[0-9a-f]*  //'; }
+
+SCANNED="true"
+
+full_scan() {
+  # Scan target (jar files, dirs, etc.)
+  "${JQA_HOME}/bin/jqassistant" scan -f "${TARGET}"
+
+  # Analyze according to rules in the config
+  "${JQA_HOME}/bin/jqassistant" analyze ${ANALYZE_OPTS[@]+"${ANALYZE_OPTS[@]}"}
+}
+
 echo "Working dir: ${WORK_DIR}"
 echo "Using config: ${CONF_MAIN}"
 echo "Scanning: ${TARGET}"
 
 pushd "${WORK_DIR}" >/dev/null
 
-# Scan target (jar files, dirs, etc.)
-"${JQA_HOME}/bin/jqassistant" scan -f "${TARGET}"
+if [[ "${JQA_INCREMENTAL}" != "true" || ! -d "${TARGET}" ]]; then
+  [[ "${JQA_INCREMENTAL}" == "true" ]] && echo "Incremental scan needs a directory target; running a full scan."
+  # A full scan resets the graph, so any previous manifest no longer describes it
+  rm -f "${MANIFEST}"
+  full_scan
+else
+  TARGET="$(cd "${TARGET}" && pwd -P)"
+  mkdir -p "$(dirname "${MANIFEST}")"
+  NEW_MANIFEST="${MANIFEST}.new"
+  build_manifest "${TARGET}" > "${NEW_MANIFEST}"
+
+  source "${ROOT_DIR}/scripts/cypher/cypher-helpers.sh"
+
+  mode="full"
+  if [[ ! -f "${MANIFEST}" ]]; then
+    echo "No scan manifest found; running a full scan."
+  elif [[ "$(head -n 1 "${MANIFEST}")" != "$(head -n 1 "${NEW_MANIFEST}")" ]]; then
+    echo "Scan manifest belongs to another target; running a full scan."
+  elif [[ "$(execute_cypher_no_src "${MAINTENANCE_CYPHER_DIR}/Count_Scanned_Artifacts.cypher" | tail -n 1 | tr -d '"')" == "0" ]]; then
+    echo "No scanned artifacts in the graph; running a full scan."
+  else
+    mode="incremental"
+  fi
+
+  if [[ "${mode}" == "full" ]]; then
+    rm -f "${MANIFEST}"
+    full_scan
+  else
+    # Old entries missing from the new manifest: changed or removed archives
+    to_delete="$(comm -23 <(manifest_entries "${MANIFEST}") <(manifest_entries "${NEW_MANIFEST}") | entry_path)"
+    # New entries missing from the old manifest: changed or added archives
+    to_scan="$(comm -13 <(manifest_entries "${MANIFEST}") <(manifest_entries "${NEW_MANIFEST}") | entry_path)"
+
+    if [[ -z "${to_delete}" && -z "${to_scan}" ]]; then
+      echo "No archive changed since the last scan; skipping scan and analyze."
+      SCANNED="false"
+    else
+      echo "Incremental scan: $(printf '%s' "${to_delete}" | grep -c . || true) artifact(s) to remove," \
+           "$(printf '%s' "${to_scan}" | grep -c . || true) artifact(s) to scan"
+
+      while IFS= read -r rel; do
+        [[ -n "${rel}" ]] || continue
+        echo "Removing subgraph of ${rel}"
+        execute_cypher_no_src "${MAINTENANCE_CYPHER_DIR}/Delete_Artifact_Subgraph.cypher" \
+          "relativeFileName=/${rel}" "absoluteFileName=${TARGET}/${rel}"
+      done <<< "${to_delete}"
+
+      if [[ -n "${to_scan}" ]]; then
+        scan_list=""
+        while IFS= read -r rel; do
+          [[ -n "${rel}" ]] || continue
+          scan_list="${scan_list:+${scan_list},}${TARGET}/${rel}"
+        done <<< "${to_scan}"
+        "${JQA_HOME}/bin/jqassistant" scan -f "${scan_list}" -Djqassistant.scan.reset=false
+      fi
+
+      # Concepts are already recorded as applied; re-run them so derived
+      # relationships (RESOLVES_TO, DEPENDS_ON) cover the rescanned artifacts
+      "${JQA_HOME}/bin/jqassistant" analyze -Djqassistant.analyze.execute-applied-concepts=true \
+        ${ANALYZE_OPTS[@]+"${ANALYZE_OPTS[@]}"}
+    fi
+  fi
+
+  # Only written after a successful scan, so a failed run is retried next time
+  mv "${NEW_MANIFEST}" "${MANIFEST}"
+  echo "Scan manifest: ${MANIFEST}"
+fi
 
-# Analyze according to rules in the config
-"${JQA_HOME}/bin/jqassistant" analyze
+# Mark the graph with a new scan id; the enrichment stage re-runs when it changes
+if [[ "${SCANNED}" == "true" ]]; then
+  source "${ROOT_DIR}/scripts/cypher/cypher-helpers.sh"
+  execute_cypher_no_src "${MAINTENANCE_CYPHER_DIR}/Mark_Scan.cypher" \
+    "scanId=$(date +%Y%m%d%H%M%S)-$$-${RANDOM}" >/dev/null
+fi
 
 popd >/dev/null
 
-echo "Reports at: ${ROOT_DIR}/runtime/jqassistant/report"
+echo "Reports at: ${JQA_REPORT_DIR:-${ROOT_DIR}/runtime/jqassistant/report}"
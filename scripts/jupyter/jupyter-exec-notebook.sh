@@ -2,6 +2,12 @@
 set -euo pipefail
 
 # Usage: scripts/jupyter/jupyter-exec-notebook.sh <notebook.ipynb> [<output_dir>]
+#
+# Outputs are reused when the notebook and everything it reads (CSVs, chart
+# modules, Cypher files, export options) are unchanged since the last
+# successful run (see notebook_cache.py). E2E_NOTEBOOK_CACHE=false always executes.
+# The notebook is executed once by notebook_executor.py and exported from
+# memory; E2E_NOTEBOOK_EXECUTOR=nbconvert uses `jupyter nbconvert` instead.
 
 # Resolve script dir (bash/zsh)
 if [[ -n "${BASH_SOURCE:-}" ]]; then _SELF="${BASH_SOURCE[0]}"; elif [[ -n "${ZSH_VERSION:-}" ]]; then _SELF="${(%):-%N}"; else _SELF="$0"; fi
@@ -36,6 +42,23 @@ if [[ -n "${NEO4J_INITIAL_PASSWORD:-}" && ! -f "${NB_DIR}/.env" ]]; then
   printf "NEO4J_INITIAL_PASSWORD=%s\n" "${NEO4J_INITIAL_PASSWORD}" > "${NB_DIR}/.env"
 fi
 
+if [[ "${E2E_NOTEBOOK_EXECUTOR:-kernel}" == "kernel" ]] \
+   && python3 -c "import nbclient, jupyter_client, nbconvert" >/dev/null 2>&1; then
+  exec python3 "${SCRIPT_DIR}/notebook_executor.py" --out-dir "${OUT_DIR}" "${ABS_NOTEBOOK}"
+fi
+
+NB_CACHE="${SCRIPT_DIR}/notebook_cache.py"
+E2E_NOTEBOOK_CACHE="${E2E_NOTEBOOK_CACHE:-true}"
+command -v python3 >/dev/null 2>&1 || E2E_NOTEBOOK_CACHE="false"
+if [[ "$E2E_NOTEBOOK_CACHE" == "true" ]] && python3 "$NB_CACHE" check "$ABS_NOTEBOOK" "$OUT_DIR"; then
+  echo "[cache] ${NB_FILE} unchanged, reusing outputs:"
+  for f in "${OUT_IPYNB}" "${OUT_HTML}" "${OUT_MD}"; do
+    [[ -f "$f" ]] && echo "  $f"
+  done
+  exit 0
+fi
+rm -f "${OUT_DIR}/.${NB_NAME}.cache.json"
+
 ENABLE_NOTEBOOK_IPYNB="${ENABLE_NOTEBOOK_IPYNB:-false}"
 ENABLE_NOTEBOOK_MD="${ENABLE_NOTEBOOK_MD:-false}"
 
@@ -67,6 +90,8 @@ else
   fi
 fi
 
+[[ "$E2E_NOTEBOOK_CACHE" == "true" ]] && python3 "$NB_CACHE" record "$ABS_NOTEBOOK" "$OUT_DIR"
+
 echo "outputs:"
 [[ -f "${OUT_IPYNB}" ]] && echo "  ${OUT_IPYNB}"
 echo "  ${OUT_HTML}"
@@ -2,12 +2,23 @@
 set -euo pipefail
 
 # Usage: scripts/jupyter/jupyter-run-notebooks.sh
+#
+# Notebooks run concurrently, at most E2E_NOTEBOOK_JOBS at a time (one kernel
+# each; default: number of CPUs, capped at 4). Each notebook logs to
+# <out_dir>/<name>.log; the per-notebook results are printed at the end.
+#
+# By default they run in notebook_executor.py: E2E_NOTEBOOK_JOBS kernels are
+# started once and reused, and every notebook is executed a single time.
+# E2E_NOTEBOOK_EXECUTOR=nbconvert (or a Python without nbclient) falls back to
+# one jupyter-exec-notebook.sh process per notebook.
 
 # Resolve script dir (bash/zsh)
 if [[ -n "${BASH_SOURCE:-}" ]]; then _SELF="${BASH_SOURCE[0]}"; elif [[ -n "${ZSH_VERSION:-}" ]]; then _SELF="${(%):-%N}"; else _SELF="$0"; fi
 SCRIPT_DIR="$(cd "$(dirname -- "$_SELF")" && pwd -P)"
 REPO_ROOT="${ROOT_DIRECTORY:-$(cd "$SCRIPT_DIR/../.." && pwd -P)}"
 EXEC_ONE="${SCRIPT_DIR}/jupyter-exec-notebook.sh"
+RUN_MANIFEST_BIN="${SCRIPT_DIR}/../pipeline/run_manifest.py"
+EXECUTOR="${SCRIPT_DIR}/notebook_executor.py"
 
 [[ -x "$EXEC_ONE" ]] || { echo "[error] Missing or non-executable: $EXEC_ONE"; exit 1; }
 
@@ -18,35 +29,110 @@ NB_DIRS=(
 OUT_BASE="${REPORTS_DIRECTORY:-${REPO_ROOT}/reports}/notebooks"
 mkdir -p "$OUT_BASE"
 
+cpu_count() { getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 2; }
+JOBS="${E2E_NOTEBOOK_JOBS:-$(cpu_count)}"
+[[ -n "${E2E_NOTEBOOK_JOBS:-}" || "$JOBS" -le 4 ]] || JOBS=4
+[[ "$JOBS" -ge 1 ]] || JOBS=1
+
+# Kernels already run side by side: keep each one's numeric libraries single-threaded
+if [[ "$JOBS" -gt 1 ]]; then
+  export OMP_NUM_THREADS="${OMP_NUM_THREADS:-1}"
+  export OPENBLAS_NUM_THREADS="${OPENBLAS_NUM_THREADS:-1}"
+  export MKL_NUM_THREADS="${MKL_NUM_THREADS:-1}"
+fi
+
 run_one() {
   local nb_path="$1"
   local nb_file nb_stem out_dir
   nb_file="$(basename -- "$nb_path")"
   nb_stem="${nb_file%.*}"
   out_dir="${OUT_BASE}/${nb_stem}"
-  mkdir -p "$out_dir"
-  echo "[run] $nb_file -> $out_dir"
-  if "$EXEC_ONE" "$nb_path" "$out_dir"; then
-    echo "[ok]  $nb_file"
-  else
-    echo "[warn] Failed: $nb_file"
+  # Inside a pipeline run (E2E_RUN_ID set) record time/CPU/RSS/output size per notebook
+  local runner=()
+  if [[ -n "${E2E_RUN_ID:-}" ]]; then
+    runner=(python3 "$RUN_MANIFEST_BIN" exec --stage notebook --name "$nb_stem" --output-path "$out_dir" --)
   fi
+  ${runner[@]+"${runner[@]}"} "$EXEC_ONE" "$nb_path" "$out_dir"
 }
 
-found_any="false"
-
+NOTEBOOKS=()
 for dir in "${NB_DIRS[@]}"; do
   [[ -d "$dir" ]] || continue
   notebooks="$(find "$dir" -maxdepth 1 -type f -name "*.ipynb" | sort)"
   [[ -n "$notebooks" ]] || { echo "[info] No notebooks in: $dir"; continue; }
-  found_any="true"
   for nb in $notebooks; do
-    run_one "$nb"
+    NOTEBOOKS+=("$nb")
+    # Written here once instead of racing in the concurrent executions
+    if [[ -n "${NEO4J_INITIAL_PASSWORD:-}" && ! -f "${dir}/.env" ]]; then
+      printf "NEO4J_INITIAL_PASSWORD=%s\n" "${NEO4J_INITIAL_PASSWORD}" > "${dir}/.env"
+    fi
   done
 done
 
-if [[ "$found_any" != "true" ]]; then
+if [[ ${#NOTEBOOKS[@]} -eq 0 ]]; then
   echo "[warn] No notebooks found."
+  echo "[done] jupyter-run-notebooks.sh finished."
+  exit 0
 fi
 
+if [[ "${E2E_NOTEBOOK_EXECUTOR:-kernel}" == "kernel" ]] \
+   && python3 -c "import nbclient, jupyter_client, nbconvert" >/dev/null 2>&1; then
+  export PLOTLY_RENDERER="${PLOTLY_RENDERER:-notebook_connected}"
+  echo "[info] ${#NOTEBOOKS[@]} notebooks, ${JOBS} pooled kernels"
+  python3 "$EXECUTOR" --jobs "$JOBS" --out-base "$OUT_BASE" "${NOTEBOOKS[@]}" || true
+  echo "[done] jupyter-run-notebooks.sh finished."
+  exit 0
+fi
+
+# -------- Pool (bash 3.2: no wait -n, poll the running jobs) --------
+RUN_PIDS=(); RUN_IDX=()
+RESULTS=()
+next=0
+
+log_of() {
+  local nb_file
+  nb_file="$(basename -- "$1")"
+  echo "${OUT_BASE}/${nb_file%.*}/${nb_file%.*}.log"
+}
+
+reap() {
+  local k idx nb_file alive_pids=() alive_idx=()
+  for ((k = 0; k < ${#RUN_PIDS[@]}; k++)); do
+    idx="${RUN_IDX[k]}"
+    nb_file="$(basename -- "${NOTEBOOKS[idx]}")"
+    if kill -0 "${RUN_PIDS[k]}" 2>/dev/null; then
+      alive_pids+=("${RUN_PIDS[k]}"); alive_idx+=("$idx")
+    elif wait "${RUN_PIDS[k]}"; then
+      echo "[ok]  $nb_file"
+      RESULTS[idx]="ok"
+    else
+      echo "[warn] Failed: $nb_file (see $(log_of "${NOTEBOOKS[idx]}"))"
+      RESULTS[idx]="failed"
+    fi
+  done
+  RUN_PIDS=(${alive_pids[@]+"${alive_pids[@]}"}); RUN_IDX=(${alive_idx[@]+"${alive_idx[@]}"})
+}
+
+echo "[info] ${#NOTEBOOKS[@]} notebooks, ${JOBS} at a time"
+while [[ $next -lt ${#NOTEBOOKS[@]} || ${#RUN_PIDS[@]} -gt 0 ]]; do
+  while [[ $next -lt ${#NOTEBOOKS[@]} && ${#RUN_PIDS[@]} -lt $JOBS ]]; do
+    nb="${NOTEBOOKS[next]}"
+    mkdir -p "$(dirname -- "$(log_of "$nb")")"
+    echo "[run] $(basename -- "$nb") -> $(dirname -- "$(log_of "$nb")")"
+    run_one "$nb" > "$(log_of "$nb")" 2>&1 &
+    RUN_PIDS+=($!); RUN_IDX+=("$next")
+    next=$((next + 1))
+  done
+  sleep 1
+  reap
+done
+
+FAILED=0
+echo "[summary]"
+for ((i = 0; i < ${#NOTEBOOKS[@]}; i++)); do
+  printf '  %-7s %s\n' "${RESULTS[i]}" "$(basename -- "${NOTEBOOKS[i]}")"
+  [[ "${RESULTS[i]}" == "ok" ]] || FAILED=$((FAILED + 1))
+done
+[[ $FAILED -eq 0 ]] || echo "[warn] ${FAILED} of ${#NOTEBOOKS[@]} notebooks failed."
+
 echo "[done] jupyter-run-notebooks.sh finished."
@@ -0,0 +1,292 @@
+"""Lean HTML for notebook reports: shared plotly.js, decimated and compressed figures.
+
+With the default renderer every figure carries its full trace data as plain
+JSON, plus a plotly.js loader, in every page. In lean mode (E2E_NOTEBOOK_LEAN,
+the default of notebook_executor.py) kernels render figures as
+application/vnd.plotly.v1+json only and, for the HTML export, each figure is
+replaced by a placeholder that:
+  - uses one plotly.js bundle written once to <notebooks>/assets/ and shared by
+    all report pages (cached by the browser after the first page);
+  - has traces above E2E_PLOT_MAX_POINTS points thinned, with a note under the
+    chart: marker-only scatters of numeric x/y on a grid (one point per cell, so
+    the spread and the outliers survive), lines and categorical x with
+    largest-triangle-three-buckets (LTTB, keeps the peaks of the curve);
+  - embeds the figure as gzip + base64 JSON, inflated and drawn by the browser
+    when the chart scrolls into view.
+The IPYNB export keeps the full figures.
+"""
+import base64
+import copy
+import gzip
+import html
+import json
+import math
+import numbers
+import os
+from pathlib import Path
+import uuid
+
+PLOTLY_MIME = "application/vnd.plotly.v1+json"
+ASSETS_DIR_NAME = "assets"
+# Typed-array dtypes of plotly's JSON encoding (plotly >= 6) → numpy dtypes
+TYPED_DTYPES = {"i1", "u1", "i2", "u2", "i4", "u4", "f4", "f8"}
+
+PAGE_SCRIPT = """<script>
+(function () {
+  async function inflate(b64) {
+    const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    return JSON.parse(await new Response(stream).text());
+  }
+  async function draw(el) {
+    const fig = await inflate(document.getElementById(el.dataset.figure).textContent.trim());
+    Plotly.newPlot(el, fig.data || [], fig.layout || {}, Object.assign({responsive: true}, fig.config || {}));
+  }
+  function init() {
+    const plots = document.querySelectorAll("div.e2e-plot");
+    if (!("IntersectionObserver" in window)) { plots.forEach(draw); return; }
+    const seen = new IntersectionObserver(entries => entries.forEach(e => {
+      if (e.isIntersecting) { seen.unobserve(e.target); draw(e.target); }
+    }), {rootMargin: "200px"});
+    plots.forEach(el => seen.observe(el));
+  }
+  if (document.readyState === "loading") document.addEventListener("DOMContentLoaded", init); else init();
+})();
+</script>"""
+
+
+def enabled() -> bool:
+    return os.environ.get("E2E_NOTEBOOK_LEAN", "true") == "true"
+
+
+def max_points() -> int:
+    return int(os.environ.get("E2E_PLOT_MAX_POINTS", "5000"))
+
+
+def ensure_bundle(assets_dir: Path) -> str:
+    """Write plotly.js for the installed plotly version once; returns its file name."""
+    import plotly
+    from plotly.offline import get_plotlyjs
+
+    name = f"plotly-{plotly.__version__}.min.js"
+    target = assets_dir / name
+    if not target.is_file():
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{name}.{os.getpid()}.tmp")
+        tmp.write_text(get_plotlyjs(), encoding="utf-8")
+        os.replace(tmp, target)
+    return name
+
+
+# ----------------------------------------------------------------------
+# Decimation
+# ----------------------------------------------------------------------
+
+def _is_typed(value) -> bool:
+    return isinstance(value, dict) and value.get("dtype") in TYPED_DTYPES and "bdata" in value
+
+
+def _decode(value):
+    """numpy array of a typed array (or list) value."""
+    import numpy as np
+
+    if _is_typed(value):
+        arr = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+        shape = value.get("shape")
+        if shape:
+            arr = arr.reshape([int(s) for s in str(shape).split(",")])
+        return arr
+    return np.asarray(value, dtype=object)
+
+
+def _length(value):
+    if isinstance(value, list):
+        return len(value)
+    if _is_typed(value):
+        shape = value.get("shape")
+        if shape:
+            return int(str(shape).split(",")[0])
+        return len(base64.b64decode(value["bdata"])) // int(value["dtype"][1:])
+    return None
+
+
+def _take(value, keep):
+    if isinstance(value, list):
+        return [value[i] for i in keep]
+    arr = _decode(value)[keep]
+    out = {"dtype": value["dtype"], "bdata": base64.b64encode(arr.tobytes()).decode("ascii")}
+    if arr.ndim > 1:
+        out["shape"] = ",".join(str(s) for s in arr.shape)
+    return out
+
+
+def _numeric(value):
+    """float array of a numeric axis; None for categories (strings, even digit-only ones) or dates."""
+    import numpy as np
+
+    if isinstance(value, list) and not all(
+            v is None or (isinstance(v, numbers.Real) and not isinstance(v, bool)) for v in value):
+        return None
+    try:
+        arr = _decode(value).astype(float)
+    except (TypeError, ValueError):
+        return None
+    return arr if arr.ndim == 1 and np.isfinite(arr).any() else None
+
+
+def _finite(arr):
+    import numpy as np
+
+    return np.where(np.isfinite(arr), arr, 0.0)
+
+
+def stride_indices(n: int, limit: int) -> list:
+    """`limit` evenly spaced indices, first and last included."""
+    import numpy as np
+
+    return np.unique(np.linspace(0, n - 1, max(limit, 2)).round().astype(np.int64)).tolist()
+
+
+def lttb_indices(x, y, limit: int) -> list:
+    """Largest-triangle-three-buckets: `limit` indices keeping the shape of a line.
+
+    The first and last points are kept; in between, one point per bucket of
+    consecutive points, the one forming the largest triangle with the point
+    kept before and the mean of the next bucket. x may be None (positions).
+    """
+    import numpy as np
+
+    n = len(y)
+    if limit < 3:
+        return stride_indices(n, limit)
+    x = np.arange(n, dtype=float) if x is None else _finite(x)
+    y = _finite(y)
+    edges = np.linspace(1, n - 1, limit - 1).astype(np.int64)
+    keep, a = [0], 0
+    for i in range(limit - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nlo, nhi = hi, (edges[i + 2] if i + 2 < limit - 1 else n)
+        nhi = max(nhi, nlo + 1)
+        avg_x, avg_y = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = int(lo + area.argmax())
+        keep.append(a)
+    keep.append(n - 1)
+    return sorted(set(keep))
+
+
+def is_marker_scatter(trace: dict) -> bool:
+    """Markers only (plotly draws lines for scatters of 20+ points without a mode)."""
+    mode = trace.get("mode") or "lines"
+    return "markers" in mode and "lines" not in mode
+
+
+def thin_indices(x, y, limit: int, markers: bool = True) -> list:
+    """Indices of at most `limit` points.
+
+    Marker scatters with numeric x and y keep one point per occupied cell of a
+    grid, which starts at sqrt(limit) cells per axis and is refined while
+    skewed data leaves most cells empty. Lines and non-numeric x use LTTB
+    (a grid would keep one point per cell crossed by the line, far fewer than
+    `limit`); without a numeric y, an even stride.
+    """
+    import numpy as np
+
+    n = len(x) if x is not None else len(y)
+    if y is None:
+        return stride_indices(n, limit)
+    if x is None or not markers:
+        return lttb_indices(x, y, limit)
+    scaled = []
+    for arr in (x, y):
+        finite = np.isfinite(arr)
+        arr = np.where(finite, arr, arr[finite].min())
+        lo, hi = arr.min(), arr.max()
+        scaled.append((arr - lo) / ((hi - lo) or 1.0))
+
+    side = max(int(math.sqrt(limit)), 1)
+    best = None
+    while side <= n * 2:  # points along a curve occupy about `side` cells: keep refining
+        cx = np.minimum((scaled[0] * side).astype(np.int64), side - 1)
+        cy = np.minimum((scaled[1] * side).astype(np.int64), side - 1)
+        _, first = np.unique(cx * side + cy, return_index=True)
+        if len(first) > limit:
+            break
+        best = first
+        if len(first) >= limit * 0.8:
+            break
+        side = int(side * 1.5) + 1
+    return sorted(best.tolist())
+
+
+def decimate_trace(trace: dict, limit: int):
+    """Thin a trace in place; returns (points before, points after)."""
+    n = _length(trace.get("x")) or _length(trace.get("y"))
+    if not n or n <= limit or trace.get("type", "scatter") not in ("scatter", "scattergl"):
+        return n or 0, n or 0
+    x = _numeric(trace["x"]) if "x" in trace else None
+    y = _numeric(trace["y"]) if "y" in trace else None
+    keep = thin_indices(x, y, limit, markers=is_marker_scatter(trace))
+
+    def thin(node: dict):
+        for key, value in list(node.items()):
+            if isinstance(value, dict) and not _is_typed(value):
+                thin(value)
+            elif _length(value) == n:
+                node[key] = _take(value, keep)
+
+    thin(trace)
+    return n, len(keep)
+
+
+def decimate_figure(fig: dict, limit: int):
+    """Copy of the figure with large scatter traces thinned, and (points before, after)."""
+    fig = copy.deepcopy(fig)
+    before = after = 0
+    for trace in fig.get("data", []):
+        b, a = decimate_trace(trace, limit)
+        before += b
+        after += a
+    return fig, before, after
+
+
+# ----------------------------------------------------------------------
+# Notebook / page
+# ----------------------------------------------------------------------
+
+def figure_html(fig: dict, limit: int) -> str:
+    fig, before, after = decimate_figure(fig, limit)
+    payload = base64.b64encode(gzip.compress(json.dumps(fig, separators=(",", ":")).encode("utf-8"))).decode("ascii")
+    fig_id = f"fig-{uuid.uuid4().hex[:12]}"
+    height = (fig.get("layout") or {}).get("height") or 450
+    note = ""
+    if after < before:
+        note = (f'<p style="font-size:smaller;color:#666">Showing {after:,} of {before:,} points '
+                f'(thinned for display; the CSV has all of them).</p>')
+    return (f'<div class="e2e-plot" data-figure="{fig_id}" style="width:100%;min-height:{int(height)}px"></div>'
+            f'<script type="application/gzip+base64" id="{fig_id}">{payload}</script>{note}')
+
+
+def lean_notebook(nb, limit: int = None):
+    """Copy of an executed notebook whose plotly outputs are lean placeholders."""
+    limit = limit or max_points()
+    nb = copy.deepcopy(nb)
+    for cell in nb.get("cells", []):
+        for output in cell.get("outputs", []):
+            data = output.get("data") or {}
+            if PLOTLY_MIME in data:
+                output["data"] = {"text/html": figure_html(data[PLOTLY_MIME], limit)}
+    return nb
+
+
+def page_head(bundle_src: str) -> str:
+    return f'<script src="{html.escape(bundle_src)}"></script>\n{PAGE_SCRIPT}\n'
+
+
+def inject_head(page: str, head: str) -> str:
+    """Insert at the start of <head>, before require.js can claim plotly's AMD define."""
+    marker = page.find("<head>")
+    if marker < 0:
+        return head + page
+    marker += len("<head>")
+    return page[:marker] + "\n" + head + page[marker:]
@@ -0,0 +1,147 @@
+"""Output cache for executed notebooks.
+
+A notebook is re-executed only when something it reads changed. Its key
+covers the notebook source, every CSV under csv-reports/<CATEGORY>/ plus
+the CSVs of other categories it names, the chart/utils modules it imports,
+the Cypher files it runs and the export options. Notebooks that query the
+graph directly also depend on the scan manifest (JQA_SCAN_MANIFEST); when
+there is none they are never cached.
+
+After a successful execution `record` writes <out_dir>/.<name>.cache.json
+with the key and the hashes of the exported files; `check` exits 0 when the
+key still matches and those files are unchanged.
+
+Usage:
+  notebook_cache.py check  <notebook.ipynb> <out_dir>
+  notebook_cache.py record <notebook.ipynb> <out_dir>
+  notebook_cache.py key    <notebook.ipynb>
+"""
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(REPO_ROOT / "scripts" / "pipeline"))
+
+from stage_dag import CHUNK_SIZE, ENRICH, UTILS_DIR, _key, csv_base, notebook_inputs  # noqa: E402
+
+JUPYTER_SCRIPTS = Path(__file__).resolve().parent
+# The exporters shape the outputs as much as the inputs do
+EXPORTERS = [JUPYTER_SCRIPTS / "jupyter-exec-notebook.sh", JUPYTER_SCRIPTS / "notebook_executor.py",
+             JUPYTER_SCRIPTS / "lean_html.py"]
+OPTIONS = ("JUPYTER_OUTPUT_FILE_POSTFIX", "ENABLE_NOTEBOOK_IPYNB", "ENABLE_NOTEBOOK_MD", "PLOTLY_RENDERER",
+           "E2E_NOTEBOOK_EXECUTOR", "E2E_NOTEBOOK_LEAN", "E2E_PLOT_MAX_POINTS")
+
+
+def file_hash(path: Path) -> str:
+    if not path.is_file():
+        return "missing"
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
+
+
+def scan_manifest() -> Path:
+    return Path(os.environ.get("JQA_SCAN_MANIFEST")
+                or REPO_ROOT / "runtime" / "jqassistant" / "scan-manifest.sha256")
+
+
+def input_files(nb_path: Path):
+    """Files the notebook output depends on, or None when it cannot be cached."""
+    found = notebook_inputs(nb_path)
+    base = csv_base()
+    files = {nb_path, *EXPORTERS}
+    for csv in found["csvs"]:
+        files.add(base / csv)
+    if found["category"]:
+        files.update(sorted((base / found["category"]).glob("*.csv")))
+    files.update(found["cyphers"])
+    if found["modules"]:
+        files.update(found["modules"])
+        files.update(UTILS_DIR.glob("*.py"))
+    if found["uses_graph"]:
+        if not scan_manifest().is_file():
+            return None
+        files.update({scan_manifest(), ENRICH})
+    return sorted(files)
+
+
+def cache_key(nb_path: Path):
+    files = input_files(nb_path)
+    if files is None:
+        return None
+    h = hashlib.sha256()
+    for path in files:
+        h.update(f"{_key(path)}={file_hash(path)}\n".encode("utf-8"))
+    for name in OPTIONS:
+        h.update(f"{name}={os.environ.get(name, '')}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def expected_outputs(nb_path: Path, out_dir: Path) -> list:
+    name = nb_path.stem + os.environ.get("JUPYTER_OUTPUT_FILE_POSTFIX", "")
+    outputs = [out_dir / f"{name}.html"]
+    if os.environ.get("ENABLE_NOTEBOOK_IPYNB", "false") == "true":
+        outputs.append(out_dir / f"{name}.ipynb")
+    if os.environ.get("ENABLE_NOTEBOOK_MD", "false") == "true":
+        outputs.append(out_dir / f"{name}.md")
+    return outputs
+
+
+def stamp_path(nb_path: Path, out_dir: Path) -> Path:
+    return out_dir / f".{nb_path.stem}.cache.json"
+
+
+def check(nb_path: Path, out_dir: Path) -> bool:
+    stamp = stamp_path(nb_path, out_dir)
+    if not stamp.is_file():
+        return False
+    try:
+        recorded = json.loads(stamp.read_text(encoding="utf-8"))
+    except ValueError:
+        return False
+    key = cache_key(nb_path)
+    if key is None or recorded.get("key") != key:
+        return False
+    outputs = recorded.get("outputs", {})
+    return all(outputs.get(p.name) == file_hash(p) != "missing" for p in expected_outputs(nb_path, out_dir))
+
+
+def record(nb_path: Path, out_dir: Path):
+    stamp = stamp_path(nb_path, out_dir)
+    key = cache_key(nb_path)
+    if key is None:
+        stamp.unlink(missing_ok=True)
+        return
+    outputs = {p.name: file_hash(p) for p in expected_outputs(nb_path, out_dir) if p.is_file()}
+    tmp = stamp.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"key": key, "outputs": outputs}, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, stamp)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Notebook output cache.")
+    parser.add_argument("command", choices=["check", "record", "key"])
+    parser.add_argument("notebook", type=Path)
+    parser.add_argument("out_dir", type=Path, nargs="?")
+    args = parser.parse_args(argv)
+    nb_path = args.notebook.resolve()
+
+    if args.command == "key":
+        print(cache_key(nb_path) or "uncached")
+        return 0
+    if args.out_dir is None:
+        parser.error(f"{args.command} needs <out_dir>")
+    if args.command == "check":
+        return 0 if check(nb_path, args.out_dir) else 1
+    record(nb_path, args.out_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
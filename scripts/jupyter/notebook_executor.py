@@ -0,0 +1,337 @@
+"""Execute notebooks once each in pooled, reused kernels and export the results.
+
+`jupyter nbconvert --execute` starts Jupyter and a fresh kernel per call and,
+with ENABLE_NOTEBOOK_IPYNB/ENABLE_NOTEBOOK_MD, runs or parses the notebook up
+to three times. Here every notebook is executed exactly once (nbclient) and
+HTML, IPYNB and MD are exported from the executed notebook in memory.
+
+Kernels are started once with pandas/plotly and the chart modules imported
+(KERNEL_WARMUP) and reused: before every notebook the namespace is reset, the
+working directory restored, open matplotlib figures closed and interface
+modules edited since they were imported are dropped (KERNEL_PRELUDE). A kernel
+is replaced after E2E_KERNEL_MAX_RUNS notebooks (0 = never) or when it died.
+
+The HTML is lean by default (lean_html.py: one shared plotly.js under
+<out-base>/assets/, large scatter traces thinned, figure JSON compressed);
+E2E_NOTEBOOK_LEAN=false keeps the full figures inline.
+
+Outputs are cached with notebook_cache.py (E2E_NOTEBOOK_CACHE=false disables
+it) and, inside a pipeline run (E2E_RUN_ID), recorded per notebook in the run
+manifest. Each notebook logs to <out_dir>/<name>.log.
+
+Usage:
+  notebook_executor.py [--jobs 4] [--out-base reports/notebooks] notebook.ipynb ...
+  notebook_executor.py --out-dir reports/notebooks/Overview jupyter/Overview.ipynb
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import queue
+import re
+import sys
+import threading
+import time
+import traceback
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+INTERFACE_DIR = REPO_ROOT / "interface"
+NOTEBOOKS_DIR = REPO_ROOT / "jupyter"
+sys.path.append(str(Path(__file__).resolve().parent))
+sys.path.append(str(REPO_ROOT / "scripts" / "pipeline"))
+
+import lean_html  # noqa: E402
+import notebook_cache  # noqa: E402
+import run_manifest  # noqa: E402
+
+# Imports the kernel is started with; notebooks then find them in sys.modules
+KERNEL_WARMUP = """
+import os, sys
+from pathlib import Path
+import numpy, pandas, plotly.express, plotly.graph_objects
+sys.path.append({interface!r})
+import importlib
+for _f in sorted(Path({charts!r}).glob("*_charts.py")):
+    importlib.import_module("charts." + _f.stem)
+"""
+
+# Runs before every notebook: clean namespace, cwd, scope and its CSV directory, reload edited interface modules
+KERNEL_PRELUDE = """
+%reset -f
+import os as _os, sys as _sys
+_os.chdir({cwd!r})
+_os.environ["SCOPE_PACKAGE"] = {scope!r}
+_csv_dir = {csv_dir!r}
+if _csv_dir is None:
+    _os.environ.pop("CSV_REPORTS_DIRECTORY", None)
+else:
+    _os.environ["CSV_REPORTS_DIRECTORY"] = _csv_dir
+if "matplotlib.pyplot" in _sys.modules:
+    _sys.modules["matplotlib.pyplot"].close("all")
+_mtimes = _sys.__dict__.setdefault("_e2e_mtimes", {{}})
+for _name, _mod in list(_sys.modules.items()):
+    _file = getattr(_mod, "__file__", None) or ""
+    if not _file.startswith({interface!r}) or not _os.path.exists(_file):
+        continue
+    _m = _os.path.getmtime(_file)
+    if _mtimes.setdefault(_name, _m) != _m:
+        del _sys.modules[_name]
+        _mtimes.pop(_name)
+"""
+
+STYLE_BLOCK = re.compile(r"<style( scoped)?>.*?</style>", re.S)
+
+
+def timeout() -> int:
+    return int(os.environ.get("E2E_NOTEBOOK_TIMEOUT", "1800"))
+
+
+def kernel_renderer() -> str:
+    # Lean HTML draws figures from their JSON; the loader scripts of the other renderers are dead weight
+    if lean_html.enabled():
+        return "plotly_mimetype"
+    return os.environ.get("PLOTLY_RENDERER", "notebook_connected")
+
+
+class WarmKernel:
+    """One Jupyter kernel kept alive across notebook runs (runs on it are serialised)."""
+
+    def __init__(self, cwd: Path = NOTEBOOKS_DIR, max_runs: int = 0):
+        self.cwd = Path(cwd)
+        self.max_runs = max_runs
+        self.km = None
+        self.runs = 0
+        self.lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self.km is not None and self.km.is_alive()
+
+    def pid(self):
+        return getattr(getattr(self.km, "provisioner", None), "pid", None)
+
+    def _ensure(self):
+        if self.alive() and not (self.max_runs and self.runs >= self.max_runs):
+            return
+        self.shutdown()
+        from jupyter_client.manager import KernelManager
+
+        km = KernelManager(kernel_name="python3")
+        km.start_kernel(cwd=str(self.cwd), env=dict(os.environ, PLOTLY_RENDERER=kernel_renderer()))
+        self.km = km
+        self.runs = 0
+        self._run_cells([KERNEL_WARMUP.format(interface=str(INTERFACE_DIR),
+                                              charts=str(INTERFACE_DIR / "charts"))])
+
+    def _run_cells(self, sources, nb=None):
+        import nbformat
+        from nbclient import NotebookClient
+
+        nb = nb or nbformat.v4.new_notebook()
+        prelude = [nbformat.v4.new_code_cell(src) for src in sources]
+        nb.cells = prelude + nb.cells
+        client = NotebookClient(nb, km=self.km, timeout=timeout(),
+                                resources={"metadata": {"path": str(self.cwd)}})
+        try:
+            client.execute()
+        finally:
+            nb.cells = nb.cells[len(prelude):]
+        return nb
+
+    def start(self):
+        with self.lock:
+            self._ensure()
+
+    def execute(self, nb_path: Path, scope: str = None, csv_dir: Path = None):
+        """Executed copy of the notebook (raises nbclient's CellExecutionError on failure).
+
+        scope and csv_dir default to this process's SCOPE_PACKAGE and CSV_REPORTS_DIRECTORY.
+        """
+        import nbformat
+
+        with self.lock:
+            self._ensure()
+            self.runs += 1
+            nb = nbformat.read(str(nb_path), as_version=4)
+            prelude = KERNEL_PRELUDE.format(
+                cwd=str(self.cwd), interface=str(INTERFACE_DIR),
+                scope=os.environ.get("SCOPE_PACKAGE", "") if scope is None else scope,
+                csv_dir=os.environ.get("CSV_REPORTS_DIRECTORY") if csv_dir is None else str(csv_dir))
+            return self._run_cells([prelude], nb)
+
+    def shutdown(self):
+        if self.alive():
+            self.km.shutdown_kernel(now=True)
+        self.km = None
+
+
+class KernelPool:
+    """A fixed number of warm kernels handed out one notebook at a time."""
+
+    def __init__(self, size: int, max_runs: int = 0):
+        self.kernels = [WarmKernel(max_runs=max_runs) for _ in range(max(size, 1))]
+        self._idle = queue.Queue()
+        for kernel in self.kernels:
+            self._idle.put(kernel)
+
+    @contextmanager
+    def kernel(self):
+        kernel = self._idle.get()
+        try:
+            yield kernel
+        finally:
+            self._idle.put(kernel)
+
+    def shutdown(self):
+        for kernel in self.kernels:
+            kernel.shutdown()
+
+
+def output_name(nb_path: Path) -> str:
+    return nb_path.stem + os.environ.get("JUPYTER_OUTPUT_FILE_POSTFIX", "")
+
+
+def export_notebook(nb, nb_path: Path, out_dir: Path, ipynb: bool = False, md: bool = False) -> list:
+    """Write the HTML (and optionally IPYNB/MD) of an executed notebook."""
+    import nbformat
+    from nbconvert import HTMLExporter, MarkdownExporter
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    name = output_name(nb_path)
+    written = []
+    if ipynb:
+        target = out_dir / f"{name}.ipynb"
+        nbformat.write(nb, str(target))
+        written.append(target)
+    if lean_html.enabled():
+        bundle = lean_html.ensure_bundle(out_dir.parent / lean_html.ASSETS_DIR_NAME)
+        body, _ = HTMLExporter(template_name="lab", exclude_input=True).from_notebook_node(lean_html.lean_notebook(nb))
+        body = lean_html.inject_head(body, lean_html.page_head(f"../{lean_html.ASSETS_DIR_NAME}/{bundle}"))
+    else:
+        body, _ = HTMLExporter(template_name="lab", exclude_input=True).from_notebook_node(nb)
+    target = out_dir / f"{name}.html"
+    target.write_text(body, encoding="utf-8")
+    written.append(target)
+    if md:
+        body, resources = MarkdownExporter(exclude_input=True).from_notebook_node(nb)
+        target = out_dir / f"{name}.md"
+        target.write_text(STYLE_BLOCK.sub("", body), encoding="utf-8")
+        for file_name, data in (resources.get("outputs") or {}).items():
+            (out_dir / file_name).write_bytes(data)
+        written.append(target)
+    return written
+
+
+def _kernel_usage(pid):
+    """(user CPU seconds, system CPU seconds, RSS MB) of the kernel process, if psutil is available."""
+    try:
+        import psutil
+
+        proc = psutil.Process(pid)
+        times = proc.cpu_times()
+        return times.user, times.system, proc.memory_info().rss / (1024 * 1024)
+    except Exception:
+        return 0.0, 0.0, 0.0
+
+
+def run_notebook(pool: KernelPool, nb_path: Path, out_dir: Path, use_cache: bool = True) -> dict:
+    ipynb = os.environ.get("ENABLE_NOTEBOOK_IPYNB", "false") == "true"
+    md = os.environ.get("ENABLE_NOTEBOOK_MD", "false") == "true"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    log = out_dir / f"{output_name(nb_path)}.log"
+    result = {"notebook": nb_path.name, "status": "ok", "outputs": []}
+
+    if use_cache and notebook_cache.check(nb_path, out_dir):
+        result["status"] = "cached"
+        if lean_html.enabled():
+            lean_html.ensure_bundle(out_dir.parent / lean_html.ASSETS_DIR_NAME)
+        result["outputs"] = [p for p in notebook_cache.expected_outputs(nb_path, out_dir) if p.is_file()]
+        return result
+    notebook_cache.stamp_path(nb_path, out_dir).unlink(missing_ok=True)
+
+    started = run_manifest._now()
+    t0 = time.monotonic()
+    with pool.kernel() as kernel:
+        user0, sys0, _ = _kernel_usage(kernel.pid()) if kernel.alive() else (0.0, 0.0, 0.0)
+        try:
+            nb = kernel.execute(nb_path)
+            result["outputs"] = export_notebook(nb, nb_path, out_dir, ipynb=ipynb, md=md)
+            if use_cache:
+                notebook_cache.record(nb_path, out_dir)
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+            log.write_text(traceback.format_exc(), encoding="utf-8")
+        user1, sys1, rss = _kernel_usage(kernel.pid()) if kernel.alive() else (user0, sys0, 0.0)
+    result["seconds"] = round(time.monotonic() - t0, 3)
+    if result["status"] == "ok":
+        log.write_text("outputs:\n" + "".join(f"  {p}\n" for p in result["outputs"]), encoding="utf-8")
+
+    out_bytes, rows = run_manifest._path_size(out_dir)
+    run_manifest.append_record({
+        "run": run_manifest.run_id(),
+        "stage": "notebook",
+        "name": nb_path.stem,
+        "started": started,
+        "wallSeconds": result["seconds"],
+        "cpuUserSeconds": round(max(user1 - user0, 0.0), 3),
+        "cpuSystemSeconds": round(max(sys1 - sys0, 0.0), 3),
+        "maxRssMB": round(rss, 1),
+        "exitCode": 0 if result["status"] == "ok" else 1,
+        "outputBytes": out_bytes,
+        "rows": rows,
+    })
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Execute notebooks in pooled kernels and export them.")
+    parser.add_argument("notebooks", nargs="+", type=Path)
+    parser.add_argument("--jobs", type=int, default=int(os.environ.get("E2E_NOTEBOOK_JOBS", "4")),
+                        help="Kernels (notebooks executed concurrently)")
+    parser.add_argument("--out-base", type=Path, default=Path(
+        os.environ.get("REPORTS_DIRECTORY") or REPO_ROOT / "reports") / "notebooks",
+        help="Outputs go to <out-base>/<NotebookName>/")
+    parser.add_argument("--out-dir", type=Path, help="Output directory (single notebook only)")
+    parser.add_argument("--max-runs", type=int, default=int(os.environ.get("E2E_KERNEL_MAX_RUNS", "0")),
+                        help="Replace a kernel after this many notebooks (0 = never)")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.out_dir and len(args.notebooks) > 1:
+        parser.error("--out-dir takes a single notebook")
+    notebooks = [p.resolve() for p in args.notebooks]
+    missing = [p for p in notebooks if not p.is_file()]
+    if missing:
+        parser.error(f"File not found: {missing[0]}")
+    use_cache = not args.no_cache and os.environ.get("E2E_NOTEBOOK_CACHE", "true") == "true"
+    jobs = max(min(args.jobs, len(notebooks)), 1)
+
+    pool = KernelPool(jobs, args.max_runs)
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = []
+            for nb_path in notebooks:
+                out_dir = args.out_dir or args.out_base / nb_path.stem
+                print(f"[run] {nb_path.name} -> {out_dir}", flush=True)
+                futures.append(executor.submit(run_notebook, pool, nb_path, out_dir, use_cache))
+            for future in as_completed(futures):
+                result = future.result()
+                if result["status"] == "failed":
+                    failed += 1
+                    print(f"[warn] Failed: {result['notebook']} ({result['error'].splitlines()[0]})", flush=True)
+                elif result["status"] == "cached":
+                    print(f"[cache] {result['notebook']} unchanged, reusing outputs", flush=True)
+                else:
+                    print(f"[ok]  {result['notebook']} ({result['seconds']:.1f}s)", flush=True)
+    finally:
+        pool.shutdown()
+
+    if failed:
+        print(f"[warn] {failed} of {len(notebooks)} notebooks failed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
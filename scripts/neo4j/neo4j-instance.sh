@@ -0,0 +1,128 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Additional local Neo4j instances next to the main one. The community edition
+# serves a single user database, so each instance gets its own configuration
+# (NEO4J_CONF), data/run/log directories and ports, sharing NEO4J_HOME and its
+# plugins.
+#
+#   neo4j-instance.sh setup  <name> <port-offset>   Create/refresh the instance (idempotent)
+#   neo4j-instance.sh env    <name>                 Print the instance's env exports (eval them)
+#   neo4j-instance.sh start  <name>                 Start it (scripts/neo4j/neo4j-start.sh)
+#   neo4j-instance.sh stop   <name>                 Stop it (scripts/neo4j/neo4j-stop.sh)
+#
+# Ports are the main ports plus <port-offset>. Instances live under
+# ${E2E_INSTANCES_DIR:-runtime/instances}/<name>.
+
+ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
+TOOLS_DIR="${TOOLS_DIRECTORY:?missing TOOLS_DIRECTORY}"
+NEO4J_ED="${NEO4J_EDITION:?missing NEO4J_EDITION}"
+NEO4J_VER="${NEO4J_VERSION:?missing NEO4J_VERSION}"
+NEO4J_PWD="${NEO4J_INITIAL_PASSWORD:?missing NEO4J_INITIAL_PASSWORD}"
+
+NEO4J_NAME="neo4j-${NEO4J_ED}-${NEO4J_VER}"
+NEO4J_HOME="${NEO4J_HOME:-${TOOLS_DIR}/${NEO4J_NAME}}"
+NADM="${NEO4J_HOME}/bin/neo4j-admin"
+
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+INSTANCES_DIR="${E2E_INSTANCES_DIR:-${ROOT_DIR}/runtime/instances}"
+
+# Per-instance memory (several instances share the host)
+INSTANCE_HEAP="${E2E_INSTANCE_HEAP:-2g}"
+INSTANCE_PAGECACHE="${E2E_INSTANCE_PAGECACHE:-1g}"
+
+usage() { echo "Usage: $0 setup <name> <port-offset> | env|start|stop <name>" >&2; exit 2; }
+
+is_darwin() { [[ "$(uname)" == "Darwin" ]]; }
+del_key() {
+  local key="$1" file="$2"
+  if is_darwin; then sed -i '' "/^${key}=.*/d" "${file}"; else sed -i "/^${key}=.*/d" "${file}"; fi
+}
+ensure_cfg() {
+  local key="$1" val="$2" file="$3"
+  del_key "${key}" "${file}"
+  echo "${key}=${val}" >> "${file}"
+}
+
+setup_instance() {
+  local name="$1" offset="$2"
+  local dir="${INSTANCES_DIR}/${name}"
+  local conf_dir="${dir}/conf" conf_file="${dir}/conf/neo4j.conf"
+  local http=$((NEO4J_HTTP_PORT + offset)) https=$((NEO4J_HTTPS_PORT + offset)) bolt=$((NEO4J_BOLT_PORT + offset))
+
+  [[ -f "${NEO4J_HOME}/conf/neo4j.conf" ]] || { echo "Main Neo4j not set up. Run scripts/neo4j/setup-neo4j.sh"; exit 1; }
+  mkdir -p "${conf_dir}" "${dir}/data" "${dir}/logs" "${dir}/run" "${dir}/import" "${dir}/dumps"
+
+  # Start from the main configuration (plugins, procedures, apoc.conf) and override locations/ports
+  cp "${NEO4J_HOME}/conf/"*.conf "${conf_dir}/"
+  ensure_cfg "server.directories.data" "${dir}/data" "${conf_file}"
+  ensure_cfg "server.directories.logs" "${dir}/logs" "${conf_file}"
+  ensure_cfg "server.directories.run" "${dir}/run" "${conf_file}"
+  ensure_cfg "server.directories.dumps.root" "${dir}/dumps" "${conf_file}"
+  ensure_cfg "server.directories.transaction.logs.root" "${dir}/data/transactions" "${conf_file}"
+  ensure_cfg "server.directories.import" "${dir}/import" "${conf_file}"
+  ensure_cfg "server.directories.plugins" "${NEO4J_HOME}/plugins" "${conf_file}"
+  ensure_cfg "server.bolt.listen_address" ":${bolt}" "${conf_file}"
+  ensure_cfg "server.http.listen_address" ":${http}" "${conf_file}"
+  ensure_cfg "server.https.listen_address" ":${https}" "${conf_file}"
+  ensure_cfg "server.memory.heap.initial_size" "${INSTANCE_HEAP}" "${conf_file}"
+  ensure_cfg "server.memory.heap.max_size" "${INSTANCE_HEAP}" "${conf_file}"
+  ensure_cfg "server.memory.pagecache.size" "${INSTANCE_PAGECACHE}" "${conf_file}"
+
+  if [[ ! -f "${dir}/data/dbms/auth.ini" ]]; then
+    echo "[instance ${name}] Setting initial password ..."
+    NEO4J_CONF="${conf_dir}" "${NADM}" dbms set-initial-password "${NEO4J_PWD}"
+  fi
+
+  cat > "${dir}/instance.env" <<ENV
+export NEO4J_CONF="${conf_dir}"
+export NEO4J_HTTP_PORT=${http}
+export NEO4J_HTTPS_PORT=${https}
+export NEO4J_BOLT_PORT=${bolt}
+export NEO4J_DATA_DIRECTORY="${dir}/data"
+export NEO4J_RUNTIME_DIRECTORY="${dir}"
+export NEO4J_IMPORT_DIRECTORY="${dir}/import"
+export NEO4J_URI="bolt://localhost:${bolt}"
+export NEO4J_HTTP_URL="http://localhost:${http}"
+export JQA_REPORT_DIR="${dir}/jqassistant/report"
+export JQA_SCAN_MANIFEST="${dir}/jqassistant/scan-manifest.sha256"
+export E2E_INSTANCE_DIR="${dir}"
+ENV
+  echo "[instance ${name}] ${dir}  HTTP ${http}  BOLT ${bolt}"
+}
+
+instance_env_file() {
+  local file="${INSTANCES_DIR}/$1/instance.env"
+  [[ -f "${file}" ]] || { echo "Instance '$1' not set up. Run: $0 setup $1 <port-offset>" >&2; exit 1; }
+  echo "${file}"
+}
+
+cmd="${1:-}"; name="${2:-}"
+[[ -n "${cmd}" && -n "${name}" ]] || usage
+
+case "${cmd}" in
+  setup)
+    [[ -n "${3:-}" ]] || usage
+    setup_instance "${name}" "$3"
+    ;;
+  env)
+    cat "$(instance_env_file "${name}")"
+    ;;
+  start)
+    env_file="$(instance_env_file "${name}")"
+    # shellcheck disable=SC1090
+    source "${env_file}"
+    "${SCRIPT_DIR}/neo4j-start.sh"
+    ;;
+  stop)
+    env_file="$(instance_env_file "${name}")"
+    # shellcheck disable=SC1090
+    source "${env_file}"
+    "${SCRIPT_DIR}/neo4j-stop.sh"
+    ;;
+  *)
+    usage
+    ;;
+esac
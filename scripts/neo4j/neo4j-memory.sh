@@ -0,0 +1,109 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Sizes Neo4j heap, page cache and transaction memory in neo4j.conf.
+#
+# Priority per setting:
+#   1. Env overrides: NEO4J_HEAP_SIZE, NEO4J_PAGECACHE_SIZE, NEO4J_TX_MEMORY_MAX (e.g. "8g")
+#   2. neo4j-admin server memory-recommendation for NEO4J_MEMORY_SHARE percent of
+#      the host RAM (default 60); it accounts for the size of the stores on disk
+#   3. Fixed defaults (4g/6g heap, 4g page cache, 3g transactions) when
+#      NEO4J_MEMORY_AUTO=false or the recommendation is unavailable
+#
+# Usage: neo4j-memory.sh [--restart-if-changed]
+#   --restart-if-changed  restart a running Neo4j when the settings changed
+#                         (used after the scan, once the store has its final size)
+
+ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
+TOOLS_DIR="${TOOLS_DIRECTORY:?missing TOOLS_DIRECTORY}"
+NEO4J_ED="${NEO4J_EDITION:?missing NEO4J_EDITION}"
+NEO4J_VER="${NEO4J_VERSION:?missing NEO4J_VERSION}"
+
+NEO4J_NAME="neo4j-${NEO4J_ED}-${NEO4J_VER}"
+NEO4J_HOME="${NEO4J_HOME:-${TOOLS_DIR}/${NEO4J_NAME}}"
+NEO4J_CONF_FILE="${NEO4J_CONF:-${NEO4J_HOME}/conf}/neo4j.conf"
+NADM="${NEO4J_HOME}/bin/neo4j-admin"
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+
+MEMORY_AUTO="${NEO4J_MEMORY_AUTO:-true}"
+MEMORY_SHARE="${NEO4J_MEMORY_SHARE:-60}"
+RESTART_IF_CHANGED="false"
+[[ "${1:-}" == "--restart-if-changed" ]] && RESTART_IF_CHANGED="true"
+
+[[ -f "${NEO4J_CONF_FILE}" ]] || { echo "neo4j.conf not found: ${NEO4J_CONF_FILE}. Run scripts/neo4j/setup-neo4j.sh"; exit 1; }
+
+is_darwin() { [[ "$(uname)" == "Darwin" ]]; }
+del_key() {
+  local key="$1" file="$2"
+  if is_darwin; then sed -i '' "/^${key}=.*/d" "${file}"; else sed -i "/^${key}=.*/d" "${file}"; fi
+}
+ensure_cfg() {
+  local key="$1" val="$2"
+  del_key "${key}" "${NEO4J_CONF_FILE}"
+  echo "${key}=${val}" >> "${NEO4J_CONF_FILE}"
+}
+current_cfg() { grep "^$1=" "${NEO4J_CONF_FILE}" 2>/dev/null | tail -n 1 | cut -d= -f2- || true; }
+
+host_memory_mb() {
+  if is_darwin; then
+    echo $(( $(sysctl -n hw.memsize) / 1048576 ))
+  else
+    awk '/^MemTotal:/ { print int($2 / 1024) }' /proc/meminfo
+  fi
+}
+
+# "6g" / "5100m" / "524288k" → megabytes
+to_mb() {
+  echo "$1" | awk '{
+    v = $0; u = tolower(substr(v, length(v), 1)); n = substr(v, 1, length(v) - 1) + 0
+    if (u == "k") print int(n / 1024); else if (u == "m") print int(n);
+    else if (u == "g") print int(n * 1024); else if (u == "t") print int(n * 1048576);
+    else print int(v / 1048576)
+  }'
+}
+
+HEAP_INIT="4g"; HEAP_MAX="6g"; PAGECACHE="4g"; TX_MAX="3g"; SOURCE="defaults"
+
+if [[ "${MEMORY_AUTO}" == "true" && -x "${NADM}" ]]; then
+  budget_mb=$(( $(host_memory_mb) * MEMORY_SHARE / 100 ))
+  if recommendation="$(NEO4J_CONF="$(dirname "${NEO4J_CONF_FILE}")" "${NADM}" server memory-recommendation --memory="${budget_mb}m" 2>/dev/null)"; then
+    rec() { echo "${recommendation}" | grep "^$1=" | tail -n 1 | cut -d= -f2- | tr -d '[:space:]'; }
+    r_heap_init="$(rec server.memory.heap.initial_size)"
+    r_heap_max="$(rec server.memory.heap.max_size)"
+    r_pagecache="$(rec server.memory.pagecache.size)"
+    r_tx_max="$(rec dbms.memory.transaction.total.max)"
+    if [[ -n "${r_heap_max}" && -n "${r_pagecache}" ]]; then
+      HEAP_INIT="${r_heap_init:-${r_heap_max}}"; HEAP_MAX="${r_heap_max}"; PAGECACHE="${r_pagecache}"
+      # Not every version recommends a transaction limit: keep it at 70% of the heap
+      TX_MAX="${r_tx_max:-$(( $(to_mb "${HEAP_MAX}") * 70 / 100 ))m}"
+      SOURCE="neo4j-admin recommendation for ${budget_mb}m (${MEMORY_SHARE}% of host RAM)"
+    fi
+  else
+    echo "[memory] neo4j-admin memory-recommendation failed; using defaults."
+  fi
+fi
+
+# Explicit overrides always win
+if [[ -n "${NEO4J_HEAP_SIZE:-}" ]]; then HEAP_INIT="${NEO4J_HEAP_SIZE}"; HEAP_MAX="${NEO4J_HEAP_SIZE}"; fi
+PAGECACHE="${NEO4J_PAGECACHE_SIZE:-${PAGECACHE}}"
+TX_MAX="${NEO4J_TX_MEMORY_MAX:-${TX_MAX}}"
+
+before="$(current_cfg server.memory.heap.initial_size) $(current_cfg server.memory.heap.max_size) $(current_cfg server.memory.pagecache.size) $(current_cfg dbms.memory.transaction.total.max)"
+
+ensure_cfg "server.memory.heap.initial_size" "${HEAP_INIT}"
+ensure_cfg "server.memory.heap.max_size" "${HEAP_MAX}"
+ensure_cfg "server.memory.pagecache.size" "${PAGECACHE}"
+ensure_cfg "dbms.memory.transaction.total.max" "${TX_MAX}"
+
+after="${HEAP_INIT} ${HEAP_MAX} ${PAGECACHE} ${TX_MAX}"
+echo "[memory] heap ${HEAP_INIT}/${HEAP_MAX}, page cache ${PAGECACHE}, transactions ${TX_MAX} (${SOURCE})"
+
+if [[ "${before}" != "${after}" && "${RESTART_IF_CHANGED}" == "true" ]]; then
+  if "${NEO4J_HOME}/bin/neo4j" status 2>/dev/null | grep -qi "running"; then
+    echo "[memory] Settings changed; restarting Neo4j to apply them."
+    "${SCRIPT_DIR}/neo4j-stop.sh"
+    "${SCRIPT_DIR}/neo4j-start.sh"
+  fi
+fi
@@ -0,0 +1,165 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Scan snapshot cache: offline dump/load of the Neo4j store keyed by the scan inputs.
+#
+#   neo4j-snapshot.sh key       Print the cache key for the current inputs
+#   neo4j-snapshot.sh has       Exit 0 if a snapshot exists for the current inputs
+#   neo4j-snapshot.sh save      Dump the database into the cache (Neo4j must be stopped)
+#   neo4j-snapshot.sh restore   Load the cached dump into the database (Neo4j must be stopped)
+#
+# The key is a sha256 over the contents of REPO_TO_ANALYZE, the jQAssistant
+# version and configuration (jqassistant/.jqassistant.yml and the rules
+# directory), and the Neo4j version. The rest of jqassistant/ is not hashed:
+# jQA writes its report under the working directory on every analyze, and
+# that output must not change the key of the next run.
+#
+# has/save/restore use SNAPSHOT_KEY when it is set instead of hashing the
+# inputs again (pipeline-run-all.sh computes the key once per run).
+
+ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
+TOOLS_DIR="${TOOLS_DIRECTORY:?missing TOOLS_DIRECTORY}"
+NEO4J_ED="${NEO4J_EDITION:?missing NEO4J_EDITION}"
+NEO4J_VER="${NEO4J_VERSION:?missing NEO4J_VERSION}"
+JQA_VER="${JQASSISTANT_CLI_VERSION:?missing JQASSISTANT_CLI_VERSION}"
+JQA_ARTIFACT="${JQASSISTANT_CLI_ARTIFACT:-jqassistant-commandline-neo4jv5}"
+TARGET="${REPO_TO_ANALYZE:?missing REPO_TO_ANALYZE}"
+
+NEO4J_NAME="neo4j-${NEO4J_ED}-${NEO4J_VER}"
+NEO4J_HOME="${NEO4J_HOME:-${TOOLS_DIR}/${NEO4J_NAME}}"
+NADM="${NEO4J_HOME}/bin/neo4j-admin"
+
+DATABASE="${NEO4J_DATABASE:-neo4j}"
+CACHE_DIR="${E2E_SCAN_CACHE_DIR:-${ROOT_DIR}/runtime/scan-cache}"
+CACHE_KEEP="${E2E_SCAN_CACHE_KEEP:-5}"
+JQA_CONF_DIR="${ROOT_DIR}/jqassistant"
+JQA_CONF_FILE="${JQA_CONF_DIR}/.jqassistant.yml"
+JQA_RULES_DIR="${JQA_CONF_DIR}/rules"
+SCAN_MANIFEST="${JQA_SCAN_MANIFEST:-${ROOT_DIR}/runtime/jqassistant/scan-manifest.sha256}"
+
+usage() { echo "Usage: $0 key|has|save|restore" >&2; exit 2; }
+
+sha256_of() {
+  if command -v sha256sum >/dev/null 2>&1; then
+    sha256sum "$@" | awk '{print $1}'
+  else
+    shasum -a 256 "$@" | awk '{print $1}'
+  fi
+}
+
+# "<sha256>  <relative path>" for every file under a directory (or the file itself), sorted
+hash_tree() {
+  local path="$1" rel
+  if [[ -f "${path}" ]]; then
+    printf '%s  %s\n' "$(sha256_of "${path}")" "$(basename "${path}")"
+    return 0
+  fi
+  ( cd "${path}" && find . -type f ! -name '.DS_Store' ) \
+    | sed 's|^\./||' | LC_ALL=C sort \
+    | while IFS= read -r rel; do
+        printf '%s  %s\n' "$(sha256_of "${path}/${rel}")" "${rel}"
+      done
+}
+
+cache_key() {
+  [[ -e "${TARGET}" ]] || { echo "ERROR: REPO_TO_ANALYZE not found: ${TARGET}" >&2; return 1; }
+  {
+    echo "jqassistant: ${JQA_ARTIFACT}-${JQA_VER}"
+    echo "neo4j: ${NEO4J_NAME}"
+    echo "# config"
+    [[ -f "${JQA_CONF_FILE}" ]] && hash_tree "${JQA_CONF_FILE}"
+    [[ -d "${JQA_RULES_DIR}" ]] && hash_tree "${JQA_RULES_DIR}" | sed 's|  |  rules/|'
+    echo "# input"
+    hash_tree "${TARGET}"
+  } | sha256_of /dev/stdin | cut -c1-16
+}
+
+# Key given by the caller, or the one of the current inputs
+snapshot_key() {
+  if [[ -n "${SNAPSHOT_KEY:-}" ]]; then echo "${SNAPSHOT_KEY}"; else cache_key; fi
+}
+
+require_stopped() {
+  if "${NEO4J_HOME}/bin/neo4j" status 2>/dev/null | grep -qi "running"; then
+    echo "ERROR: Neo4j is running; stop it before '$1' (scripts/neo4j/neo4j-stop.sh)." >&2
+    exit 1
+  fi
+}
+
+# Keep only the CACHE_KEEP most recently used snapshots
+prune_cache() {
+  local old
+  # shellcheck disable=SC2012
+  ls -1t "${CACHE_DIR}" 2>/dev/null | tail -n +"$((CACHE_KEEP + 1))" | while IFS= read -r old; do
+    [[ -n "${old}" ]] || continue
+    echo "[snapshot] Pruning ${CACHE_DIR}/${old}"
+    rm -rf "${CACHE_DIR:?}/${old}"
+  done
+}
+
+cmd="${1:-}"
+[[ -n "${cmd}" ]] || usage
+
+case "${cmd}" in
+  key)
+    cache_key
+    ;;
+
+  has)
+    key="$(snapshot_key)"
+    [[ -f "${CACHE_DIR}/${key}/${DATABASE}.dump" ]]
+    ;;
+
+  save)
+    [[ -x "${NADM}" ]] || { echo "neo4j-admin not found. Install Neo4j first."; exit 1; }
+    require_stopped save
+    key="$(snapshot_key)"
+    SNAP_DIR="${CACHE_DIR}/${key}"
+    TMP_DIR="${SNAP_DIR}.tmp"
+    rm -rf "${TMP_DIR}"
+    mkdir -p "${TMP_DIR}"
+
+    echo "[snapshot] Dumping database '${DATABASE}' → ${SNAP_DIR}"
+    "${NADM}" database dump "${DATABASE}" --to-path="${TMP_DIR}" --overwrite-destination=true
+    [[ -f "${SCAN_MANIFEST}" ]] && cp "${SCAN_MANIFEST}" "${TMP_DIR}/scan-manifest.sha256"
+    {
+      echo "created: $(date +'%Y-%m-%dT%H:%M:%S%z')"
+      echo "target: ${TARGET}"
+      echo "jqassistant: ${JQA_ARTIFACT}-${JQA_VER}"
+      echo "neo4j: ${NEO4J_NAME}"
+    } > "${TMP_DIR}/snapshot.txt"
+
+    # Swap in only once the dump is complete
+    rm -rf "${SNAP_DIR}"
+    mv "${TMP_DIR}" "${SNAP_DIR}"
+    prune_cache
+    echo "[snapshot] Saved ${key}"
+    ;;
+
+  restore)
+    [[ -x "${NADM}" ]] || { echo "neo4j-admin not found. Install Neo4j first."; exit 1; }
+    require_stopped restore
+    key="$(snapshot_key)"
+    SNAP_DIR="${CACHE_DIR}/${key}"
+    [[ -f "${SNAP_DIR}/${DATABASE}.dump" ]] || { echo "ERROR: No snapshot for key ${key}" >&2; exit 1; }
+
+    echo "[snapshot] Loading ${SNAP_DIR} → database '${DATABASE}'"
+    "${NADM}" database load "${DATABASE}" --from-path="${SNAP_DIR}" --overwrite-destination=true
+
+    # Keep the incremental scan manifest consistent with the restored graph
+    mkdir -p "$(dirname "${SCAN_MANIFEST}")"
+    if [[ -f "${SNAP_DIR}/scan-manifest.sha256" ]]; then
+      cp "${SNAP_DIR}/scan-manifest.sha256" "${SCAN_MANIFEST}"
+    else
+      rm -f "${SCAN_MANIFEST}"
+    fi
+    touch "${SNAP_DIR}"
+    echo "[snapshot] Restored ${key}"
+    ;;
+
+  *)
+    usage
+    ;;
+esac
@@ -28,26 +28,48 @@ port_in_use() {
   fi
 }
 
-# Wait for Bolt with short timeouts
-wait_bolt() {
-  for _ in {1..60}; do
-    if have_nc; then
-      if is_darwin; then
-        if nc -z -G 1 localhost "${NEO4J_BOLT}" >/dev/null 2>&1; then return 0; fi
-      else
-        if nc -z -w 1 localhost "${NEO4J_BOLT}" >/dev/null 2>&1; then return 0; fi
-      fi
-    else
-      if port_in_use; then return 0; fi
+# Readiness: an open Bolt port does not mean the database serves queries yet,
+# so run a real query (RETURN 1 over the HTTP transaction endpoint).
+NEO4J_PWD="${NEO4J_PASSWORD:-${NEO4J_INITIAL_PASSWORD:-}}"
+START_TIMEOUT_MS=$(( ${NEO4J_START_TIMEOUT:-120} * 1000 ))
+NEO4J_HTTP_TRANSACTION_ENDPOINT=${NEO4J_HTTP_TRANSACTION_ENDPOINT:-"db/neo4j/tx/commit"}
+
+bolt_open() {
+  if have_nc; then
+    if is_darwin; then nc -z -G 1 localhost "${NEO4J_BOLT}" >/dev/null 2>&1; else nc -z -w 1 localhost "${NEO4J_BOLT}" >/dev/null 2>&1; fi
+  else
+    port_in_use
+  fi
+}
+
+query_ok() {
+  curl --silent --fail --max-time 2 \
+    -H "Accept: application/json" -H "Content-Type: application/json" \
+    -u "${NEO4J_USER:-neo4j}:${NEO4J_PWD}" \
+    "http://localhost:${NEO4J_HTTP}/${NEO4J_HTTP_TRANSACTION_ENDPOINT}" \
+    -d '{"statements":[{"statement":"RETURN 1"}]}' 2>/dev/null | grep -q '"errors":\[\]'
+}
+
+# Exponential backoff: 250ms, 500ms, 1s, 2s, capped at 4s, up to NEO4J_START_TIMEOUT seconds
+wait_ready() {
+  local delay_ms=250 waited_ms=0
+  while true; do
+    if bolt_open && query_ok; then
+      echo "Neo4j ready after ~$(( waited_ms / 1000 ))s."
+      return 0
     fi
-    sleep 1
+    [[ ${waited_ms} -ge ${START_TIMEOUT_MS} ]] && return 1
+    sleep "$(awk -v ms="${delay_ms}" 'BEGIN { printf "%.3f", ms / 1000 }')"
+    waited_ms=$(( waited_ms + delay_ms ))
+    delay_ms=$(( delay_ms * 2 ))
+    [[ ${delay_ms} -gt 4000 ]] && delay_ms=4000
   done
-  return 1
 }
 
 # 1) Our Neo4j already running?
 if "${NEO4J_BIN}/neo4j" status | grep -qi "running"; then
   echo "Neo4j already running at ${NEO4J_HOME}"
+  wait_ready || { echo "Neo4j is running but does not answer queries."; exit 1; }
   echo "HTTP: http://localhost:${NEO4J_HTTP}  BOLT: bolt://localhost:${NEO4J_BOLT}"
   exit 0
 fi
@@ -66,14 +88,14 @@ rc=$?
 set -e
 
 if [[ $rc -ne 0 ]]; then
-  if wait_bolt; then
-    echo "Bolt is up; treating previous start error as benign."
+  if wait_ready; then
+    echo "Neo4j answers queries; treating previous start error as benign."
   else
     echo "Neo4j failed to start."
     exit $rc
   fi
 else
-  wait_bolt || { echo "Bolt not reachable after start."; exit 1; }
+  wait_ready || { echo "Neo4j not ready for queries after start."; exit 1; }
 fi
 
 echo "HTTP: http://localhost:${NEO4J_HTTP}  BOLT: bolt://localhost:${NEO4J_BOLT}"
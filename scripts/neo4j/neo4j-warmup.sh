@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Requires: source scripts/env.sh
+#
+# Warms the page cache before the report stage (cypher/Maintenance/Warmup.cypher),
+# so report timings are not dominated by first-touch I/O.
+
+ROOT_DIR="${ROOT_DIRECTORY:?missing ROOT_DIRECTORY}"
+SCRIPT_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+source "${SCRIPT_DIR}/../cypher/cypher-helpers.sh"
+
+echo "Warming up page cache..."
+start_s=$(date +%s)
+execute_cypher_no_src "${ROOT_DIR}/cypher/Maintenance/Warmup.cypher"
+echo "Warmup done in $(( $(date +%s) - start_s ))s."
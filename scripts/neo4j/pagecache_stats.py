@@ -0,0 +1,135 @@
+"""Page cache hit ratio of the report queries, recorded in the run manifest.
+
+Runs a sample of the report queries (stage_dag.category_steps, with the
+parameters the category scripts pass) under PROFILE through the pooled
+driver of interface/utils/neo4j_client and sums pageCacheHits and
+pageCacheMisses over their plans. Profiles are available on every edition,
+unlike the page_cache metrics, which only Enterprise Edition writes.
+
+The sample is spread evenly over the queries in script order, so successive
+runs profile the same queries. Run right after the report stage it shows how
+much of the working set the page cache holds; a ratio well below 1 means the
+reports read from disk and NEO4J_PAGECACHE_SIZE is too small for the graph.
+
+The result is printed and appended to the current run manifest
+(scripts/pipeline/run_manifest.py) as a "pageCache" metric.
+
+Usage (after `source scripts/env.sh`):
+  pagecache_stats.py [--label csv-reports] [--sample 12]
+"""
+import argparse
+from datetime import datetime
+import importlib.util
+import os
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(REPO_ROOT / "interface"))
+sys.path.append(str(REPO_ROOT / "scripts" / "pipeline"))
+from utils import live_queries, neo4j_client  # noqa: E402
+import run_manifest  # noqa: E402
+
+DEFAULT_SAMPLE = 12
+
+
+def plan_totals(plan: dict):
+    """(page cache hits, misses) summed over a profiled plan and its children."""
+    hits = plan.get("pageCacheHits", 0) or 0
+    misses = plan.get("pageCacheMisses", 0) or 0
+    for child in plan.get("children", []):
+        h, m = plan_totals(child)
+        hits, misses = hits + h, misses + m
+    return hits, misses
+
+
+def sample_steps(sample: int) -> list:
+    """Every n-th report query so that `sample` of them are profiled (all with 0)."""
+    steps = list(live_queries.report_queries().values())
+    if sample <= 0 or sample >= len(steps):
+        return steps
+    return [steps[i * len(steps) // sample] for i in range(sample)]
+
+
+def neo4j_setting(name: str) -> str:
+    """Last value of a setting in neo4j.conf ('' when unset or not found)."""
+    home = os.environ.get("NEO4J_HOME") or str(Path(os.environ.get("TOOLS_DIRECTORY", "")) / (
+        f"neo4j-{os.environ.get('NEO4J_EDITION', '')}-{os.environ.get('NEO4J_VERSION', '')}"))
+    conf = Path(os.environ.get("NEO4J_CONF") or Path(home) / "conf") / "neo4j.conf"
+    value = ""
+    if conf.is_file():
+        for line in conf.read_text(encoding="utf-8").splitlines():
+            if line.startswith(name + "="):
+                value = line.split("=", 1)[1].strip()
+    return value
+
+
+def profile(steps: list) -> dict:
+    hits, misses, failed = 0, 0, []
+    for step in steps:
+        text = live_queries.query_text(step)
+        parameters = {name: None for name in live_queries.PARAMETER.findall(text)}
+        parameters.update(live_queries.default_parameters(step))
+        parameters.setdefault(live_queries.SCOPE_PARAMETER, os.environ.get("SCOPE_PACKAGE", ""))
+        try:
+            h, m = plan_totals(neo4j_client.profile_query(text, parameters))
+        except Exception as exc:  # one failing query should not hide the others
+            print(f"[warn] {step['section']}/{step['csv']}: {exc}", file=sys.stderr)
+            failed.append(f"{step['section']}/{step['csv']}")
+            continue
+        hits, misses = hits + h, misses + m
+    return {
+        "queries": len(steps) - len(failed),
+        "failed": failed,
+        "pageCacheHits": hits,
+        "pageCacheMisses": misses,
+        "hitRatio": round(hits / (hits + misses), 4) if hits + misses else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page cache hit ratio of the report queries (PROFILE).")
+    parser.add_argument("--label", default="", help="Stage the ratio belongs to, e.g. csv-reports")
+    parser.add_argument("--sample", type=int, default=int(os.environ.get("E2E_PAGECACHE_SAMPLE", DEFAULT_SAMPLE)),
+                        help=f"Report queries to profile, 0 = all (default {DEFAULT_SAMPLE})")
+    args = parser.parse_args(argv)
+
+    if importlib.util.find_spec("neo4j") is None:
+        print("[warn] Page cache stats need the neo4j Python driver (requirements.txt); skipped.")
+        return 0
+
+    steps = sample_steps(args.sample)
+    started = datetime.now().astimezone().isoformat(timespec="seconds")
+    t0 = time.monotonic()
+    try:
+        neo4j_client.get_driver()
+        stats = profile(steps)
+    except Exception as exc:
+        print(f"[warn] Page cache stats not available: {exc}")
+        return 1
+    finally:
+        neo4j_client.close()
+
+    record = {
+        "run": run_manifest.run_id(),
+        "metric": "pageCache",
+        "name": args.label,
+        "started": started,
+        "wallSeconds": round(time.monotonic() - t0, 3),
+        "heapMax": neo4j_setting("server.memory.heap.max_size"),
+        "pageCacheSize": neo4j_setting("server.memory.pagecache.size"),
+        **stats,
+    }
+    run_manifest.append_record(record)
+
+    ratio = "n/a" if stats["hitRatio"] is None else f"{stats['hitRatio']:.2%}"
+    print(f"[info] Page cache hit ratio ({stats['queries']} queries profiled): {ratio} "
+          f"({stats['pageCacheHits']} hits, {stats['pageCacheMisses']} misses)")
+    if not run_manifest.run_id():
+        print("[info] E2E_RUN_ID not set; not recorded in a run manifest.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
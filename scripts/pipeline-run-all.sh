@@ -25,30 +25,90 @@ source "$ENV_FILE"
 # shellcheck disable=SC1091
 source "$REPO_ROOT/scripts/config/apply-scope-env.sh" || true
 
+# Per-project overrides (instance ports, input, scope, output trees) when run
+# by scripts/pipeline-run-projects.sh
+if [[ -n "${E2E_PROJECT_ENV:-}" ]]; then
+  # shellcheck disable=SC1090
+  source "$E2E_PROJECT_ENV"
+fi
+
 # Flags (env-driven)
 E2E_SKIP_SETUP="${E2E_SKIP_SETUP:-false}"
 E2E_SKIP_NEO4J="${E2E_SKIP_NEO4J:-false}"
 E2E_SKIP_JQA="${E2E_SKIP_JQA:-false}"
+E2E_SKIP_ENRICH="${E2E_SKIP_ENRICH:-false}"
 E2E_SKIP_CSV="${E2E_SKIP_CSV:-false}"
+E2E_SKIP_WARMUP="${E2E_SKIP_WARMUP:-false}"
 E2E_SKIP_NOTEBOOKS="${E2E_SKIP_NOTEBOOKS:-false}"
+E2E_REPORT_MODE="${E2E_REPORT_MODE:-notebooks}"   # site → static HTML from interface/charts, no Jupyter
 E2E_STOP_NEO4J="${E2E_STOP_NEO4J:-false}"
 E2E_AUTO_INSTALL_JQ="${E2E_AUTO_INSTALL_JQ:-false}"
+E2E_SCAN_CACHE="${E2E_SCAN_CACHE:-false}"
+E2E_SHARDS="${E2E_SHARDS:-0}"   # >1 → sharded scan/reports on separate Neo4j instances
+SHARDED="false"; [[ "$E2E_SHARDS" -gt 1 ]] && SHARDED="true"
+E2E_DAG="${E2E_DAG:-false}"     # true → rebuild only stale CSVs/notebooks (scripts/pipeline/stage_dag.py)
+if [[ "$E2E_DAG" == "true" && "$SHARDED" == "true" ]]; then
+  say "E2E_DAG is not supported with sharded reports; running all CSV reports"
+  E2E_DAG="false"
+fi
 
 # Paths
 NEO4J_SETUP="$REPO_ROOT/scripts/neo4j/setup-neo4j.sh"
 NEO4J_START="$REPO_ROOT/scripts/neo4j/neo4j-start.sh"
 NEO4J_SMOKE="$REPO_ROOT/scripts/neo4j/neo4j-smoketest.sh"
 NEO4J_STOP="$REPO_ROOT/scripts/neo4j/neo4j-stop.sh"
+NEO4J_SNAPSHOT="$REPO_ROOT/scripts/neo4j/neo4j-snapshot.sh"
+NEO4J_MEMORY="$REPO_ROOT/scripts/neo4j/neo4j-memory.sh"
+NEO4J_WARMUP="$REPO_ROOT/scripts/neo4j/neo4j-warmup.sh"
+NEO4J_PAGECACHE_STATS="$REPO_ROOT/scripts/neo4j/pagecache_stats.py"
 
 JQA_SETUP="$REPO_ROOT/scripts/jqa/setup-jqassistant.sh"
 JQA_RUN="$REPO_ROOT/scripts/jqa/jqa-run.sh"
+JQA_RUN_SHARDED="$REPO_ROOT/scripts/jqa/jqa-run-sharded.sh"
+NEO4J_INSTANCE="$REPO_ROOT/scripts/neo4j/neo4j-instance.sh"
+
+ENRICH="$REPO_ROOT/scripts/enrichment/enrich-graph.sh"
 
 CSV_ALL="$REPO_ROOT/scripts/reports/AllCsvReports.sh"
+CSV_SHARDED="$REPO_ROOT/scripts/reports/ShardedCsvReports.sh"
 
 NB_RUN_ALL="$REPO_ROOT/scripts/jupyter/jupyter-run-notebooks.sh"
+STAGE_DAG="$REPO_ROOT/scripts/pipeline/stage_dag.py"
+STATIC_SITE="$REPO_ROOT/interface/static_site.py"
 
 CSV_OUT_BASE="${CSV_REPORTS_DIRECTORY:-$REPO_ROOT/reports/csv-reports}"
 NB_OUT_BASE="${REPORTS_DIR:-$REPO_ROOT/reports}/notebooks"
+SITE_OUT_BASE="${REPORTS_DIR:-$REPO_ROOT/reports}/site"
+
+# -------- Run manifest (timing/resources per stage, query and notebook) --------
+RUN_MANIFEST="$REPO_ROOT/scripts/pipeline/run_manifest.py"
+E2E_RUN_MANIFEST="${E2E_RUN_MANIFEST:-true}"
+command -v python3 >/dev/null 2>&1 || E2E_RUN_MANIFEST="false"
+if [[ "$E2E_RUN_MANIFEST" == "true" ]]; then
+  export E2E_RUN_ID="${E2E_RUN_ID:-$(date +'%Y%m%d-%H%M%S')}"
+  export E2E_RUN_MANIFEST_DIR="${E2E_RUN_MANIFEST_DIR:-${REPORTS_DIR:-$REPO_ROOT/reports}/run-manifests}"
+  finish_manifest() {
+    local rc=$? status="ok"
+    [[ $rc -eq 0 ]] || status="failed"
+    python3 "$RUN_MANIFEST" finish --status "$status" || true
+    python3 "$RUN_MANIFEST" trend --last "${E2E_RUN_TREND_LAST:-5}" --output "$E2E_RUN_MANIFEST_DIR/trend.md" || true
+  }
+  trap finish_manifest EXIT
+else
+  unset E2E_RUN_ID
+fi
+
+# timed <step> [--output-path=<path>] <command...>
+timed() {
+  local name="$1"; shift
+  local extra=()
+  if [[ "${1:-}" == --output-path=* ]]; then extra=(--output-path "${1#--output-path=}"); shift; fi
+  if [[ "$E2E_RUN_MANIFEST" == "true" ]]; then
+    python3 "$RUN_MANIFEST" exec --stage pipeline --name "$name" ${extra[@]+"${extra[@]}"} -- "$@"
+  else
+    "$@"
+  fi
+}
 
 # -------- Preflight / setup --------
 if [[ "$E2E_SKIP_SETUP" != "true" ]]; then
@@ -78,36 +138,117 @@ else
 fi
 
 # -------- Neo4j --------
+SCAN_RESTORED="false"
+# Scan inputs are hashed once (the whole of REPO_TO_ANALYZE); has/restore/save reuse the key
+SNAPSHOT_KEY=""
+if [[ "$E2E_SCAN_CACHE" == "true" && "$E2E_SKIP_JQA" != "true" && "$SHARDED" != "true" ]]; then
+  SNAPSHOT_KEY="$("$NEO4J_SNAPSHOT" key)"
+  export SNAPSHOT_KEY
+fi
 if [[ "$E2E_SKIP_NEO4J" != "true" ]]; then
-  [[ -x "$NEO4J_SETUP" ]] && { say "Neo4j setup"; "$NEO4J_SETUP"; }
-  say "Neo4j start"; "$NEO4J_START"
+  [[ -x "$NEO4J_SETUP" ]] && { say "Neo4j setup"; timed neo4j-setup "$NEO4J_SETUP"; }
+  # Same scan inputs as a cached snapshot → load it instead of re-scanning
+  if [[ -n "$SNAPSHOT_KEY" ]] && "$NEO4J_SNAPSHOT" has; then
+    say "Restoring scan snapshot ($SNAPSHOT_KEY)"
+    "$NEO4J_STOP"
+    timed snapshot-restore "$NEO4J_SNAPSHOT" restore
+    SCAN_RESTORED="true"
+  fi
+  say "Neo4j start"; timed neo4j-start "$NEO4J_START"
   [[ -x "$NEO4J_SMOKE" ]] && { say "Neo4j smoketest"; "$NEO4J_SMOKE"; }
 else
   say "Skipping Neo4j (E2E_SKIP_NEO4J=true)"
 fi
 
 # -------- jQAssistant --------
-if [[ "$E2E_SKIP_JQA" != "true" ]]; then
-  [[ -x "$JQA_SETUP" ]] && { say "jQAssistant setup"; "$JQA_SETUP"; }
-  say "jQAssistant run"; "$JQA_RUN"
+ENRICHED="false"
+if [[ "$SCAN_RESTORED" == "true" ]]; then
+  say "Skipping jQAssistant (restored from scan snapshot)"
+elif [[ "$E2E_SKIP_JQA" != "true" ]]; then
+  [[ -x "$JQA_SETUP" ]] && { say "jQAssistant setup"; timed jqa-setup "$JQA_SETUP"; }
+  if [[ "$SHARDED" == "true" ]]; then
+    say "jQAssistant run (sharded, E2E_SHARDS=$E2E_SHARDS)"; timed jqa-run-sharded "$JQA_RUN_SHARDED"
+  else
+    say "jQAssistant run"; timed jqa-run "$JQA_RUN"
+    if [[ "$E2E_SKIP_ENRICH" != "true" ]]; then
+      say "Graph enrichment"; timed enrichment "$ENRICH"
+      ENRICHED="true"
+    fi
+  fi
+  # The snapshot cache covers the main instance only
+  if [[ -n "$SNAPSHOT_KEY" ]]; then
+    # Offline dump: Neo4j has to be stopped while the snapshot is written
+    say "Saving scan snapshot"
+    "$NEO4J_STOP"
+    timed snapshot-save "$NEO4J_SNAPSHOT" save
+    say "Neo4j start"; "$NEO4J_START"
+  fi
 else
   say "Skipping jQAssistant (E2E_SKIP_JQA=true)"
 fi
 
+# -------- Memory sizing for the final store --------
+# The store only has its real size after the scan/restore; re-size and restart if needed
+if [[ "$E2E_SKIP_NEO4J" != "true" && "$SHARDED" != "true" ]]; then
+  say "Neo4j memory sizing"; timed neo4j-memory "$NEO4J_MEMORY" --restart-if-changed
+fi
+
+# -------- Enrichment of a graph that was not scanned by this run --------
+# Reports read the enriched properties: with E2E_SKIP_ENRICH=true the graph
+# must already be enriched (--check fails otherwise), else enrich it (no-op when up to date)
+if [[ "$ENRICHED" != "true" && "$SHARDED" != "true" && "$E2E_SKIP_CSV" != "true" ]]; then
+  if [[ "$E2E_SKIP_ENRICH" == "true" ]]; then
+    say "Checking graph enrichment (E2E_SKIP_ENRICH=true)"; "$ENRICH" --check
+  else
+    say "Graph enrichment"; timed enrichment "$ENRICH"
+  fi
+fi
+
+DAG_DONE="false"
+# -------- Stage DAG (CSV reports + notebooks, stale outputs only) --------
+if [[ "$E2E_DAG" == "true" && "$E2E_SKIP_CSV" != "true" ]]; then
+  mkdir -p "$CSV_OUT_BASE" "$NB_OUT_BASE"
+  if [[ "$E2E_SKIP_WARMUP" != "true" ]]; then
+    say "Neo4j warmup"; timed neo4j-warmup "$NEO4J_WARMUP"
+  fi
+  DAG_TARGETS=()
+  [[ "$E2E_SKIP_NOTEBOOKS" == "true" || "$E2E_REPORT_MODE" == "site" ]] && DAG_TARGETS=('csv:*' 'derived:*')
+  say "Stage DAG → $CSV_OUT_BASE, $NB_OUT_BASE"
+  timed stage-dag python3 "$STAGE_DAG" build --jobs "${E2E_DAG_JOBS:-4}" ${DAG_TARGETS[@]+"${DAG_TARGETS[@]}"}
+  timed pagecache-stats python3 "$NEO4J_PAGECACHE_STATS" --label csv-reports || true
+  DAG_DONE="true"
+fi
+
 # -------- CSV Reports --------
-if [[ "$E2E_SKIP_CSV" != "true" ]]; then
+if [[ "$DAG_DONE" == "true" ]]; then
+  :
+elif [[ "$E2E_SKIP_CSV" != "true" ]]; then
   mkdir -p "$CSV_OUT_BASE"
+  if [[ "$E2E_SKIP_WARMUP" != "true" && "$SHARDED" != "true" ]]; then
+    say "Neo4j warmup"; timed neo4j-warmup "$NEO4J_WARMUP"
+  fi
   say "CSV reports → $CSV_OUT_BASE"
-  "$CSV_ALL"
+  if [[ "$SHARDED" == "true" ]]; then
+    timed csv-reports --output-path="$CSV_OUT_BASE" "$CSV_SHARDED"
+  else
+    timed csv-reports --output-path="$CSV_OUT_BASE" "$CSV_ALL"
+  fi
+  if [[ "$SHARDED" != "true" ]]; then timed pagecache-stats python3 "$NEO4J_PAGECACHE_STATS" --label csv-reports || true; fi
 else
   say "Skipping CSV reports (E2E_SKIP_CSV=true)"
 fi
 
-# -------- Notebooks --------
-if [[ "$E2E_SKIP_NOTEBOOKS" != "true" ]]; then
+# -------- Notebooks / static site --------
+if [[ "$E2E_SKIP_NOTEBOOKS" != "true" && "$E2E_REPORT_MODE" == "site" ]]; then
+  say "Static report site → $SITE_OUT_BASE"
+  timed static-site --output-path="$SITE_OUT_BASE" \
+    python3 "$STATIC_SITE" --csv-dir "$CSV_OUT_BASE" --out-dir "$SITE_OUT_BASE" || say "Some site sections had errors"
+elif [[ "$DAG_DONE" == "true" ]]; then
+  :
+elif [[ "$E2E_SKIP_NOTEBOOKS" != "true" ]]; then
   mkdir -p "$NB_OUT_BASE"
   say "Notebooks (HTML by default) → $NB_OUT_BASE"
-  "$NB_RUN_ALL"
+  timed notebooks --output-path="$NB_OUT_BASE" "$NB_RUN_ALL"
 else
   say "Skipping notebooks (E2E_SKIP_NOTEBOOKS=true)"
 fi
@@ -130,6 +271,12 @@ say "Generating notebooks index: $INDEX_HTML"
 if [[ "$E2E_STOP_NEO4J" == "true" ]]; then
   say "Stopping Neo4j (E2E_STOP_NEO4J=true)"
   "$REPO_ROOT/scripts/neo4j/neo4j-stop.sh" || true
+  SHARDS_FILE="${E2E_INSTANCES_DIR:-$REPO_ROOT/runtime/instances}/shards.txt"
+  if [[ "$SHARDED" == "true" && -f "$SHARDS_FILE" ]]; then
+    while IFS= read -r shard; do
+      [[ -n "$shard" ]] && { "$NEO4J_INSTANCE" stop "$shard" || true; }
+    done < "$SHARDS_FILE"
+  fi
 fi
 
 say "Done."
@@ -137,3 +284,9 @@ say "Outputs:"
 say "  CSVs:      $CSV_OUT_BASE"
 say "  Notebooks: $NB_OUT_BASE"
 say "  Index:     $INDEX_HTML"
+if [[ "$E2E_REPORT_MODE" == "site" ]]; then
+  say "  Site:      $SITE_OUT_BASE/index.html"
+fi
+if [[ "$E2E_RUN_MANIFEST" == "true" ]]; then
+  say "  Manifest:  $E2E_RUN_MANIFEST_DIR/$E2E_RUN_ID.json"
+fi
@@ -0,0 +1,200 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Multi-project mode: runs pipeline-run-all.sh for every project listed in
+# config/projects.json (E2E_PROJECTS_FILE), several at once.
+#
+# The community edition serves a single user database, so each project gets
+# its own local Neo4j instance (scripts/neo4j/neo4j-instance.sh, instance
+# "project-<name>", ports offset by E2E_PROJECT_PORT_BASE + i * 100) sharing
+# the installation, plugins and jQAssistant of the main one.
+#
+# Limits:
+#   parallel projects  "parallel" in the JSON or E2E_PROJECTS_PARALLEL; by
+#                      default as many as fit into NEO4J_MEMORY_SHARE percent
+#                      of the host RAM (instance heap + page cache + jQAssistant
+#                      and notebooks, E2E_PROJECT_CLIENT_MEMORY) and half the CPUs
+#   memory/instance    "instance_heap" / "instance_pagecache" in the JSON or
+#                      E2E_INSTANCE_HEAP / E2E_INSTANCE_PAGECACHE
+#   CPU priority       E2E_PROJECTS_NICE (nice level of the project pipelines)
+#
+# Outputs: reports/projects/<name>/{csv-reports,notebooks,run-manifests},
+# the log in reports/projects/<name>/pipeline.log and a combined index at
+# reports/projects/index.html. An instance is stopped when its project is
+# done unless E2E_PROJECTS_KEEP_RUNNING=true.
+#
+# Usage: scripts/pipeline-run-projects.sh [project-name ...]
+
+if [[ -n "${BASH_SOURCE:-}" ]]; then _SELF="${BASH_SOURCE[0]}"; elif [[ -n "${ZSH_VERSION:-}" ]]; then _SELF="${(%):-%N}"; else _SELF="$0"; fi
+SCRIPT_DIR="$(cd "$(dirname -- "$_SELF")" && pwd -P)"
+REPO_ROOT="$(cd "$SCRIPT_DIR/.." && pwd -P)"
+
+say() { printf '[%s] %s\n' "$(date +'%H:%M:%S')" "$*"; }
+
+ENV_FILE="$REPO_ROOT/scripts/env.sh"
+[[ -f "$ENV_FILE" ]] || cp "$REPO_ROOT/scripts/env-example.sh" "$ENV_FILE"
+# shellcheck disable=SC1090
+source "$ENV_FILE"
+
+PROJECTS_FILE="${E2E_PROJECTS_FILE:-$REPO_ROOT/config/projects.json}"
+[[ -f "$PROJECTS_FILE" ]] || { echo "[error] Missing $PROJECTS_FILE (see config/projects-example.json)"; exit 1; }
+command -v jq >/dev/null 2>&1 || { echo "[error] jq is required."; exit 1; }
+
+PIPELINE="$REPO_ROOT/scripts/pipeline-run-all.sh"
+NEO4J_SETUP="$REPO_ROOT/scripts/neo4j/setup-neo4j.sh"
+NEO4J_INSTANCE="$REPO_ROOT/scripts/neo4j/neo4j-instance.sh"
+JQA_SETUP="$REPO_ROOT/scripts/jqa/setup-jqassistant.sh"
+
+OUT_BASE="${REPORTS_DIR:-$REPO_ROOT/reports}/projects"
+INSTANCES_DIR="${E2E_INSTANCES_DIR:-$REPO_ROOT/runtime/instances}"
+PORT_BASE="${E2E_PROJECT_PORT_BASE:-1000}"
+NICE_LEVEL="${E2E_PROJECTS_NICE:-0}"
+KEEP_RUNNING="${E2E_PROJECTS_KEEP_RUNNING:-false}"
+
+json_value() { jq -er --arg k "$1" '.[$k] // empty' "$PROJECTS_FILE" 2>/dev/null || true; }
+
+export E2E_INSTANCE_HEAP="${E2E_INSTANCE_HEAP:-$(json_value instance_heap)}"
+export E2E_INSTANCE_HEAP="${E2E_INSTANCE_HEAP:-2g}"
+export E2E_INSTANCE_PAGECACHE="${E2E_INSTANCE_PAGECACHE:-$(json_value instance_pagecache)}"
+export E2E_INSTANCE_PAGECACHE="${E2E_INSTANCE_PAGECACHE:-1g}"
+
+# "<name>\t<input_path>\t<scope package>" per project
+NAMES=(); INPUTS=(); SCOPES=()
+while IFS=$'\t' read -r name input scope; do
+  [[ -n "$name" ]] || continue
+  if [[ $# -gt 0 ]]; then
+    wanted="false"
+    for arg in "$@"; do [[ "$arg" == "$name" ]] && wanted="true"; done
+    [[ "$wanted" == "true" ]] || continue
+  fi
+  NAMES+=("$name"); INPUTS+=("$input"); SCOPES+=("$scope")
+done < <(jq -r '.projects[] | [.name, .input_path, ((.packages // [])[0] // "")] | @tsv' "$PROJECTS_FILE")
+[[ ${#NAMES[@]} -gt 0 ]] || { echo "[error] No projects selected from $PROJECTS_FILE"; exit 1; }
+
+# -------- Concurrency limit --------
+cpu_count() { getconf _NPROCESSORS_ONLN 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 2; }
+host_memory_mb() {
+  if [[ "$(uname)" == "Darwin" ]]; then echo $(( $(sysctl -n hw.memsize) / 1048576 ));
+  else awk '/^MemTotal:/ { print int($2 / 1024) }' /proc/meminfo; fi
+}
+to_mb() {
+  echo "$1" | awk '{
+    v = $0; u = tolower(substr(v, length(v), 1)); n = substr(v, 1, length(v) - 1) + 0
+    if (u == "k") print int(n / 1024); else if (u == "m") print int(n);
+    else if (u == "g") print int(n * 1024); else print int(v / 1048576)
+  }'
+}
+
+PARALLEL="${E2E_PROJECTS_PARALLEL:-$(json_value parallel)}"
+if [[ -z "$PARALLEL" ]]; then
+  per_project_mb=$(( $(to_mb "$E2E_INSTANCE_HEAP") + $(to_mb "$E2E_INSTANCE_PAGECACHE") + $(to_mb "${E2E_PROJECT_CLIENT_MEMORY:-3g}") ))
+  by_memory=$(( $(host_memory_mb) * ${NEO4J_MEMORY_SHARE:-60} / 100 / per_project_mb ))
+  by_cpu=$(( $(cpu_count) / 2 ))
+  PARALLEL=$by_memory; [[ $by_cpu -lt $PARALLEL ]] && PARALLEL=$by_cpu
+fi
+[[ "$PARALLEL" -lt 1 ]] && PARALLEL=1
+say "Projects: ${#NAMES[@]} (parallel ${PARALLEL}, heap ${E2E_INSTANCE_HEAP}, page cache ${E2E_INSTANCE_PAGECACHE} per instance)"
+
+# -------- Shared setup (once) --------
+if [[ "${E2E_SKIP_SETUP:-false}" != "true" ]]; then
+  if [[ -z "${VIRTUAL_ENV:-}" ]]; then
+    [[ -d "$REPO_ROOT/.venv" ]] || python3 -m venv "$REPO_ROOT/.venv"
+    # shellcheck disable=SC1091
+    source "$REPO_ROOT/.venv/bin/activate"
+  fi
+  [[ -f "$REPO_ROOT/requirements.txt" ]] && pip install -q -r "$REPO_ROOT/requirements.txt"
+  say "Neo4j setup"; "$NEO4J_SETUP"
+  say "jQAssistant setup"; "$JQA_SETUP"
+fi
+
+# -------- One project --------
+run_project() {
+  local i="$1" name="${NAMES[$1]}" input="${INPUTS[$1]}" scope="${SCOPES[$1]}"
+  local instance="project-${name}" out="${OUT_BASE}/${name}"
+  local dir="${INSTANCES_DIR}/${instance}" started rc
+  started=$(date +%s)
+  rm -f "$out/status"
+  mkdir -p "$out"
+
+  "$NEO4J_INSTANCE" setup "$instance" $(( PORT_BASE + i * 100 ))
+  {
+    cat "$dir/instance.env"
+    echo "export REPO_TO_ANALYZE=\"${input}\""
+    echo "export SCOPE_PACKAGE=\"${scope}\""
+    echo "export REPORTS_DIR=\"${out}\""
+    echo "export REPORTS_DIRECTORY=\"${out}\""
+    echo "export CSV_REPORTS_DIRECTORY=\"${out}/csv-reports\""
+    echo "export E2E_DAG_STATE=\"${dir}/dag-state.json\""
+  } > "$dir/project.env"
+
+  rc=0
+  if "$NEO4J_INSTANCE" start "$instance"; then
+    E2E_PROJECT_ENV="$dir/project.env" E2E_SKIP_SETUP=true E2E_SKIP_NEO4J=true E2E_SHARDS=0 \
+      E2E_STOP_NEO4J=false E2E_RUN_ID="$(date +'%Y%m%d-%H%M%S')-${name}" \
+      nice -n "$NICE_LEVEL" "$PIPELINE" || rc=$?
+  else
+    rc=1
+  fi
+  [[ "$KEEP_RUNNING" == "true" ]] || "$NEO4J_INSTANCE" stop "$instance" || true
+
+  if [[ $rc -eq 0 ]]; then
+    echo "ok $(( $(date +%s) - started ))" > "$out/status"
+  else
+    echo "failed $(( $(date +%s) - started ))" > "$out/status"
+  fi
+  return $rc
+}
+
+# -------- Scheduler (bash 3.2: no wait -n, poll the running jobs) --------
+mkdir -p "$OUT_BASE"
+RUN_PIDS=(); RUN_IDX=()
+FAILED=0
+next=0
+
+reap() {
+  local k pid alive_pids=() alive_idx=()
+  for ((k = 0; k < ${#RUN_PIDS[@]}; k++)); do
+    pid="${RUN_PIDS[k]}"
+    if kill -0 "$pid" 2>/dev/null; then
+      alive_pids+=("$pid"); alive_idx+=("${RUN_IDX[k]}")
+    elif wait "$pid"; then
+      say "✔ ${NAMES[${RUN_IDX[k]}]} done"
+    else
+      say "✘ ${NAMES[${RUN_IDX[k]}]} failed, see ${OUT_BASE}/${NAMES[${RUN_IDX[k]}]}/pipeline.log"
+      FAILED=$((FAILED + 1))
+    fi
+  done
+  RUN_PIDS=(${alive_pids[@]+"${alive_pids[@]}"}); RUN_IDX=(${alive_idx[@]+"${alive_idx[@]}"})
+}
+
+while [[ $next -lt ${#NAMES[@]} || ${#RUN_PIDS[@]} -gt 0 ]]; do
+  while [[ $next -lt ${#NAMES[@]} && ${#RUN_PIDS[@]} -lt $PARALLEL ]]; do
+    mkdir -p "${OUT_BASE}/${NAMES[next]}"
+    say "▶ ${NAMES[next]} (${INPUTS[next]}) → ${OUT_BASE}/${NAMES[next]}"
+    run_project "$next" > "${OUT_BASE}/${NAMES[next]}/pipeline.log" 2>&1 &
+    RUN_PIDS+=($!); RUN_IDX+=("$next")
+    next=$((next + 1))
+  done
+  sleep 2
+  reap
+done
+
+# -------- Combined index --------
+INDEX_HTML="$OUT_BASE/index.html"
+{
+  echo '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Project Reports</title></head><body>'
+  echo '<h1>Project Reports</h1><table border="1" cellpadding="4">'
+  echo '<tr><th>Project</th><th>Scope</th><th>Status</th><th>Duration</th><th>Reports</th></tr>'
+  for ((i = 0; i < ${#NAMES[@]}; i++)); do
+    name="${NAMES[i]}"
+    status="missing"; seconds=""
+    [[ -f "$OUT_BASE/$name/status" ]] && read -r status seconds < "$OUT_BASE/$name/status"
+    echo "<tr><td>${name}</td><td>${SCOPES[i]:-FULL}</td><td>${status}</td><td>${seconds:+${seconds}s}</td>"
+    echo "<td><a href=\"./${name}/notebooks/index.html\">notebooks</a> · <a href=\"./${name}/csv-reports/\">csv</a> · <a href=\"./${name}/pipeline.log\">log</a></td></tr>"
+  done
+  echo '</table></body></html>'
+} > "$INDEX_HTML"
+
+say "Done: $(( ${#NAMES[@]} - FAILED )) ok, ${FAILED} failed"
+say "Index: $INDEX_HTML"
+[[ $FAILED -eq 0 ]]
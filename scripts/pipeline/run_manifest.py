@@ -0,0 +1,268 @@
+"""Per-step timing and resource manifest for pipeline runs.
+
+Every pipeline stage and sub-step (each Cypher query, each notebook) is run
+through `exec`, which records wall time, CPU time, peak RSS, exit code and
+output size (rows/bytes) as one JSON line in
+<dir>/<run id>.jsonl. Other scripts may append records with a "metric" key
+(e.g. the page cache hit ratio of scripts/neo4j/pagecache_stats.py), which
+end up under "metrics" instead of "steps". `finish` folds the lines into <dir>/<run id>.json and
+`trend` compares the last N runs step by step.
+
+The run is selected with E2E_RUN_ID and the directory with
+E2E_RUN_MANIFEST_DIR (default: reports/run-manifests); pipeline-run-all.sh
+sets both.
+
+Usage:
+  run_manifest.py exec --stage cypher --name Dependencies/X.cypher --count-output -- cmd args...
+  run_manifest.py exec --stage notebook --name Overview --output-path reports/notebooks/Overview -- cmd...
+  run_manifest.py finish [--status ok|failed]
+  run_manifest.py trend [--last 5] [--threshold 0.2] [--output trend.md]
+"""
+import argparse
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import signal
+import subprocess
+import sys
+import time
+
+DEFAULT_DIR = Path(__file__).resolve().parents[2] / "reports" / "run-manifests"
+CHUNK_SIZE = 1 << 16
+
+
+def manifest_dir() -> Path:
+    return Path(os.environ.get("E2E_RUN_MANIFEST_DIR") or DEFAULT_DIR)
+
+
+def run_id() -> str:
+    return os.environ.get("E2E_RUN_ID", "")
+
+
+def _now() -> str:
+    return datetime.now().astimezone().isoformat(timespec="seconds")
+
+
+def _max_rss_mb(rusage) -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(rusage.ru_maxrss / scale, 1)
+
+
+def _path_size(path: Path):
+    """(bytes, CSV rows) of a file or directory tree."""
+    if not path.exists():
+        return 0, 0
+    files = [path] if path.is_file() else [p for p in path.rglob("*") if p.is_file()]
+    total_bytes, rows = 0, 0
+    for f in files:
+        total_bytes += f.stat().st_size
+        if f.suffix == ".csv":
+            with f.open("rb") as fh:
+                rows += max(sum(1 for _ in fh) - 1, 0)
+    return total_bytes, rows
+
+
+def append_record(record: dict):
+    """Append one step record to the current run (no-op without a run id)."""
+    if not run_id():
+        return
+    directory = manifest_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(record, sort_keys=True) + "\n"
+    # Single O_APPEND write: safe for concurrent steps
+    fd = os.open(directory / f"{run_id()}.jsonl", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def exec_step(stage: str, name: str, command: list, count_output: bool = False, output_path: str = None) -> int:
+    """Run a command, record its resource usage and return its exit code."""
+    started = _now()
+    t0 = time.monotonic()
+    stdout = subprocess.PIPE if count_output else None
+    proc = subprocess.Popen(command, stdout=stdout)
+
+    # Ctrl-C reaches the child through the process group; forward explicit terminations
+    previous = {
+        signal.SIGINT: signal.signal(signal.SIGINT, signal.SIG_IGN),
+        signal.SIGTERM: signal.signal(signal.SIGTERM, lambda signum, _frame: proc.send_signal(signum)),
+    }
+
+    out_bytes, out_lines = 0, 0
+    try:
+        if count_output:
+            sink = sys.stdout.buffer
+            while True:
+                chunk = proc.stdout.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                out_bytes += len(chunk)
+                out_lines += chunk.count(b"\n")
+                sink.write(chunk)
+            sink.flush()
+            proc.stdout.close()
+        _, status, rusage = os.wait4(proc.pid, 0)
+    finally:
+        for s, handler in previous.items():
+            signal.signal(s, handler)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    record = {
+        "run": run_id(),
+        "stage": stage,
+        "name": name,
+        "started": started,
+        "wallSeconds": round(time.monotonic() - t0, 3),
+        "cpuUserSeconds": round(rusage.ru_utime, 3),
+        "cpuSystemSeconds": round(rusage.ru_stime, 3),
+        "maxRssMB": _max_rss_mb(rusage),
+        "exitCode": proc.returncode,
+    }
+    if count_output:
+        record["outputBytes"] = out_bytes
+        record["rows"] = max(out_lines - 1, 0)  # CSV lines minus header
+    if output_path:
+        record["outputBytes"], record["rows"] = _path_size(Path(output_path))
+    append_record(record)
+    return proc.returncode
+
+
+def _load_steps(jsonl: Path) -> list:
+    steps = []
+    with jsonl.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                steps.append(json.loads(line))
+    return steps
+
+
+def finish_run(status: str = "ok") -> Path:
+    """Fold the step lines of the current run into <run id>.json."""
+    directory = manifest_dir()
+    jsonl = directory / f"{run_id()}.jsonl"
+    records = _load_steps(jsonl) if jsonl.exists() else []
+    steps = [r for r in records if "metric" not in r]
+    metrics = [r for r in records if "metric" in r]
+
+    stages = {}
+    for step in steps:
+        total = stages.setdefault(step["stage"], {"steps": 0, "wallSeconds": 0.0, "cpuSeconds": 0.0, "maxRssMB": 0.0})
+        total["steps"] += 1
+        total["wallSeconds"] = round(total["wallSeconds"] + step["wallSeconds"], 3)
+        total["cpuSeconds"] = round(total["cpuSeconds"] + step["cpuUserSeconds"] + step["cpuSystemSeconds"], 3)
+        total["maxRssMB"] = max(total["maxRssMB"], step["maxRssMB"])
+
+    manifest = {
+        "run": run_id(),
+        "status": status,
+        "started": steps[0]["started"] if steps else None,
+        "finished": _now(),
+        "host": {"system": platform.system(), "machine": platform.machine(), "cpus": os.cpu_count()},
+        "inputs": {k: os.environ.get(k) for k in ("REPO_TO_ANALYZE", "SCOPE_PACKAGE")},
+        "stages": stages,
+        "steps": steps,
+        "metrics": metrics,
+    }
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / f"{run_id()}.json"
+    target.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    if jsonl.exists():
+        jsonl.unlink()
+    return target
+
+
+def trend_report(last: int = 5, threshold: float = 0.2) -> str:
+    """Markdown table of wall seconds per step over the last runs.
+
+    A step is flagged when the latest run is slower than the median of the
+    previous runs by more than `threshold` (and at least one second).
+    """
+    runs = []
+    for path in manifest_dir().glob("*.json"):
+        try:
+            runs.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    runs = sorted(runs, key=lambda r: r.get("started") or "")[-last:]
+    if not runs:
+        return "No run manifests found.\n"
+
+    keys = []
+    walls = []  # one {(stage, name): seconds} per run
+    for run in runs:
+        per_step = {}
+        for step in run.get("steps", []):
+            key = (step["stage"], step["name"])
+            per_step[key] = per_step.get(key, 0.0) + step["wallSeconds"]
+            if key not in keys:
+                keys.append(key)
+        walls.append(per_step)
+
+    header = ["stage", "step"] + [r["run"] for r in runs] + ["change"]
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for key in keys:
+        values = [w.get(key) for w in walls]
+        previous = sorted(v for v in values[:-1] if v is not None)
+        latest = values[-1]
+        change = ""
+        if previous and latest is not None:
+            median = previous[len(previous) // 2]
+            if median > 0:
+                delta = (latest - median) / median
+                change = f"{delta:+.0%}"
+                if delta > threshold and latest - median >= 1.0:
+                    change += " ⚠"
+        cells = [key[0], key[1]] + ["" if v is None else f"{v:.1f}" for v in values] + [change]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pipeline run manifest.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_exec = sub.add_parser("exec", help="Run a command and record its resource usage")
+    p_exec.add_argument("--stage", required=True)
+    p_exec.add_argument("--name", required=True)
+    p_exec.add_argument("--count-output", action="store_true", help="Pass stdout through and count bytes/rows")
+    p_exec.add_argument("--output-path", help="File or directory whose size/rows are recorded after the step")
+    p_exec.add_argument("cmd", nargs=argparse.REMAINDER)
+
+    p_finish = sub.add_parser("finish", help="Write the JSON manifest of the current run")
+    p_finish.add_argument("--status", default="ok")
+
+    p_trend = sub.add_parser("trend", help="Compare the last runs step by step")
+    p_trend.add_argument("--last", type=int, default=5)
+    p_trend.add_argument("--threshold", type=float, default=0.2)
+    p_trend.add_argument("--output", type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "exec":
+        cmd = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+        if not cmd:
+            parser.error("exec needs a command after --")
+        return exec_step(args.stage, args.name, cmd, args.count_output, args.output_path)
+
+    if args.command == "finish":
+        if not run_id():
+            print("[info] E2E_RUN_ID not set; no run manifest written.")
+            return 0
+        print(f"[info] Run manifest → {finish_run(args.status)}")
+        return 0
+
+    report = trend_report(args.last, args.threshold)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+    print(report, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
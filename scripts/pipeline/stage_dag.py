@@ -0,0 +1,571 @@
+"""Content-hash aware build of the report stages (make-like).
+
+Every output declares its inputs and is only rebuilt when the content hash of
+one of them changed (or an output it produced last time is gone). Independent
+targets are rebuilt in parallel.
+
+Targets, derived from the repo instead of a hand-written list:
+  scan                     source only: contents of REPO_TO_ANALYZE, jqassistant/
+                           configuration and jQAssistant/Neo4j versions. The scan
+                           itself stays with the pipeline (incremental scan,
+                           snapshot cache, shards).
+  enrichment               scripts/enrichment/enrich-graph.sh (always invoked, it is
+                           a no-op on an already enriched graph; with
+                           E2E_SKIP_ENRICH=true only --check, which fails on a
+                           graph that was never enriched)
+  csv:<Section>/<Name>     one per `execute_cypher ... > ${OUT_DIR}/<Name>.csv` line of
+                           scripts/reports/categories/*Csv.sh; inputs: the Cypher
+                           file, its parameters, the scope and the enrichment
+  derived:<Section>/<py>   `python3 interface/analysis/<py> --csv-dir ${OUT_DIR}` lines;
+                           inputs: the script and the CSVs it reads
+  notebook:<Stem>          jupyter/<Stem>.ipynb; inputs: the notebook, the CSVs it
+                           reads (CATEGORY + "*.csv" literals), the Cypher files it
+                           runs and the chart modules it imports
+
+Upstream outputs are hashed after they are rebuilt, so a query whose CSV comes
+out identical does not trigger its notebooks. Hashes and stamps are kept in
+runtime/dag/state.json (E2E_DAG_STATE); file hashes are reused while size and
+mtime are unchanged.
+
+Usage:
+  stage_dag.py build [--jobs 4] [--dry-run] [--force] [pattern ...]
+  stage_dag.py status [pattern ...]
+  stage_dag.py explain <target>
+  stage_dag.py list
+Patterns are fnmatch globs on target names, e.g. 'csv:Security/*'. Selected
+targets bring their stale upstream targets with them.
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import shlex
+import subprocess
+import sys
+import threading
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CATEGORIES_DIR = REPO_ROOT / "scripts" / "reports" / "categories"
+CYPHER_HELPERS = REPO_ROOT / "scripts" / "cypher" / "cypher-helpers.sh"
+ENRICH = REPO_ROOT / "scripts" / "enrichment" / "enrich-graph.sh"
+EXEC_NOTEBOOK = REPO_ROOT / "scripts" / "jupyter" / "jupyter-exec-notebook.sh"
+NOTEBOOKS_DIR = REPO_ROOT / "jupyter"
+CHARTS_DIR = REPO_ROOT / "interface" / "charts"
+UTILS_DIR = REPO_ROOT / "interface" / "utils"
+SCOPE_CONFIG = REPO_ROOT / "config" / "analysis-scope.json"
+JQA_CONF_DIR = REPO_ROOT / "jqassistant"
+
+CHUNK_SIZE = 1 << 20
+
+QUERY_LINE = re.compile(
+    r'^\s*(execute_cypher(?:_no_src|_md)?)\s+"\$\{SRC_DIR\}/([^"]+\.cypher)"(.*?)>\s*"\$\{OUT_DIR\}/([^"]+)"')
+DERIVED_LINE = re.compile(r'^\s*python3\s+"\$\{REPO_ROOT\}/([^"]+\.py)"\s+--csv-dir\s+"\$\{OUT_DIR\}"')
+SECTION_LINE = re.compile(r'^SECTION="([^"]+)"', re.M)
+
+# Analysis scripts run over a section's CSVs: (CSVs read, CSVs written).
+# Scripts not listed here depend on every CSV of their section.
+DERIVED_IO = {
+    "impact_index.py": (
+        ["Package_Dependencies.csv", "Package_Dependencies_Classes.csv"],
+        ["Impact_Index_Packages.csv", "Impact_Index_Packages_Edges.csv",
+         "Impact_Index_Types.csv", "Impact_Index_Types_Edges.csv"],
+    ),
+    "class_similarity.py": (
+        ["Package_Dependencies_Classes.csv"],
+        ["Class_Similarity_Clusters.csv", "Class_Similarity_Pairs.csv"],
+    ),
+}
+
+
+def csv_base() -> Path:
+    return Path(os.environ.get("CSV_REPORTS_DIRECTORY") or REPO_ROOT / "reports" / "csv-reports")
+
+
+def notebooks_base() -> Path:
+    return Path(os.environ.get("REPORTS_DIRECTORY") or os.environ.get("REPORTS_DIR")
+                or REPO_ROOT / "reports") / "notebooks"
+
+
+def state_path() -> Path:
+    return Path(os.environ.get("E2E_DAG_STATE") or REPO_ROOT / "runtime" / "dag" / "state.json")
+
+
+def _key(path: Path) -> str:
+    """Path as stored in the state file (relative to the repo when inside it)."""
+    path = Path(path)
+    try:
+        return str(path.resolve().relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _digest(lines) -> str:
+    h = hashlib.sha256()
+    for line in lines:
+        h.update(line.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()[:16]
+
+
+# ----------------------------------------------------------------------
+# Targets
+# ----------------------------------------------------------------------
+
+class Target:
+    """One buildable output (or a source fingerprint) of the report pipeline.
+
+    inputs:  files whose content is hashed
+    deps:    upstream targets (their output hashes, or fingerprint, are inputs)
+    params:  extra key/value inputs (scope, parameters, environment knobs)
+    outputs: files the command writes
+    always:  run the command every time (it checks its own state); downstream
+             targets still only see its fingerprint
+    optional: a failure is reported but does not fail the build
+    """
+
+    def __init__(self, name, command=None, inputs=(), deps=(), params=None, outputs=(), stdout=None,
+                 always=False, optional=False):
+        self.name = name
+        self.command = command
+        self.inputs = [Path(p) for p in inputs]
+        self.deps = list(deps)
+        self.params = dict(params or {})
+        self.outputs = [Path(p) for p in outputs]
+        self.stdout = Path(stdout) if stdout else None
+        self.always = always
+        self.optional = optional
+
+    def __repr__(self):
+        return f"Target({self.name!r})"
+
+
+def _tree_files(path: Path) -> list:
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        return []
+    files = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != ".git")
+        files.extend(Path(root) / n for n in sorted(names) if n != ".DS_Store")
+    return files
+
+
+def scope_params() -> dict:
+    return {"SCOPE_PACKAGE": os.environ.get("SCOPE_PACKAGE", "")}
+
+
+def category_steps() -> list:
+    """Steps of the category scripts, in script order.
+
+    Queries: {"kind": "query", "section", "name", "helper", "cypher", "args", "csv"}
+    Derived: {"kind": "derived", "section", "script", "reads", "writes"}
+    (cypher/script are paths, csv/reads/writes are file names in the section directory)
+    """
+    steps = []
+    for script in sorted(CATEGORIES_DIR.glob("*Csv.sh")):
+        text = script.read_text(encoding="utf-8")
+        match = SECTION_LINE.search(text)
+        if not match:
+            continue
+        section = match.group(1)
+        written = []
+        for line in text.splitlines():
+            query = QUERY_LINE.match(line)
+            if query:
+                helper, cypher_file, args, csv_name = query.groups()
+                steps.append({"kind": "query", "section": section, "name": Path(csv_name).stem, "helper": helper,
+                              "cypher": REPO_ROOT / "cypher" / section / cypher_file,
+                              "args": shlex.split(args), "csv": csv_name})
+                written.append(csv_name)
+                continue
+            derived = DERIVED_LINE.match(line)
+            if derived:
+                script_path = REPO_ROOT / derived.group(1)
+                reads, writes = DERIVED_IO.get(script_path.name, (list(written), []))
+                steps.append({"kind": "derived", "section": section, "script": script_path,
+                              "reads": reads, "writes": writes})
+    return steps
+
+
+def category_targets(enrichment: str) -> list:
+    """CSV and derived targets of the category scripts."""
+    targets = []
+    base = csv_base()
+    producers = {}  # (section, csv name) -> target name
+    for step in category_steps():
+        out_dir = base / step["section"]
+        if step["kind"] == "query":
+            name = f"csv:{step['section']}/{step['name']}"
+            targets.append(Target(
+                name,
+                command=["bash", "-c", 'source "$1"; shift; "$@"', "_", str(CYPHER_HELPERS),
+                         step["helper"], str(step["cypher"])] + step["args"],
+                inputs=[step["cypher"], SCOPE_CONFIG],
+                deps=[enrichment],
+                params=dict(scope_params(), helper=step["helper"], args=" ".join(step["args"])),
+                outputs=[out_dir / step["csv"]],
+                stdout=out_dir / step["csv"],
+            ))
+            producers[(step["section"], step["csv"])] = name
+        else:
+            targets.append(Target(
+                f"derived:{step['section']}/{step['script'].name}",
+                command=[sys.executable, str(step["script"]), "--csv-dir", str(out_dir)],
+                inputs=[step["script"]] + [out_dir / c for c in step["reads"]],
+                deps=[producers[(step["section"], c)] for c in step["reads"] if (step["section"], c) in producers],
+                outputs=[out_dir / c for c in step["writes"]],
+            ))
+    return targets
+
+
+def notebook_inputs(nb_path: Path) -> dict:
+    """What a notebook reads: category, CSV files, Cypher files, chart modules, graph access.
+
+    Notebooks name their category (CATEGORY = "...") and the CSV files they read
+    as string literals; Cypher files are referenced as ../cypher/... paths.
+    """
+    nb = json.loads(Path(nb_path).read_text(encoding="utf-8"))
+    source = "\n".join("".join(c.get("source", [])) for c in nb.get("cells", []) if c.get("cell_type") == "code")
+
+    category = re.search(r'^CATEGORY\s*=\s*["\']([^"\']+)["\']', source, re.M)
+    csvs = []
+    for literal in sorted(set(re.findall(r'["\']([\w./-]+\.csv)["\']', source))):
+        if "/" in literal:
+            csvs.append(literal)
+        elif category:
+            csvs.append(f"{category.group(1)}/{literal}")
+
+    cyphers = sorted({(NOTEBOOKS_DIR / p).resolve()
+                      for p in re.findall(r'["\']([\w./-]+\.cypher)["\']', source)})
+    modules = sorted({CHARTS_DIR / f"{m}.py" for m in re.findall(r'^\s*from\s+charts\.(\w+)\s+import', source, re.M)})
+    uses_graph = bool(cyphers) or re.search(r'^\s*(from|import)\s+neo4j\b', source, re.M) is not None
+    return {"category": category.group(1) if category else None, "csvs": csvs, "cyphers": cyphers,
+            "modules": modules, "uses_graph": uses_graph}
+
+
+def notebook_targets(csv_producers: dict, enrichment: str) -> list:
+    targets = []
+    postfix = os.environ.get("JUPYTER_OUTPUT_FILE_POSTFIX", "")
+    for nb_path in sorted(NOTEBOOKS_DIR.glob("*.ipynb")):
+        found = notebook_inputs(nb_path)
+        csv_paths = [csv_base() / c for c in found["csvs"]]
+        # Produced CSVs come in through their target's output hashes
+        deps = sorted({csv_producers[p] for p in csv_paths if p in csv_producers})
+        csv_paths = [p for p in csv_paths if p not in csv_producers]
+        if found["uses_graph"]:
+            deps.append(enrichment)
+        modules = found["modules"]
+        if modules:
+            modules = modules + sorted(UTILS_DIR.glob("*.py"))
+        out_dir = notebooks_base() / nb_path.stem
+        targets.append(Target(
+            f"notebook:{nb_path.stem}",
+            command=[str(EXEC_NOTEBOOK), str(nb_path), str(out_dir)],
+            inputs=[nb_path, EXEC_NOTEBOOK] + csv_paths + found["cyphers"] + modules,
+            deps=deps,
+            params={k: os.environ.get(k, "") for k in
+                    ("JUPYTER_OUTPUT_FILE_POSTFIX", "ENABLE_NOTEBOOK_IPYNB", "ENABLE_NOTEBOOK_MD")},
+            outputs=[out_dir / f"{nb_path.stem}{postfix}.html"],
+            optional=True,
+        ))
+    return targets
+
+
+def build_graph() -> dict:
+    """All targets by name."""
+    scan = Target("scan", inputs=_tree_files(JQA_CONF_DIR), params={
+        "REPO_TO_ANALYZE": os.environ.get("REPO_TO_ANALYZE", ""),
+        "jqassistant": os.environ.get("JQASSISTANT_CLI_VERSION", ""),
+        "neo4j": f'{os.environ.get("NEO4J_EDITION", "")}-{os.environ.get("NEO4J_VERSION", "")}',
+    })
+    target = os.environ.get("REPO_TO_ANALYZE")
+    if target:
+        scan.inputs += _tree_files(Path(target))
+    # E2E_SKIP_ENRICH: the enrichment stays a fingerprint but is only checked, not run
+    skip_enrich = os.environ.get("E2E_SKIP_ENRICH") == "true"
+    enrichment = Target("enrichment", command=[str(ENRICH)] + (["--check"] if skip_enrich else []),
+                        inputs=sorted((REPO_ROOT / "cypher" / "Enrichment").glob("*.cypher")),
+                        deps=["scan"], always=True)
+
+    targets = [scan, enrichment] + category_targets(enrichment.name)
+    producers = {out: t.name for t in targets for out in t.outputs}
+    targets += notebook_targets(producers, enrichment.name)
+
+    graph = {t.name: t for t in targets}
+    for t in targets:
+        for dep in t.deps:
+            if dep not in graph:
+                raise ValueError(f"{t.name}: unknown dependency {dep}")
+    return graph
+
+
+def upstream_closure(graph: dict, names) -> list:
+    """Targets in `names` plus everything they depend on, in topological order."""
+    order, seen = [], set()
+
+    def visit(name, path=()):
+        if name in path:
+            raise ValueError("Dependency cycle: " + " -> ".join(path + (name,)))
+        if name in seen:
+            return
+        for dep in graph[name].deps:
+            visit(dep, path + (name,))
+        seen.add(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+# ----------------------------------------------------------------------
+# State and hashing
+# ----------------------------------------------------------------------
+
+class State:
+    """Stamps per target and a (size, mtime) → sha256 cache per file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        data = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                data = {}
+        self.targets = data.get("targets", {})
+        self.files = data.get("files", {})
+
+    def file_hash(self, path: Path) -> str:
+        key = _key(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return "missing"
+        with self.lock:
+            cached = self.files.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        h = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                h.update(chunk)
+        digest = h.hexdigest()[:16]
+        with self.lock:
+            self.files[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def save(self):
+        with self.lock:
+            data = json.dumps({"targets": self.targets, "files": self.files}, indent=1, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(data, encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def fingerprint(target: Target, state: State) -> str:
+    """What downstream targets see of a target: its output hashes, else its input hash."""
+    stamp = state.targets.get(target.name, {})
+    if target.outputs:
+        return _digest(f"{k} {v}" for k, v in sorted(stamp.get("outputs", {}).items()))
+    return _digest(f"{k} {v}" for k, v in sorted(stamp.get("inputs", {}).items()))
+
+
+def current_inputs(target: Target, graph: dict, state: State) -> dict:
+    inputs = {f"file:{_key(p)}": state.file_hash(p) for p in target.inputs}
+    inputs.update({f"dep:{d}": fingerprint(graph[d], state) for d in target.deps})
+    inputs.update({f"param:{k}": str(v) for k, v in target.params.items()})
+    if target.command:
+        inputs["command"] = _digest([" ".join(target.command)])
+    return inputs
+
+
+def stale_reasons(target: Target, inputs: dict, state: State) -> list:
+    """Why a target has to be rebuilt (empty when it is up to date)."""
+    stamp = state.targets.get(target.name)
+    if stamp is None:
+        return ["never built"]
+    old = stamp.get("inputs", {})
+    reasons = [f"changed {k}" for k in sorted(set(old) | set(inputs)) if old.get(k) != inputs.get(k)]
+    for key in stamp.get("outputs", {}):
+        if not (REPO_ROOT / key).exists():
+            reasons.append(f"missing output {key}")
+    return reasons
+
+
+# ----------------------------------------------------------------------
+# Execution
+# ----------------------------------------------------------------------
+
+def run_target(target: Target) -> int:
+    for out in target.outputs:
+        out.parent.mkdir(parents=True, exist_ok=True)
+    if not target.stdout:
+        return subprocess.call(target.command, cwd=REPO_ROOT)
+
+    # Write next to the CSV and only replace it when the content changed, so
+    # an identical result keeps its mtime (and its cached hash)
+    tmp = target.stdout.with_name(target.stdout.name + ".tmp")
+    with tmp.open("wb") as out:
+        rc = subprocess.call(target.command, cwd=REPO_ROOT, stdout=out)
+    if rc != 0:
+        tmp.unlink(missing_ok=True)
+        return rc
+    if target.stdout.exists() and target.stdout.read_bytes() == tmp.read_bytes():
+        tmp.unlink()
+    else:
+        os.replace(tmp, target.stdout)
+    return 0
+
+
+def build(graph: dict, names: list, state: State, jobs: int = 4, dry_run: bool = False,
+          force: bool = False) -> int:
+    order = upstream_closure(graph, names)
+    forced = set(names) if force else set()
+    done, failed = set(), set()
+    pending = list(order)
+    running = {}
+    built, skipped, broken = 0, 0, []
+
+    def finish(target, inputs, rc):
+        nonlocal built
+        if rc == 0:
+            outputs = {_key(p): state.file_hash(p) for p in target.outputs if p.exists()}
+            with state.lock:
+                state.targets[target.name] = {"inputs": inputs, "outputs": outputs}
+            state.save()
+            done.add(target.name)
+            built += 1
+        else:
+            failed.add(target.name)
+            broken.append(target)
+            print(f"[{'warn' if target.optional else 'error'}] {target.name} failed (exit {rc})")
+
+    jobs = max(1, jobs)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            progressed = False
+            for name in list(pending):
+                target = graph[name]
+                if any(d in failed for d in target.deps):
+                    pending.remove(name)
+                    failed.add(name)
+                    print(f"[skip] {name} (upstream failed)")
+                    progressed = True
+                    continue
+                if not all(d in done for d in target.deps):
+                    continue
+
+                inputs = current_inputs(target, graph, state)
+                reasons = ["forced"] if name in forced else stale_reasons(target, inputs, state)
+                if target.command and (reasons or target.always) and not dry_run and len(running) >= jobs:
+                    continue
+                pending.remove(name)
+                progressed = True
+
+                if not target.command:
+                    with state.lock:
+                        state.targets[name] = {"inputs": inputs, "outputs": {}}
+                    done.add(name)
+                    continue
+                if not reasons and not target.always:
+                    done.add(name)
+                    skipped += 1
+                    continue
+                print(f"[{'would build' if dry_run else 'build'}] {name}: {', '.join(reasons) or 'always runs'}")
+                if dry_run:
+                    # Downstream targets are assumed stale from here on
+                    if reasons:
+                        with state.lock:
+                            state.targets.pop(name, None)
+                    done.add(name)
+                    continue
+                running[pool.submit(run_target, target)] = (target, inputs)
+
+            if running:
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    target, inputs = running.pop(future)
+                    try:
+                        rc = future.result()
+                    except OSError as e:
+                        print(f"[error] {target.name}: {e}")
+                        rc = 1
+                    finish(target, inputs, rc)
+            elif not progressed:
+                break
+
+    if not dry_run:
+        state.save()
+    if dry_run:
+        print(f"[info] Stage DAG: {len(done) - skipped} target(s) would run, {skipped} up to date")
+    else:
+        print(f"[info] Stage DAG: {built} built, {skipped} up to date, {len(broken)} failed")
+    return 1 if any(not t.optional for t in broken) else 0
+
+
+def select(graph: dict, patterns) -> list:
+    if not patterns:
+        return list(graph)
+    names = [n for n in graph if any(fnmatch(n, p) for p in patterns)]
+    if not names:
+        raise SystemExit(f"No target matches: {' '.join(patterns)}")
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild only the stale report outputs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="Rebuild stale targets")
+    p_build.add_argument("--jobs", "-j", type=int, default=int(os.environ.get("E2E_DAG_JOBS", "4")))
+    p_build.add_argument("--dry-run", "-n", action="store_true", help="Only print what would be rebuilt")
+    p_build.add_argument("--force", action="store_true", help="Rebuild the selected targets regardless of hashes")
+    p_build.add_argument("patterns", nargs="*")
+
+    p_status = sub.add_parser("status", help="Same as build --dry-run")
+    p_status.add_argument("patterns", nargs="*")
+
+    p_explain = sub.add_parser("explain", help="Show the inputs of a target and why it is stale")
+    p_explain.add_argument("target")
+
+    sub.add_parser("list", help="List targets and their dependencies")
+
+    args = parser.parse_args(argv)
+    graph = build_graph()
+    state = State(state_path())
+
+    if args.command == "list":
+        for name in upstream_closure(graph, list(graph)):
+            deps = graph[name].deps
+            print(name + (f"  <- {', '.join(deps)}" if deps else ""))
+        return 0
+
+    if args.command == "explain":
+        if args.target not in graph:
+            raise SystemExit(f"Unknown target: {args.target}")
+        target = graph[args.target]
+        # Upstream stamps are taken as they are now
+        inputs = current_inputs(target, graph, state)
+        for key, value in sorted(inputs.items()):
+            print(f"  {key} = {value}")
+        reasons = stale_reasons(target, inputs, state)
+        print(f"{target.name}: {'stale (' + ', '.join(reasons) + ')' if reasons else 'up to date'}")
+        return 0
+
+    if args.command == "status":
+        return build(graph, select(graph, args.patterns), state, jobs=1, dry_run=True)
+
+    return build(graph, select(graph, args.patterns), state, jobs=args.jobs,
+                 dry_run=args.dry_run, force=args.force)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
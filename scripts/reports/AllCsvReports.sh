@@ -23,6 +23,13 @@ start_ts="$(date +'%Y-%m-%dT%H:%M:%S%z')"
 echo "AllCsvReports: Started at ${start_ts}"
 echo
 
+# Reports read properties computed by the enrichment stage; a no-op when the
+# graph is already enriched for the current scan
+if [[ "${E2E_SKIP_ENRICH:-false}" != "true" ]]; then
+  "${THIS_DIR}/../enrichment/enrich-graph.sh"
+  echo
+fi
+
 for script in "${BLOCKS[@]}"; do
   name="$(basename "${script}")"
   if [[ -x "${script}" ]]; then
@@ -0,0 +1,79 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Runs AllCsvReports.sh against every shard instance of a sharded scan
+# (scripts/jqa/jqa-run-sharded.sh) concurrently, then merges the per-shard CSVs
+# into CSV_REPORTS_DIRECTORY and recomputes the derived analyses on the merge.
+# Aggregated reports are merged by key and dependencies between shards are
+# reconciled (see merge_shard_csvs.py for what stays per shard).
+
+THIS_DIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" && pwd -P )"
+SCRIPTS_DIR="$( cd "${THIS_DIR}/.." && pwd -P )"
+REPO_ROOT="$( cd "${SCRIPTS_DIR}/.." && pwd -P )"
+CYPHER_DIR="${REPO_ROOT}/cypher"
+
+ROOT_DIR="${ROOT_DIRECTORY:-${REPO_ROOT}}"
+INSTANCES_DIR="${E2E_INSTANCES_DIR:-${ROOT_DIR}/runtime/instances}"
+SHARDS_FILE="${INSTANCES_DIR}/shards.txt"
+OUT_BASE="${CSV_REPORTS_DIRECTORY:?missing CSV_REPORTS_DIRECTORY}"
+
+[[ -s "${SHARDS_FILE}" ]] || { echo "No shards found (${SHARDS_FILE}). Run scripts/jqa/jqa-run-sharded.sh first."; exit 1; }
+
+start_ts="$(date +'%Y-%m-%dT%H:%M:%S%z')"
+echo "ShardedCsvReports: Started at ${start_ts}"
+
+SHARDS=()
+PIDS=()
+while IFS= read -r name; do
+  [[ -n "${name}" ]] || continue
+  dir="${INSTANCES_DIR}/${name}"
+  SHARDS+=("${name}")
+  echo ">> ${name} → ${dir}/csv-reports (log: ${dir}/csv-reports.log)"
+  (
+    # shellcheck disable=SC1090
+    source "${dir}/instance.env"
+    export CSV_REPORTS_DIRECTORY="${dir}/csv-reports"
+    rm -rf "${CSV_REPORTS_DIRECTORY}"
+    mkdir -p "${CSV_REPORTS_DIRECTORY}/Sharding"
+    # Reports read the enriched properties (fanIn, layers...); E2E_SKIP_ENRICH only checks them
+    if [[ "${E2E_SKIP_ENRICH:-false}" == "true" ]]; then
+      "${SCRIPTS_DIR}/enrichment/enrich-graph.sh" --check
+    else
+      "${SCRIPTS_DIR}/enrichment/enrich-graph.sh"
+    fi
+    [[ "${E2E_SKIP_WARMUP:-false}" == "true" ]] || "${SCRIPTS_DIR}/neo4j/neo4j-warmup.sh"
+    "${THIS_DIR}/AllCsvReports.sh"
+
+    # Inputs for the cross-shard dependency reconciliation (merge_shard_csvs.py)
+    source "${SCRIPTS_DIR}/cypher/cypher-helpers.sh"
+    execute_cypher "${CYPHER_DIR}/Sharding/Artifact_Contained_Types.cypher"      > "${CSV_REPORTS_DIRECTORY}/Sharding/Artifact_Contained_Types.csv"
+    execute_cypher "${CYPHER_DIR}/Sharding/Artifact_Unresolved_Types.cypher"     > "${CSV_REPORTS_DIRECTORY}/Sharding/Artifact_Unresolved_Types.csv"
+    execute_cypher "${CYPHER_DIR}/Sharding/Unresolved_Type_Dependencies.cypher"  > "${CSV_REPORTS_DIRECTORY}/Sharding/Unresolved_Type_Dependencies.csv"
+    execute_cypher "${CYPHER_DIR}/Sharding/Package_Dependency_Pairs.cypher"      > "${CSV_REPORTS_DIRECTORY}/Sharding/Package_Dependency_Pairs.csv"
+  ) > "${dir}/csv-reports.log" 2>&1 &
+  PIDS+=($!)
+done < "${SHARDS_FILE}"
+
+failed=0
+for ((i = 0; i < ${#PIDS[@]}; i++)); do
+  if wait "${PIDS[i]}"; then
+    echo "<< ${SHARDS[i]} done"
+  else
+    echo "ERROR: ${SHARDS[i]} reports failed, see ${INSTANCES_DIR}/${SHARDS[i]}/csv-reports.log"
+    failed=1
+  fi
+done
+[[ ${failed} -eq 0 ]] || exit 1
+
+SHARD_CSV_DIRS=()
+for name in "${SHARDS[@]}"; do SHARD_CSV_DIRS+=("${INSTANCES_DIR}/${name}/csv-reports"); done
+
+mkdir -p "${OUT_BASE}"
+python3 "${THIS_DIR}/merge_shard_csvs.py" --out "${OUT_BASE}" --scope "${SCOPE_PACKAGE:-}" "${SHARD_CSV_DIRS[@]}"
+
+# Derived analyses need the merged (cross-shard) dependency graph
+python3 "${REPO_ROOT}/interface/analysis/impact_index.py" --csv-dir "${OUT_BASE}/Dependencies"
+python3 "${REPO_ROOT}/interface/analysis/class_similarity.py" --csv-dir "${OUT_BASE}/Dependencies"
+
+end_ts="$(date +'%Y-%m-%dT%H:%M:%S%z')"
+echo "ShardedCsvReports: Finished at ${end_ts}"
@@ -22,7 +22,13 @@ execute_cypher "${SRC_DIR}/External_Dependencies.cypher"        > "${OUT_DIR}/Ex
 execute_cypher "${SRC_DIR}/External_Dependencies_Used_By_Scoped_Code.cypher" > "${OUT_DIR}/External_Dependencies_Used_By_Scoped_Code.csv"
 execute_cypher "${SRC_DIR}/Lines_Of_Code.cypher"                > "${OUT_DIR}/Lines_Of_Code.csv"
 execute_cypher "${SRC_DIR}/Modules_And_Artifacts.cypher"        > "${OUT_DIR}/Modules_And_Artifacts.csv"
+execute_cypher "${SRC_DIR}/Package_Coupling_Metrics.cypher"     > "${OUT_DIR}/Package_Coupling_Metrics.csv"
 execute_cypher "${SRC_DIR}/Package_Dependencies.cypher"         > "${OUT_DIR}/Package_Dependencies.csv"
 execute_cypher "${SRC_DIR}/Package_Dependencies_Classes.cypher" > "${OUT_DIR}/Package_Dependencies_Classes.csv"
 
+# Derived from the CSVs above: transitive impact ("blast radius") index
+python3 "${REPO_ROOT}/interface/analysis/impact_index.py" --csv-dir "${OUT_DIR}"
+# Derived: dependency-similarity clusters of classes (service extraction candidates)
+python3 "${REPO_ROOT}/interface/analysis/class_similarity.py" --csv-dir "${OUT_DIR}"
+
 echo "DependenciesCsv: Done → ${OUT_DIR}"
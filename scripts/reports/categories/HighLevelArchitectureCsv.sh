@@ -18,12 +18,12 @@ mkdir -p "${OUT_DIR}"
 echo "HighLevelArchitectureCsv: $(date +'%Y-%m-%dT%H:%M:%S%z') Running…"
 
 execute_cypher "${SRC_DIR}/Architectural_Layer_Violation.cypher" > "${OUT_DIR}/Architectural_Layer_Violation.csv"
-execute_cypher "${SRC_DIR}/Cyclomatic_Complexity.cypher"        > "${OUT_DIR}/Cyclomatic_Complexity.csv"
+execute_cypher "${SRC_DIR}/Cyclomatic_Complexity.cypher" minComplexity=10 > "${OUT_DIR}/Cyclomatic_Complexity.csv"
 execute_cypher "${SRC_DIR}/Deepest_Inheritance.cypher"          > "${OUT_DIR}/Deepest_Inheritance.csv"
-execute_cypher "${SRC_DIR}/Excessive_Dependencies.cypher"       > "${OUT_DIR}/Excessive_Dependencies.csv"
+execute_cypher "${SRC_DIR}/Excessive_Dependencies.cypher" minDependencies=15 > "${OUT_DIR}/Excessive_Dependencies.csv"
 execute_cypher "${SRC_DIR}/General_Count_Overview.cypher"       > "${OUT_DIR}/General_Count_Overview.csv"
-execute_cypher "${SRC_DIR}/God_Classes.cypher"                  > "${OUT_DIR}/God_Classes.csv"
-execute_cypher "${SRC_DIR}/Highest_Number_Methods_Class.cypher" > "${OUT_DIR}/Highest_Number_Methods_Class.csv"
+execute_cypher "${SRC_DIR}/God_Classes.cypher" minMethodCount=20 > "${OUT_DIR}/God_Classes.csv"
+execute_cypher "${SRC_DIR}/Highest_Number_Methods_Class.cypher" minMethodCount=15 > "${OUT_DIR}/Highest_Number_Methods_Class.csv"
 execute_cypher "${SRC_DIR}/Inheritance_Between_Classes.cypher"  > "${OUT_DIR}/Inheritance_Between_Classes.csv"
 execute_cypher "${SRC_DIR}/Package_Structure.cypher"            > "${OUT_DIR}/Package_Structure.csv"
 
@@ -0,0 +1,400 @@
+"""Merge the per-shard CSV reports of a sharded scan into one report tree.
+
+Every Cypher-generated CSV (the ones ending with the "Source Cypher File"
+column) found under any shard is merged, keeping one header. Derived CSVs
+(written by the Python analyses, without that column) are skipped; they are
+recomputed on the merged tree afterwards.
+
+Row-per-entity reports are concatenated, dropping duplicate rows. Reports
+that aggregate or cap their rows follow MERGE_RULES instead: rows are grouped
+by the report's key, counts are summed (or the largest kept), and the query's
+ORDER BY and LIMIT are applied again to the merged rows.
+
+Dependencies that cross shards cannot be seen by any single shard: there the
+target is a required type that no artifact of the shard provides. They are
+matched against Sharding/Artifact_Contained_Types.csv of the other shards:
+  - Sharding/Artifact_Unresolved_Types.csv adds the artifact dependencies to
+    Dependencies/Modules_And_Artifacts.csv;
+  - Sharding/Unresolved_Type_Dependencies.csv adds the class dependencies to
+    Dependencies/Package_Dependencies_Classes.csv and the package
+    dependencies to Dependencies/Package_Dependencies.csv;
+  - the afferent/efferent coupling of Dependencies/Package_Coupling_Metrics.csv
+    is recomputed from Sharding/Package_Dependency_Pairs.csv of every shard
+    plus the cross-shard package dependencies.
+
+Still per shard: reports that follow other relationships across artifacts
+(circular package dependencies, inheritance depth, layer violations) only see
+the part inside each shard, and "Packages found" in General_Count_Overview
+counts a package split over several shards once per shard.
+
+Usage:
+  python scripts/reports/merge_shard_csvs.py --out reports/csv-reports [--scope PACKAGE] SHARD_CSV_DIR [SHARD_CSV_DIR ...]
+"""
+import argparse
+import csv
+from pathlib import Path
+import sys
+
+SOURCE_COLUMN_PREFIX = "Source Cypher File"
+SHARDING_DIR = "Sharding"
+ARTIFACTS_CSV = Path("Dependencies") / "Modules_And_Artifacts.csv"
+ARTIFACT_COLUMNS = ["Artifact_Name", "Artifact_Type", "Artifact_Version", "Artifact_Group"]
+PACKAGE_DEPENDENCIES_CSV = Path("Dependencies") / "Package_Dependencies.csv"
+CLASS_DEPENDENCIES_CSV = Path("Dependencies") / "Package_Dependencies_Classes.csv"
+COUPLING_CSV = Path("Dependencies") / "Package_Coupling_Metrics.csv"
+
+
+def _number(value):
+    """CSV cell as int or float; 0 for empty or non-numeric cells."""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return 0
+
+
+def _descending(column):
+    return lambda row: -_number(row[column])
+
+
+# Reports whose rows cannot simply be concatenated, by path relative to the CSV root:
+#   key    columns identifying a row; the first shard's row wins for the other columns
+#   sum    counts added up over the shards (within a shard the largest is kept:
+#          an unresolved copy of a type may repeat its key)
+#   max    values kept at their largest (the same entity scanned in two shards)
+#   order  sort key re-applying the query's ORDER BY to the merged rows
+#   limit  the query's LIMIT, applied again after sorting
+MERGE_RULES = {
+    Path("High_Level_Architecture") / "General_Count_Overview.csv": {"key": ["Info"], "sum": ["Count"]},
+    Path("Technology_Stack") / "Java_Version.csv": {"key": [], "limit": 1},
+    Path("Technology_Stack") / "Build_System.csv": {"key": ["BuildSystem"]},
+    PACKAGE_DEPENDENCIES_CSV: {
+        "key": ["originPackage", "destinationPackage"], "sum": ["typesThatDepend", "totalDependencies"],
+        "order": _descending("totalDependencies"),
+    },
+    CLASS_DEPENDENCIES_CSV: {
+        "key": ["Class_1_fqn", "Class_2_fqn"], "max": ["dependencyWeight"],
+        "order": lambda row: (row["Class_1_fqn"], row["Class_2_fqn"]),
+    },
+    Path("Dependencies") / "Circular_Dependencies.csv": {
+        "key": ["package1", "package2"],
+        "order": lambda row: -(_number(row["totalDepsP1toP2"]) + _number(row["totalDepsP2toP1"])),
+        "limit": 50,
+    },
+    # afferent/efferent coupling and the ratios are recomputed by reconcile_coupling()
+    COUPLING_CSV: {
+        "key": ["package"], "sum": ["types", "abstractTypes"],
+        "order": lambda row: (-_number(row["distance"]), row["package"]),
+    },
+    Path("Fan_In_Fan_Out") / "Fan_In.csv": {"key": ["type"], "sum": ["fanIn"], "order": _descending("fanIn")},
+    Path("Fan_In_Fan_Out") / "Fan_Out.csv": {"key": ["type"], "max": ["fanOut"], "order": _descending("fanOut")},
+}
+
+
+def _read_rows(path: Path):
+    """(header, rows) of a CSV; empty header for empty files."""
+    with path.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        return header, list(reader)
+
+
+def _is_cypher_report(header) -> bool:
+    return bool(header) and header[-1].startswith(SOURCE_COLUMN_PREFIX)
+
+
+def _write_rows(path: Path, header, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _add(a: str, b: str, combine) -> str:
+    return str(combine(_number(a), _number(b)))
+
+
+def apply_rule(rule: dict, header, shard_rows) -> list:
+    """Rows of one report merged over the shards (one row list per shard) by a MERGE_RULES entry."""
+    idx = {c: i for i, c in enumerate(header)}
+    key_idx = [idx[c] for c in rule["key"]]
+    sum_idx = [idx[c] for c in rule.get("sum", [])]
+    max_idx = [idx[c] for c in rule.get("max", [])]
+
+    merged = {}
+    for rows in shard_rows:
+        local = {}
+        for row in rows:
+            key = tuple(row[i] for i in key_idx)
+            if key not in local:
+                local[key] = list(row)
+                continue
+            for i in sum_idx + max_idx:
+                local[key][i] = _add(local[key][i], row[i], max)
+        for key, row in local.items():
+            if key not in merged:
+                merged[key] = row
+                continue
+            for i in sum_idx:
+                merged[key][i] = _add(merged[key][i], row[i], lambda a, b: a + b)
+            for i in max_idx:
+                merged[key][i] = _add(merged[key][i], row[i], max)
+
+    rows = list(merged.values())
+    if "order" in rule:
+        rows.sort(key=lambda r: rule["order"](dict(zip(header, r))))
+    return rows[:rule["limit"]] if "limit" in rule else rows
+
+
+def merge_reports(shard_dirs, out_dir: Path) -> list:
+    """Merge same-named Cypher CSVs of all shards. Returns merged relative paths."""
+    relative_paths = sorted({
+        p.relative_to(d)
+        for d in shard_dirs
+        for p in d.rglob("*.csv")
+        if p.relative_to(d).parts[0] != SHARDING_DIR
+    })
+
+    merged = []
+    for rel in relative_paths:
+        header, shard_rows = None, []
+        for d in shard_dirs:
+            path = d / rel
+            if not path.is_file():
+                continue
+            shard_header, rows = _read_rows(path)
+            if not shard_header:
+                continue
+            if header is None:
+                if not _is_cypher_report(shard_header):
+                    break
+                header = shard_header
+            elif shard_header != header:
+                print(f"[warn] {rel}: header differs in {d}, shard skipped", file=sys.stderr)
+                continue
+            shard_rows.append(rows)
+
+        if header is None:
+            continue
+        rule = MERGE_RULES.get(rel)
+        if rule and all(c in header for c in rule["key"] + rule.get("sum", []) + rule.get("max", [])):
+            rows = apply_rule(rule, header, shard_rows)
+        else:
+            rows = list(dict.fromkeys(tuple(r) for rows in shard_rows for r in rows))
+        _write_rows(out_dir / rel, header, rows)
+        merged.append(rel)
+    return merged
+
+
+def _read_artifact_types(path: Path) -> list:
+    """(artifact tuple, fqn) pairs of a Sharding CSV."""
+    if not path.is_file():
+        return []
+    header, rows = _read_rows(path)
+    if not header:
+        return []
+    idx = {c: i for i, c in enumerate(header)}
+    if not all(c in idx for c in ARTIFACT_COLUMNS + ["fqn"]):
+        return []
+    return [(tuple(r[idx[c]] for c in ARTIFACT_COLUMNS), r[idx["fqn"]]) for r in rows]
+
+
+def cross_shard_artifact_edges(shard_dirs) -> list:
+    """Artifact → artifact edges whose target type lives in another shard."""
+    providers = {}  # fqn -> {(shard, artifact)}
+    for s, d in enumerate(shard_dirs):
+        for artifact, fqn in _read_artifact_types(d / SHARDING_DIR / "Artifact_Contained_Types.csv"):
+            providers.setdefault(fqn, set()).add((s, artifact))
+
+    edges = set()
+    for s, d in enumerate(shard_dirs):
+        for artifact, fqn in _read_artifact_types(d / SHARDING_DIR / "Artifact_Unresolved_Types.csv"):
+            for other_shard, provider in providers.get(fqn, ()):
+                if other_shard != s and provider != artifact:
+                    edges.add((artifact, provider))
+    return sorted(edges)
+
+
+def append_artifact_edges(out_dir: Path, edges) -> int:
+    """Append reconciled edges to the merged Modules_And_Artifacts.csv. Returns rows added."""
+    path = out_dir / ARTIFACTS_CSV
+    if not edges or not path.is_file():
+        return 0
+    header, rows = _read_rows(path)
+    if not _is_cypher_report(header):
+        return 0
+
+    existing = {tuple(r[:8]) for r in rows}
+    added = []
+    for a1, a2 in edges:
+        key = a1 + a2
+        if key not in existing:
+            existing.add(key)
+            added.append(list(key) + [""] * (len(header) - len(key)))
+
+    rows = sorted(rows + added, key=lambda r: (r[3], r[0], r[7], r[4]))
+    _write_rows(path, header, rows)
+    return len(added)
+
+
+def _read_columns(path: Path, columns) -> list:
+    """Tuples of the given columns of a Sharding CSV; empty when missing or lacking a column."""
+    if not path.is_file():
+        return []
+    header, rows = _read_rows(path)
+    idx = {c: i for i, c in enumerate(header)}
+    if not all(c in idx for c in columns):
+        return []
+    return [tuple(r[idx[c]] for c in columns) for r in rows]
+
+
+def package_of(fqn: str) -> str:
+    """Package of a type FQN (nested types belong to the package of their outer type)."""
+    return fqn.split("$", 1)[0].rpartition(".")[0]
+
+
+def cross_shard_type_edges(shard_dirs) -> list:
+    """(originPackage, type, type is a class, weight, target, target is a class) of the
+    type dependencies whose target lives in another shard."""
+    providers = {}  # fqn -> {shard: is a class}
+    for s, d in enumerate(shard_dirs):
+        for fqn, is_class in _read_columns(d / SHARDING_DIR / "Artifact_Contained_Types.csv", ["fqn", "Is_Class"]):
+            shards = providers.setdefault(fqn, {})
+            shards[s] = shards.get(s, False) or is_class == "true"
+
+    edges = {}
+    columns = ["originPackage", "Type_1_fqn", "Type_1_Is_Class", "dependencyWeight", "Type_2_fqn"]
+    for s, d in enumerate(shard_dirs):
+        for p1, t1, is_class, weight, t2 in _read_columns(d / SHARDING_DIR / "Unresolved_Type_Dependencies.csv", columns):
+            targets = [c for shard, c in providers.get(t2, {}).items() if shard != s]
+            if targets:
+                edges[(t1, t2)] = (p1, t1, is_class == "true", weight, t2, any(targets))
+    return [edges[k] for k in sorted(edges)]
+
+
+def _update_report(out_dir: Path, rel: Path, update) -> bool:
+    """Rewrite a merged report with update(header, rows) -> rows, sorted again by its MERGE_RULES order."""
+    path = out_dir / rel
+    if not path.is_file():
+        return False
+    header, rows = _read_rows(path)
+    if not _is_cypher_report(header):
+        return False
+    rows = update(header, rows)
+    order = MERGE_RULES[rel].get("order")
+    if order:
+        rows.sort(key=lambda r: order(dict(zip(header, r))))
+    _write_rows(path, header, rows)
+    return True
+
+
+def append_type_edges(out_dir: Path, edges, scope: str = "") -> tuple:
+    """Add the cross-shard dependencies to the merged class and package dependency reports
+    (scoped like their queries: by the depending class or package). Returns (classes, packages) added."""
+    def in_scope(fqn):
+        return not scope or fqn.startswith(scope)
+
+    class_rows = {(t1, t2): w for p1, t1, c1, w, t2, c2 in edges if c1 and c2 and in_scope(t1)}
+    packages = {}  # (origin, destination) -> [depending types, type dependencies]
+    for p1, t1, _, _, t2, _ in edges:
+        p2 = package_of(t2)
+        if p1 != p2 and in_scope(p1):
+            counts = packages.setdefault((p1, p2), [set(), 0])
+            counts[0].add(t1)
+            counts[1] += 1
+
+    added = {"classes": 0, "packages": 0}
+
+    def add_classes(header, rows):
+        idx = {c: i for i, c in enumerate(header)}
+        existing = {(r[idx["Class_1_fqn"]], r[idx["Class_2_fqn"]]) for r in rows}
+        for (t1, t2), weight in class_rows.items():
+            if (t1, t2) not in existing:
+                values = {"Class_1_fqn": t1, "dependencyWeight": weight, "Class_2_fqn": t2}
+                rows.append([values.get(c, "") for c in header])
+                added["classes"] += 1
+        return rows
+
+    def add_packages(header, rows):
+        idx = {c: i for i, c in enumerate(header)}
+        by_pair = {(r[idx["originPackage"]], r[idx["destinationPackage"]]): r for r in rows}
+        for (p1, p2), (types, total) in packages.items():
+            row = by_pair.get((p1, p2))
+            if row is None:
+                row = [""] * len(header)
+                row[idx["originPackage"]], row[idx["destinationPackage"]] = p1, p2
+                rows.append(row)
+                added["packages"] += 1
+            row[idx["typesThatDepend"]] = str(_number(row[idx["typesThatDepend"]]) + len(types))
+            row[idx["totalDependencies"]] = str(_number(row[idx["totalDependencies"]]) + total)
+        return rows
+
+    if class_rows:
+        _update_report(out_dir, CLASS_DEPENDENCIES_CSV, add_classes)
+    if packages:
+        _update_report(out_dir, PACKAGE_DEPENDENCIES_CSV, add_packages)
+    return added["classes"], added["packages"]
+
+
+def reconcile_coupling(shard_dirs, out_dir: Path, edges) -> bool:
+    """Recompute Ca, Ce, instability and distance of the merged Package_Coupling_Metrics.csv
+    over the package dependencies of all shards (in and out of scope)."""
+    pair_files = [d / SHARDING_DIR / "Package_Dependency_Pairs.csv" for d in shard_dirs]
+    if not all(f.is_file() for f in pair_files):
+        print("[warn] Package_Dependency_Pairs.csv missing in a shard: coupling metrics left per shard",
+              file=sys.stderr)
+        return False
+    pairs = {pair for f in pair_files for pair in _read_columns(f, ["originPackage", "destinationPackage"])}
+    pairs |= {(p1, package_of(t2)) for p1, _, _, _, t2, _ in edges}
+
+    afferent, efferent = {}, {}
+    for p1, p2 in pairs:
+        if p1 != p2:
+            afferent.setdefault(p2, set()).add(p1)
+            efferent.setdefault(p1, set()).add(p2)
+
+    def recompute(header, rows):
+        idx = {c: i for i, c in enumerate(header)}
+        for row in rows:
+            package = row[idx["package"]]
+            ca, ce = len(afferent.get(package, ())), len(efferent.get(package, ()))
+            types, abstract_types = _number(row[idx["types"]]), _number(row[idx["abstractTypes"]])
+            instability = ce / (ca + ce) if ca + ce else 0.0
+            abstractness = abstract_types / types if types else 0.0
+            row[idx["afferentCoupling"]], row[idx["efferentCoupling"]] = str(ca), str(ce)
+            row[idx["instability"]] = str(round(instability, 3))
+            row[idx["abstractness"]] = str(round(abstractness, 3))
+            row[idx["distance"]] = str(round(abs(abstractness + instability - 1), 3))
+        return rows
+
+    return _update_report(out_dir, COUPLING_CSV, recompute)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge per-shard CSV reports.")
+    parser.add_argument("--out", required=True, type=Path, help="Merged CSV reports directory")
+    parser.add_argument("--scope", default="", help="Scope package the reports ran with (SCOPE_PACKAGE)")
+    parser.add_argument("shards", nargs="+", type=Path, help="CSV reports directory of each shard")
+    args = parser.parse_args(argv)
+
+    shard_dirs = [d for d in args.shards if d.is_dir()]
+    if not shard_dirs:
+        print("[error] No shard CSV directories found.", file=sys.stderr)
+        return 1
+
+    scope = args.scope if args.scope.strip() else ""
+    merged = merge_reports(shard_dirs, args.out)
+    added = append_artifact_edges(args.out, cross_shard_artifact_edges(shard_dirs))
+    type_edges = cross_shard_type_edges(shard_dirs)
+    classes, packages = append_type_edges(args.out, type_edges, scope)
+    reconcile_coupling(shard_dirs, args.out, type_edges)
+    print(f"[info] Merged {len(merged)} reports from {len(shard_dirs)} shards → {args.out} "
+          f"(cross-shard dependencies added: {added} artifact, {packages} package, {classes} class)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())